@@ -1,4 +1,5 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 import matplotlib.pyplot as plt
@@ -12,12 +13,25 @@ from matplotlib.colors import LinearSegmentedColormap, ListedColormap, BoundaryN
 from matplotlib.path import Path
 from plotly.subplots import make_subplots
 from plotnine import ggplot, aes, geom_jitter, scale_color_manual, theme, labs, theme_bw
+from lineup_comparisons import LeagueDeltaComparator, OFF_COLS, DEF_COLS
+from shot_index import ShotIndex, X_EDGES, Y_EDGES
+from feature_store import FeatureStore
+from rating_models import load_rating_models
+from profiler_webapp.submodules.pp_http import get_session
+from asset_cache import AssetCache
+from zone_summaries import ZoneSummaries
+
+@st.cache_resource
+def load_feature_tables():
+    """Memory-maps one consistent version of the player & lineup feature tables (see feature_store.py)."""
+    return FeatureStore().snapshot(['player_features', 'clusters', 'lineup_train', 'lineup_agg'])
+
+feature_tables = load_feature_tables()
+player_features, clusters, lineup_train = feature_tables['player_features'], feature_tables['clusters'], feature_tables['lineup_train']
 
 raw_player_df = pd.read_csv('raw_comprehensive_stats.csv')
-cln_player_df = pd.read_csv('cln_comprehensive_stats.csv')
+cln_player_df = player_features.labels
 lineup_df = pd.read_csv('cln_lineup_stats.csv')
-train_df = pd.read_csv('cln_train.csv')
-cls_df = pd.read_csv('cln_clusters.csv', index_col='PLAYER')
 
 st.set_page_config(layout="wide")
 
@@ -34,7 +48,12 @@ p3 = st.sidebar.selectbox('Small-Forward:', cln_player_df[cln_player_df.POS.str.
 p4 = st.sidebar.selectbox('Power-Forward:', cln_player_df[cln_player_df.POS.str.contains('F')].PLAYER)
 p5 = st.sidebar.selectbox('Center:', cln_player_df[cln_player_df.POS.isin(['C', 'F-C', 'F'])].PLAYER)
     
-test_record = pd.DataFrame(cls_df.loc[[p1, p2, p3, p4, p5]].values.sum(axis=0).reshape(1, 15), columns=cls_df.columns)
+try:
+    lineup_clusters = clusters.row_block([p1, p2, p3, p4, p5])
+except KeyError as e:  # Players missing from the clusters table can't be evaluated
+    st.error(f'Cannot evaluate this lineup: {e.args[0]}')
+    st.stop()
+test_record = pd.DataFrame(lineup_clusters.sum(axis=0).reshape(1, -1), columns=clusters.columns)
 
 raw_test_df = raw_player_df[raw_player_df.PLAYER.isin([p1, p2, p3, p4, p5])]
 cln_test_df = cln_player_df[raw_player_df.PLAYER.isin([p1, p2, p3, p4, p5])]
@@ -48,36 +67,51 @@ c1, c2, c3, c4, c5 = st.columns((1, 1, 1, 1, 1))
 
 
 base_url = 'https://ak-static.cms.nba.com/wp-content/uploads/headshots/nba/latest/260x190/'
-player_id_df = pd.read_csv('id.csv')
+
+@st.cache_resource
+def load_player_ids():
+    """Maps player names to nba.com ids once (instead of scanning the id table for every lineup slot)."""
+    player_id_df = pd.read_csv('id.csv')
+    return dict(zip(player_id_df.name, player_id_df.player_id))
+
+@st.cache_resource
+def load_asset_cache():
+    """Opens the local store of pre-decoded headshots (see asset_cache.py), downloading over the shared keep-alive pool."""
+    return AssetCache(session=get_session())
+
+player_ids = load_player_ids()
+asset_cache = load_asset_cache()
 players = [p1, p2, p3, p4, p5]
 cols = [c1, c2, c3, c4, c5]
+ids = [player_ids[player] for player in players]
 
-ids = []
-for i in range(5):
-    ids.append(player_id_df[player_id_df.name == players[i]]['player_id'].values[0])
-# ids = player_id_df[player_id_df.name.isin([p1, p2, p3, p4, p5])]['player_id'].values.tolist()
-
-for i in range(5):
-    url = base_url + str(ids[i]) + '.png'
-    cols[i].image(url)
+for col, player_id in zip(cols, ids):
+    headshot = asset_cache.ensure('headshot', player_id)
+    col.image(headshot if headshot is not None else base_url + str(player_id) + '.png')  # Remote URL if not cacheable
 
 
 ####################
 
 c1, c2, c3, c4 = st.columns((1, 1, 1, 3))
 
-X = train_df[cls_df.columns]
-y1 = train_df.OffRtg
-y2 = train_df.DefRtg
-train_df['plus_rtg'] = train_df.NetRtg.map(lambda x: 0 if x < 0 else 1)
-y3 = train_df.plus_rtg
+X = pd.DataFrame(lineup_train.column_block(clusters.columns), columns=clusters.columns)
+y1 = lineup_train.column('OffRtg')
+y2 = lineup_train.column('DefRtg')
+y3 = (lineup_train.column('NetRtg') >= 0).astype(int)
 
 
-clf = RandomForestRegressor(random_state=42, n_estimators=25, max_depth=10)
-clf.fit(X, y1)
-o_pred = round(clf.predict(test_record)[0], 1)
-clf.fit(X, y2)
-d_pred = round(clf.predict(test_record)[0], 1)
+@st.cache_resource
+def load_lineup_models():
+    """Loads the cross-validated rating models exported by rating_models.py, falling back to fixed-hyperparameter forests."""
+    try:
+        return load_rating_models(names=['off', 'def'])
+    except FileNotFoundError:
+        return {name: RandomForestRegressor(random_state=42, n_estimators=25, max_depth=10).fit(X, y)
+                for name, y in [('off', y1), ('def', y2)]}
+
+rating_models = load_lineup_models()
+o_pred = round(rating_models['off'].predict(test_record)[0], 1)
+d_pred = round(rating_models['def'].predict(test_record)[0], 1)
 net_pred = round(o_pred - d_pred, 1)
 if net_pred > 0:
     net_pred = '+' + str(net_pred)
@@ -104,27 +138,18 @@ c3.metric('Estimated Net Rating', net_pred)
 
 c1, c2 = st.columns((1, 1))
 
-ldf = pd.read_csv('lineup_agg_stats.csv')
-pdf = pd.read_csv('cln_comprehensive_stats.csv')
-cols = ['%RA_FGA', '%PT_nonRA_FGA', '%MR_FGA', '%cns_2FGA', '%pullup_2FGA', '%Corner3_FGA', '%ATB3_FGA', '%cns_3PA', '%pullup_3PA', '%trsn_FGA', 
-        '%iso_FGA', '%pnrbh_FGA', '%pnrrm_FGA', '%postup_FGA', '%spotup_FGA', '%handoff_FGA', '%cuts_FGA', '%offscrn_FGA', '%putbk_FGA']
+@st.cache_resource
+def load_delta_comparator():
+    """Precomputes the league-average vector & player-feature matrix once per server process."""
+    return LeagueDeltaComparator(feature_tables['lineup_agg'].to_frame(OFF_COLS + DEF_COLS),
+                                 player_features.to_frame(OFF_COLS + DEF_COLS))
 
-comp_df = pd.DataFrame(ldf[cols].mean(), columns=['league_avg'])
-comp_df['plyr_avg'] = pd.Series(pdf[pdf.PLAYER.isin([p1, p2, p3, p4, p5])][cols].mean())
-comp_df['delta'] = round((comp_df.plyr_avg - comp_df.league_avg) / comp_df.league_avg * 100, 1)
-comp_df['-'] = [0 for i in range(len(comp_df))]
-comp_df['--'] = [0 for i in range(len(comp_df))]
+deltas = load_delta_comparator().lineup_deltas([p1, p2, p3, p4, p5])
 
+comp_df = pd.DataFrame({'-': 0.0, '--': 0.0, 'delta': deltas[OFF_COLS]})
 c1.bar_chart(comp_df[['-', '--', 'delta']])
 
-cols = ['Opp2P%', 'opp_RA_FG%', 'opp_PT_nonRA_FG%', 'opp_MR_FG%', 'Opp3P%', 'opp_Corner3_FG%', 'opp_ATB3_FG%', 'opp_iso_FG%',
-        'opp_pnrbh_FG%', 'opp_pnrrm_FG%', 'opp_postup_FG%', 'opp_spotup_FG%', 'opp_handoff_FG%', 'opp_offscrn_FG%']
-comp_df = pd.DataFrame(ldf[cols].mean(), columns=['league_avg'])
-comp_df['plyr_avg'] = pd.Series(pdf[pdf.PLAYER.isin([p1, p2, p3, p4, p5])][cols].mean())
-comp_df['delta'] = round((comp_df.plyr_avg - comp_df.league_avg) / comp_df.league_avg * 100, 1)
-comp_df['-'] = [0 for i in range(len(comp_df))]
-comp_df['--'] = [0 for i in range(len(comp_df))]
-
+comp_df = pd.DataFrame({'delta': deltas[DEF_COLS]})
 c1.bar_chart(comp_df[['delta']])
 
 
@@ -132,8 +157,12 @@ c1.bar_chart(comp_df[['delta']])
 
 ## SHOT CHART FOR INPUT LINEUP
 
-shot_profiles_df = pd.read_csv('shot_profiles.csv')
-filtered_shots = shot_profiles_df[shot_profiles_df.PLAYER_NAME.isin([p1, p2, p3, p4, p5])]
+@st.cache_resource
+def load_shot_index():
+    """Loads the pre-binned player shot index once per server process (see shot_index.py)."""
+    return ShotIndex.load_or_build()
+
+lineup_shots = load_shot_index().lineup_histogram([p1, p2, p3, p4, p5])
 
 
 def plot_halfcourt(ax, ver):
@@ -178,7 +207,7 @@ def plot_halfcourt(ax, ver):
 
 fig, ax = plt.subplots(1, 1, figsize=(10, 8))
 
-ax.hexbin(filtered_shots['LOC_X'], filtered_shots['LOC_Y']+60, gridsize=(100, 100), bins='log', cmap='seismic')  
+ax.pcolormesh(X_EDGES, Y_EDGES + 60, np.log10(lineup_shots.T + 1), cmap='seismic')
 ax = plot_halfcourt(ax, 1)
 c2.pyplot(fig)
 
@@ -186,6 +215,24 @@ plt.tight_layout()
 plt.show()
 
 
+#######################################
+
+## SHOT ZONES FOR INPUT LINEUP
+
+@st.cache_resource
+def load_zone_summaries():
+    """Opens the materialized per-player zone tables, rebuilding seasons re-archived since the last run (see zone_summaries.py)."""
+    zone_summaries = ZoneSummaries()
+    zone_summaries.refresh()
+    return zone_summaries
+
+zone_summaries = load_zone_summaries()
+if zone_summaries.seasons():
+    zone_season = zone_summaries.seasons()[-1]
+    st.subheader(f'Lineup Shot Zones vs League ({zone_season})')
+    st.dataframe(zone_summaries.zone_table(ids, [zone_season]), hide_index=True)
+
+
 #######################################
 
 # IN COMMAND LINE, NAVIGATE TO PROJECT DIRECTORY AND EXECUTE:
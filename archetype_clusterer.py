@@ -0,0 +1,177 @@
+import argparse
+import logging
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.metrics import silhouette_score
+from feature_store import FeatureStore, FEATURE_STORE_DIR
+
+# Defining the paths for the cleaned player statistics, the archetype one-hots & the persisted archetype model
+PLAYER_STATS_PATH = './cln_comprehensive_stats.csv'
+CLUSTERS_PATH = './cln_clusters.csv'
+MODEL_PATH = './archetype_model.npz'
+
+# Position designations mapped to the position-group prefixes of the archetype columns (i.e. g_cls_1); pure centers
+# aren't part of any group, matching the lineup training data
+POSITION_GROUPS = {'G': 'g', 'G-F': 'w', 'F': 'f', 'F-C': 'b'}
+GROUP_CLUSTERS = {'g': 4, 'w': 4, 'f': 4, 'b': 3}
+
+# Player utility columns preceding the statistical features in the cleaned dataset
+UTIL_COLS = ['PLAYER', 'H', 'POS', 'TEAM', 'GP', 'MIN', 'POSS']
+
+# Clustering settings (fixed seed so clusters are reproducible across runs)
+SEED = 42
+K_RANGE = range(2, 9)
+SILHOUETTE_SAMPLE_SIZE = 1000
+N_JOBS = -1
+
+class ArchetypeModel:
+    """Per-position-group standardization & k-means centroids, used to assign players to archetypes without refitting."""
+
+    def __init__(self, feature_cols, groups):
+        """Instantiates the model from feature names and a {group prefix: (mean, scale, centroids)} dict."""
+        self.feature_cols = list(feature_cols)
+        self.groups = groups
+
+    @classmethod
+    def fit(cls, player_df, n_clusters=GROUP_CLUSTERS, feature_cols=None, seed=SEED):
+        """Fits a mini-batch k-means model for each position group over the standardized player features."""
+
+        feature_cols = feature_cols if feature_cols is not None else [col for col in player_df.columns if col not in UTIL_COLS]
+        groups = {}
+        for prefix, X in group_features(player_df, feature_cols).items():
+            mean, scale = np.nanmean(X, axis=0), np.nanstd(X, axis=0)
+            scale[~(scale > 0)] = 1.0  # Constant features don't influence the distances
+            Z = standardize(X, mean, scale)
+
+            kmeans = MiniBatchKMeans(n_clusters=n_clusters[prefix], random_state=seed, n_init=10,
+                                     batch_size=min(1024, len(Z))).fit(Z)
+            groups[prefix] = (mean, scale, kmeans.cluster_centers_)
+            logging.info(f'LOG: Fit {n_clusters[prefix]} [{prefix}] archetypes over {len(Z)} players.')
+
+        return cls(feature_cols, groups)
+
+    @classmethod
+    def load(cls, path=MODEL_PATH):
+        """Loads a persisted model (feature names, plus each group's scaler & centroids) from an npz archive."""
+        with np.load(path, allow_pickle=False) as archive:
+            groups = {prefix: (archive[f'{prefix}_mean'], archive[f'{prefix}_scale'], archive[f'{prefix}_centroids'])
+                      for prefix in archive['group_prefixes']}
+            return cls(archive['feature_cols'].tolist(), groups)
+
+    def save(self, path=MODEL_PATH):
+        arrays = {'feature_cols': np.array(self.feature_cols), 'group_prefixes': np.array(list(self.groups))}
+        for prefix, (mean, scale, centroids) in self.groups.items():
+            arrays.update({f'{prefix}_mean': mean, f'{prefix}_scale': scale, f'{prefix}_centroids': centroids})
+        np.savez(path, **arrays)
+
+    def assign(self, player_df):
+        """Returns each player's archetype as (group prefix, 0-based cluster), comparing only against its group's k centroids."""
+
+        prefixes = player_df['POS'].map(POSITION_GROUPS)
+        labels = pd.Series(-1, index=player_df.index, dtype='int64')
+        for prefix, X in group_features(player_df, self.feature_cols).items():
+            mean, scale, centroids = self.groups[prefix]
+            Z = standardize(X, mean, scale)
+            distances = (Z ** 2).sum(axis=1)[:, None] - 2 * Z @ centroids.T + (centroids ** 2).sum(axis=1)[None, :]
+            labels[prefixes == prefix] = distances.argmin(axis=1)
+
+        return pd.DataFrame({'PLAYER': player_df['PLAYER'], 'GROUP': prefixes, 'CLUSTER': labels})
+
+    def one_hot(self, player_df):
+        """Returns the archetype one-hot table in the cln_clusters.csv layout (i.e. g_cls_1 ... b_cls_3)."""
+
+        # Players are listed group by group (guards first), as in the lineup training data
+        assigned = self.assign(player_df).dropna(subset=['GROUP'])
+        assigned = assigned.iloc[np.argsort(pd.Index(list(self.groups)).get_indexer(assigned['GROUP']), kind='stable')]
+        cls_cols = [f'{prefix}_cls_{i + 1}' for prefix, (_, _, centroids) in self.groups.items() for i in range(len(centroids))]
+        labels = assigned['GROUP'] + '_cls_' + (assigned['CLUSTER'] + 1).astype(str)
+
+        one_hot = np.zeros((len(assigned), len(cls_cols)), dtype='int64')
+        one_hot[np.arange(len(assigned)), pd.Index(cls_cols).get_indexer(labels)] = 1
+        one_hot_df = pd.DataFrame(one_hot, columns=cls_cols)
+        one_hot_df.insert(0, 'PLAYER', assigned['PLAYER'].values)
+        return one_hot_df
+
+def group_features(player_df, feature_cols):
+    """Splits the feature matrix into a {group prefix: (player x feature) array} dict, in group order."""
+    prefixes = player_df['POS'].map(POSITION_GROUPS)
+    features = player_df[feature_cols].to_numpy(dtype='float64')
+    return {prefix: features[(prefixes == prefix).values] for prefix in GROUP_CLUSTERS if (prefixes == prefix).any()}
+
+def standardize(X, mean, scale):
+    """Standardizes features with the fitted scaler; missing values land on the group mean (0)."""
+    return np.nan_to_num((X - mean) / scale, nan=0.0)
+
+def _silhouette(Z, k, seed, sample_size):
+    """Fits k clusters & scores them by silhouette on a (seeded) subsample of the players."""
+    labels = MiniBatchKMeans(n_clusters=k, random_state=seed, n_init=3, batch_size=min(1024, len(Z))).fit_predict(Z)
+    sample_size = min(sample_size, len(Z)) if sample_size else None
+    return silhouette_score(Z, labels, sample_size=sample_size, random_state=seed)
+
+def select_k(player_df, k_range=K_RANGE, feature_cols=None, seed=SEED, sample_size=SILHOUETTE_SAMPLE_SIZE, n_jobs=N_JOBS):
+    """Scores every (position group, k) candidate in parallel & returns each group's best k along with all scores."""
+
+    feature_cols = feature_cols if feature_cols is not None else [col for col in player_df.columns if col not in UTIL_COLS]
+    candidates = []
+    for prefix, X in group_features(player_df, feature_cols).items():
+        scale = np.nanstd(X, axis=0)
+        scale[~(scale > 0)] = 1.0
+        Z = standardize(X, np.nanmean(X, axis=0), scale)
+        candidates.extend((prefix, k, Z) for k in k_range if k < len(Z))
+
+    scores = Parallel(n_jobs=n_jobs)(delayed(_silhouette)(Z, k, seed, sample_size) for _, k, Z in candidates)
+    scores_df = pd.DataFrame({'GROUP': [prefix for prefix, _, _ in candidates], 'K': [k for _, k, _ in candidates],
+                              'SILHOUETTE': scores})
+    best_k = scores_df.loc[scores_df.groupby('GROUP', sort=False).SILHOUETTE.idxmax()].set_index('GROUP').K.to_dict()
+
+    return best_k, scores_df
+
+def main():
+    """Parses command-line options, fits (or loads) the archetype model & writes the archetype one-hots."""
+
+    parser = argparse.ArgumentParser(description='Clusters players into position-group archetypes.')
+    parser.add_argument('--input', default=PLAYER_STATS_PATH, help='cleaned player statistics CSV')
+    parser.add_argument('--output', default=CLUSTERS_PATH, help='archetype one-hot CSV to write')
+    parser.add_argument('--model', default=MODEL_PATH, help='persisted archetype model (npz)')
+    parser.add_argument('--assign', action='store_true', help='assign players with the persisted model instead of refitting')
+    parser.add_argument('--select-k', action='store_true', help='choose each group\'s k by silhouette instead of 4/4/4/3')
+    parser.add_argument('--k-max', type=int, default=max(K_RANGE), help='largest k considered by --select-k')
+    parser.add_argument('--sample-size', type=int, default=SILHOUETTE_SAMPLE_SIZE, help='players sampled per silhouette score')
+    parser.add_argument('--jobs', type=int, default=N_JOBS, help='parallel workers for --select-k (-1 uses all cores)')
+    parser.add_argument('--seed', type=int, default=SEED, help='random seed for reproducible clusters')
+    parser.add_argument('--from-store', action='store_true',
+                        help='read player features from the feature store & publish the archetypes back into it')
+    parser.add_argument('--store', default=FEATURE_STORE_DIR, help='feature store directory used with --from-store')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    if args.from_store:
+        store = FeatureStore(args.store)
+        player_features = store.load('player_features')
+        player_df = player_features.to_frame()
+        logging.info(f'LOG: Loaded player features from feature store v{player_features.version}.')
+    else:
+        player_df = pd.read_csv(args.input, sep=',', header=0)
+
+    if args.assign:
+        model = ArchetypeModel.load(args.model)
+    else:
+        n_clusters = GROUP_CLUSTERS
+        if args.select_k:
+            n_clusters, scores_df = select_k(player_df, range(2, args.k_max + 1), seed=args.seed,
+                                             sample_size=args.sample_size, n_jobs=args.jobs)
+            logging.info(f'LOG: Silhouette scores:\n{scores_df.pivot(index="K", columns="GROUP", values="SILHOUETTE").round(3)}')
+            logging.info(f'LOG: Selected cluster counts: {n_clusters}')
+        model = ArchetypeModel.fit(player_df, n_clusters, seed=args.seed)
+        model.save(args.model)
+
+    one_hot_df = model.one_hot(player_df)
+    one_hot_df.to_csv(args.output, sep=',', index=False)
+    logging.info(f'LOG: Wrote archetypes for {len(one_hot_df)} players to {args.output}.')
+    if args.from_store:
+        store.publish({'clusters': (one_hot_df, 'PLAYER')}, stage='archetype_clusterer', sources={'clusters': args.output})
+
+if __name__ == '__main__':
+    main()
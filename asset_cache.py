@@ -0,0 +1,173 @@
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+
+# Defining the local asset store & the CDN sources of each asset kind (headshots by player id, logos by team abbreviation)
+ASSET_DIR = './data/assets'
+INDEX_NAME = 'index.json'
+SOURCES = {
+    'headshot': 'https://cdn.nba.com/headshots/nba/latest/260x190/{key}.png',
+    'logo': 'https://a.espncdn.com/i/teamlogos/nba/500/{key}.png',
+}
+ESPN_TEAM_CODES = {'GSW': 'gs', 'NOP': 'no', 'NYK': 'ny', 'SAS': 'sa', 'UTA': 'utah', 'WAS': 'wsh'}  # Others are lower-cased
+
+# Pre-decoded variants stored next to each asset's full-size RGBA array: {kind: {variant: (rotate 180 & mirror, size)}}
+VARIANTS = {
+    'headshot': {'court': (True, None), 'thumb': (False, (104, 76))},  # 'court' matches the shot chart's inverted y-axis
+    'logo': {'thumb': (False, (64, 64))},
+}
+
+# Bulk download settings
+MAX_WORKERS = 8
+REQUEST_TIMEOUT = (3.05, 20)
+
+def logo_key(team_abbv):
+    """Maps an NBA team abbreviation (i.e. 'GSW') to its logo's source key."""
+    return ESPN_TEAM_CODES.get(team_abbv, team_abbv.lower())
+
+# Source key of each kind's lookup key (logos are stored under the NBA abbreviation, fetched under the CDN's code)
+SOURCE_KEYS = {'logo': logo_key}
+
+def decode_image(content):
+    """Decodes an image file's bytes into an RGBA uint8 array."""
+    from PIL import Image
+    return np.asarray(Image.open(BytesIO(content)).convert('RGBA'))
+
+def make_variant(image, rotate=False, size=None):
+    """Returns a rotated (180 degrees & mirrored, i.e. flipped vertically) and/or resized copy of an RGBA array."""
+    from PIL import Image
+    if size is not None:
+        image = np.asarray(Image.fromarray(image).resize(size, Image.LANCZOS))
+    return np.ascontiguousarray(image[::-1]) if rotate else image
+
+class AssetCache:
+    """Local store of pre-decoded image assets (and their variants), looked up by id without touching the CDN."""
+
+    def __init__(self, asset_dir=ASSET_DIR, session=None, sources=SOURCES, variants=VARIANTS):
+        """Instantiates the store; downloads go through the given (pooled) session or a private keep-alive session."""
+        self.asset_dir = asset_dir
+        self.sources = sources
+        self.variants = variants
+        self.session = session if session is not None else self._default_session()
+        self._memory = {}  # {(kind, key, variant): array} of assets already read in this process
+        self._unavailable = set()  # (kind, key) pairs the CDN failed to serve in this process (not retried on demand)
+        self._lock = threading.Lock()
+        self.index = self._load_index()
+
+    @staticmethod
+    def _default_session():
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS))
+        return session
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.asset_dir, INDEX_NAME), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {kind: {} for kind in self.sources}
+
+    def save_index(self):
+        """Writes the id index (asset shapes, sources & download times) next to the stored arrays."""
+        os.makedirs(self.asset_dir, exist_ok=True)
+        with self._lock:
+            with open(os.path.join(self.asset_dir, INDEX_NAME), 'w') as f:
+                json.dump(self.index, f, indent=1, sort_keys=True)
+
+    def _path(self, kind, key, variant='full'):
+        return os.path.join(self.asset_dir, kind, f'{key}.npy' if variant == 'full' else f'{key}.{variant}.npy')
+
+    def contains(self, kind, key):
+        return str(key) in self.index.get(kind, {})
+
+    def get(self, kind, key, variant='full'):
+        """Returns a stored asset variant as an RGBA array (memory-mapped on first use), or None if it isn't stored."""
+
+        memory_key = (kind, str(key), variant)
+        image = self._memory.get(memory_key)
+        if image is None:
+            if not self.contains(kind, key):
+                return None
+            image = np.load(self._path(kind, key, variant), mmap_mode='r')
+            with self._lock:
+                self._memory[memory_key] = image
+        return image
+
+    def add(self, kind, key, image, source=None):
+        """Stores a decoded RGBA array & precomputes its variants."""
+
+        key = str(key)
+        os.makedirs(os.path.join(self.asset_dir, kind), exist_ok=True)
+        np.save(self._path(kind, key), image)
+        for variant, (rotate, size) in self.variants.get(kind, {}).items():
+            np.save(self._path(kind, key, variant), make_variant(image, rotate, size))
+
+        with self._lock:
+            self._memory = {memory_key: value for memory_key, value in self._memory.items() if memory_key[:2] != (kind, key)}
+            self.index.setdefault(kind, {})[key] = {'shape': list(image.shape), 'source': source,
+                                                    'fetched_at': time.strftime('%Y-%m-%dT%H:%M:%S')}
+
+    def fetch(self, kind, key):
+        """Downloads, decodes & stores one asset; returns False (and logs) if it is unavailable."""
+
+        url = self.sources[kind].format(key=SOURCE_KEYS.get(kind, str)(key))
+        try:
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            self.add(kind, key, decode_image(response.content), source=url)
+            return True
+        except Exception as e:
+            logging.warning(f'LOG: Could not cache {kind} {key} ({e!r}).')
+            self._unavailable.add((kind, str(key)))
+            return False
+
+    def ensure(self, kind, key, variant='full'):
+        """Returns a stored asset variant, downloading it first if needed (the only call that may block on the CDN)."""
+        if not self.contains(kind, key) and (kind, str(key)) not in self._unavailable and self.fetch(kind, key):
+            self.save_index()
+        return self.get(kind, key, variant)
+
+    def build(self, kind, keys, max_workers=MAX_WORKERS, force=False):
+        """Bulk-downloads every missing asset of a kind concurrently & returns the keys that could not be fetched."""
+
+        keys = [str(key) for key in keys if force or not self.contains(kind, key)]
+        logging.info(f'LOG: Fetching {len(keys)} {kind} assets...')
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            fetched = list(executor.map(lambda key: self.fetch(kind, key), keys))
+        self.save_index()
+        failed = [key for key, ok in zip(keys, fetched) if not ok]
+        logging.info(f'LOG: Cached {len(keys) - len(failed)} {kind} assets ({len(failed)} unavailable).')
+        return failed
+
+def main():
+    """Parses command-line options & pre-caches headshots of the given (or all active) players and every team logo."""
+
+    parser = argparse.ArgumentParser(description='Downloads & pre-decodes player headshots and team logos into a local asset store.')
+    parser.add_argument('--asset-dir', default=ASSET_DIR, help='local asset store directory')
+    parser.add_argument('--players', type=int, nargs='+', help='player ids (default: all active players, via nba_api)')
+    parser.add_argument('--teams', nargs='+', help='team abbreviations (default: all teams, via nba_api)')
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS, help='concurrent downloads')
+    parser.add_argument('--force', action='store_true', help='re-download assets that are already stored')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    player_ids, team_abbvs = args.players, args.teams
+    if player_ids is None or team_abbvs is None:
+        from nba_api.stats.static import players, teams  # Static lists bundled with nba_api (no API requests)
+        player_ids = player_ids or [player['id'] for player in players.get_active_players()]
+        team_abbvs = team_abbvs or [team['abbreviation'] for team in teams.get_teams()]
+
+    cache = AssetCache(args.asset_dir)
+    cache.build('headshot', player_ids, args.workers, args.force)
+    cache.build('logo', team_abbvs, args.workers, args.force)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,466 @@
+import argparse
+import fnmatch
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from contextlib import contextmanager
+import numpy as np
+import pandas as pd
+from asset_cache import AssetCache
+from max_sum_dac_algorithm import MSSDAC
+from shot_archive import ShotArchive
+from streak_index import StreakIndex
+from zone_summaries import build_season_table, add_rates, LEAGUE_ID
+
+# Defining the path for the benchmark history (one JSON record per run, tagged with the commit it measured)
+RESULTS_PATH = './data/benchmarks/history.jsonl'
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILER_DIR = os.path.join(ROOT_DIR, 'profiler_webapp')
+
+# Synthetic data sizes: a single player's season vs. the whole league over several seasons
+SCALES = {
+    'season': {'players': 1, 'seasons': 1, 'games': 82, 'shots': 1500, 'lineups': 500},
+    'league': {'players': 450, 'seasons': 5, 'games': 82, 'shots': 20000, 'lineups': 5000},
+}
+STREAK_CATEGORIES = ['points', 'rebounds', 'assists', 'steals', 'blocks', 'fg%', 'ft%', '3pt%']
+CHART_TYPES = ['Make/Miss [V1]', 'Make/Miss [V2]', 'Hex-Bin [V1]']
+ARCHETYPE_COLS = ['g_cls_1', 'g_cls_2', 'g_cls_3', 'g_cls_4', 'w_cls_1', 'w_cls_2', 'w_cls_3', 'w_cls_4',
+                  'f_cls_1', 'f_cls_2', 'f_cls_3', 'f_cls_4', 'b_cls_1', 'b_cls_2', 'b_cls_3']
+SHOT_ZONES = [('Restricted Area', 'Center(C)', 'Less Than 8 ft.'), ('In The Paint (Non-RA)', 'Center(C)', '8-16 ft.'),
+              ('Mid-Range', 'Left Side(L)', '16-24 ft.'), ('Mid-Range', 'Right Side(R)', '16-24 ft.'),
+              ('Left Corner 3', 'Left Side(L)', '24+ ft.'), ('Right Corner 3', 'Right Side(R)', '24+ ft.'),
+              ('Above the Break 3', 'Center(C)', '24+ ft.')]
+SAMPLE_TEAMS = {'BOS': 'Boston Celtics', 'DEN': 'Denver Nuggets', 'LAL': 'Los Angeles Lakers', 'MIA': 'Miami Heat',
+                'MIL': 'Milwaukee Bucks', 'PHX': 'Phoenix Suns'}
+SAMPLE_PLAYER_ID = 2544
+
+# One-point rating model grid (the visualizer's fallback forest), so the lineup benchmarks time a single search candidate
+LINEUP_MODEL_GRID = {'n_estimators': [25], 'max_depth': [10]}
+
+# Default timing repeats & the slowdown (vs. the previous commit's median) reported as a regression
+REPEAT = 5
+REGRESSION_THRESHOLD = 0.25
+
+class BenchmarkSkipped(Exception):
+    """Raised by a benchmark's setup when an optional dependency of the code it measures is unavailable."""
+
+def is_repo_module(module_name):
+    """Returns whether a (dotted) module name resolves into this repository (root modules, 'utils' or the profiler's 'submodules')."""
+    top_level = (module_name or '').split('.')[0]
+    return any(os.path.exists(os.path.join(base, top_level)) or os.path.exists(os.path.join(base, f'{top_level}.py'))
+               for base in (ROOT_DIR, PROFILER_DIR))
+
+@contextmanager
+def optional_dependencies():
+    """Turns a missing third-party package into BenchmarkSkipped; broken in-repo imports propagate & fail the benchmark."""
+    try:
+        yield
+    except ModuleNotFoundError as e:
+        if is_repo_module(e.name):
+            raise
+        raise BenchmarkSkipped(f'optional dependency unavailable ({e.name})') from e
+
+# Temporary directories created by the current benchmark's setup (removed once it has been timed, SEE run_benchmarks)
+_SCRATCH_DIRS = []
+
+def _scratch_dir(prefix):
+    """Creates a temporary directory that lives until the current benchmark has been timed."""
+    scratch = tempfile.TemporaryDirectory(prefix=prefix)
+    _SCRATCH_DIRS.append(scratch)
+    return scratch.name
+
+def _remove_scratch_dirs():
+    """Removes every temporary directory created by the current benchmark's setup."""
+    while _SCRATCH_DIRS:
+        _SCRATCH_DIRS.pop().cleanup()
+
+def synthetic_game_log(n_players=1, n_seasons=1, n_games=82, seed=0):
+    """Generates a regular-season game log in the comprehensive_player_statistic layout (used by StreakFinder)."""
+
+    rng = np.random.default_rng(seed)
+    n_rows = n_players * n_seasons * n_games
+    player_ids = np.repeat(np.arange(1, n_players + 1), n_seasons * n_games)
+    seasons = np.tile(np.repeat(np.arange(20 - n_seasons + 1, 21), n_games), n_players)
+    games = np.tile(np.arange(1, n_games + 1), n_players * n_seasons)
+    dates = pd.Timestamp('2000-10-20') + pd.to_timedelta((seasons - 16) * 365 + games * 2, unit='D')
+
+    return pd.DataFrame({
+        'player_id': player_ids,
+        'player_name': [f'Player {pid}' for pid in player_ids],
+        'fixture_id': seasons * 1000000 + 200000 + games,  # Regular-season fixture id ranges (i.e. 16200001...)
+        'played_on': dates.strftime('%Y-%m-%d'),
+        'points': rng.poisson(15, n_rows).astype(np.float64),
+        'rebounds': rng.poisson(6, n_rows).astype(np.float64),
+        'assists': rng.poisson(4, n_rows).astype(np.float64),
+        'steals': rng.poisson(1, n_rows).astype(np.float64),
+        'blocks': rng.poisson(0.7, n_rows).astype(np.float64),
+        'fg%': rng.beta(9, 11, n_rows).round(3),
+        'ft%': rng.beta(15, 4, n_rows).round(3),
+        '3pt%': rng.beta(7, 13, n_rows).round(3),
+    })
+
+def synthetic_shot_frame(n_shots=1500, n_games=82, player_id=SAMPLE_PLAYER_ID, teams=SAMPLE_TEAMS, seed=0):
+    """Generates a player's shot records in the shotchartdetail layout (one team, spread across a season's games)."""
+
+    rng = np.random.default_rng(seed)
+    abbvs = list(teams)
+    game_dates = (pd.Timestamp('2022-10-18') + pd.to_timedelta(np.arange(n_games) * 2, unit='D')).strftime('%Y%m%d')
+    opponents = rng.choice(abbvs[1:], n_games)
+    home = rng.random(n_games) < 0.5
+    game = np.sort(rng.integers(0, n_games, n_shots))
+    zone = rng.integers(0, len(SHOT_ZONES), n_shots)
+
+    return pd.DataFrame({
+        'PLAYER_ID': player_id,
+        'PLAYER_NAME': 'Sample Player',
+        'TEAM_NAME': teams[abbvs[0]],
+        'GAME_DATE': np.asarray(game_dates)[game],
+        'HTM': np.where(home, abbvs[0], opponents)[game],
+        'VTM': np.where(home, opponents, abbvs[0])[game],
+        'LOC_X': rng.integers(-250, 251, n_shots),
+        'LOC_Y': rng.integers(-47, 400, n_shots),
+        'SHOT_MADE_FLAG': (rng.random(n_shots) < 0.47).astype(np.int64),
+        'SHOT_ZONE_BASIC': [SHOT_ZONES[z][0] for z in zone],
+        'SHOT_ZONE_AREA': [SHOT_ZONES[z][1] for z in zone],
+        'SHOT_ZONE_RANGE': [SHOT_ZONES[z][2] for z in zone],
+    })
+
+def synthetic_league_averages(n_seasons=1, seed=0):
+    """Generates the league-average zone table returned next to shot records (one row per zone & season)."""
+
+    rng = np.random.default_rng(seed)
+    rows = [zone for _ in range(n_seasons) for zone in SHOT_ZONES]
+    fga = rng.integers(2000, 40000, len(rows))
+    fgm = (fga * rng.uniform(0.33, 0.65, len(rows))).astype(np.int64)
+    league_df = pd.DataFrame(rows, columns=['SHOT_ZONE_BASIC', 'SHOT_ZONE_AREA', 'SHOT_ZONE_RANGE'])
+    league_df['FGA'], league_df['FGM'], league_df['FG_PCT'] = fga, fgm, (fgm / fga).round(3)
+    return league_df
+
+def synthetic_lineup_table(n_lineups=500, seed=0):
+    """Generates lineup archetype counts (five players per lineup) with offensive, defensive & net ratings."""
+
+    rng = np.random.default_rng(seed)
+    counts = np.zeros((n_lineups, len(ARCHETYPE_COLS)), dtype=np.int64)
+    np.add.at(counts, (np.repeat(np.arange(n_lineups), 5), rng.integers(0, len(ARCHETYPE_COLS), n_lineups * 5)), 1)
+
+    lineup_df = pd.DataFrame(counts, columns=ARCHETYPE_COLS)
+    lineup_df['OffRtg'] = (112 + counts @ rng.normal(0, 2, len(ARCHETYPE_COLS)) + rng.normal(0, 6, n_lineups)).round(1)
+    lineup_df['DefRtg'] = (112 + counts @ rng.normal(0, 2, len(ARCHETYPE_COLS)) + rng.normal(0, 6, n_lineups)).round(1)
+    lineup_df['NetRtg'] = (lineup_df['OffRtg'] - lineup_df['DefRtg']).round(1)
+    return lineup_df
+
+def _load_shot_chart_module():
+    """Imports the profiler's shot chart submodule for offline use (Agg backend, no network access)."""
+
+    import matplotlib
+    matplotlib.use('Agg')
+    if PROFILER_DIR not in sys.path:
+        sys.path.insert(0, PROFILER_DIR)
+    with optional_dependencies():
+        from submodules import pp_generate_shot_charts
+    return pp_generate_shot_charts
+
+def _synthetic_asset_cache():
+    """Creates a throwaway asset store holding a blank headshot for the sample player (stands in for the court's player image)."""
+    cache = AssetCache(_scratch_dir('bench_assets_'))
+    cache.add('headshot', SAMPLE_PLAYER_ID, np.full((190, 260, 4), 128, dtype=np.uint8))
+    return cache
+
+def _use_synthetic_court_images(module):
+    """Points the shot chart module at throwaway texture & marker images wherever the project's images are missing."""
+
+    import matplotlib.image as mpimg
+    image_dir = _scratch_dir('bench_images_')
+    for name in ['WOOD1_IMG_PATH', 'WOOD2_IMG_PATH', 'LOGO_IMG_PATH', 'BUCKET_IMG_PATH', 'BRICK_IMG_PATH']:
+        if not os.path.exists(getattr(module, name)):
+            path = os.path.join(image_dir, f'{name}.png')
+            mpimg.imsave(path, np.random.default_rng(0).random((256, 256, 4)))
+            setattr(module, name, path)
+    module.load_court_textures.cache_clear()
+    module.load_shot_markers.cache_clear()
+
+def bench_max_subarray(scale):
+    """MSSDAC.max_subarray over one player's season (or every player-season of the league, back to back)."""
+    size = SCALES[scale]
+    game_log = synthetic_game_log(size['players'], size['seasons'], size['games'])
+    deviations = (game_log['points'] - game_log['points'].mean()).round(1).tolist()
+    return lambda: MSSDAC().max_subarray(deviations)
+
+def bench_execute_mssdac(scale):
+    """StreakFinder.execute_MSSDAC for one player & every category, filtered out of the scale's game log."""
+
+    from hot_streak_finder import StreakFinder
+
+    size = SCALES[scale]
+    logging.disable(logging.ERROR)  # Silences the per-season streak output (and the missing default CSV)
+    finder = StreakFinder()
+    finder.comprehensive_stats_df = synthetic_game_log(size['players'], size['seasons'], size['games'])
+    finder.player, finder.category = 1, STREAK_CATEGORIES
+    return finder.execute_MSSDAC
+
+def bench_streak_index_build(scale):
+    """StreakIndex.from_game_log for one player's points over the scale's seasons."""
+    size = SCALES[scale]
+    game_log = synthetic_game_log(1, size['seasons'], size['games'])
+    return lambda: StreakIndex.from_game_log(game_log, 'points')
+
+def bench_streak_index_query(scale):
+    """StreakIndex.query_dates over a window spanning every season of the scale (built once)."""
+    size = SCALES[scale]
+    game_log = synthetic_game_log(1, size['seasons'], size['games'])
+    index = StreakIndex.from_game_log(game_log, 'points')
+    return lambda: index.query_dates(game_log['played_on'].iloc[1], game_log['played_on'].iloc[-2])
+
+def bench_plot_shot_data(scale, plot_type):
+    """ShotChartGenerator.plot_shot_data for one chart type, drawn to an off-screen canvas & closed."""
+
+    module = _load_shot_chart_module()
+    import matplotlib.pyplot as plt
+    module.asset_cache = _synthetic_asset_cache()  # Pre-seeded so no headshot is requested
+    _use_synthetic_court_images(module)
+    generator = module.ShotChartGenerator()
+    shot_df = synthetic_shot_frame(SCALES[scale]['shots'])
+    league_df = synthetic_league_averages()
+
+    def plot():
+        ax = generator.plot_shot_data(SAMPLE_PLAYER_ID, shot_df, league_df, plot_type=plot_type)
+        ax.figure.canvas.draw()
+        plt.close(ax.figure)
+
+    with optional_dependencies():  # Chart types import their plotting packages on first draw (i.e. seaborn)
+        plot()
+    return plot
+
+def bench_aggregate_league_data(scale):
+    """ShotChartGenerator._aggregate_league_data over the league-average zones of every season in range."""
+    generator = _load_shot_chart_module().ShotChartGenerator()
+    league_df = synthetic_league_averages(n_seasons=SCALES[scale]['seasons'] * 4)
+    return lambda: generator._aggregate_league_data(league_df)
+
+def bench_extract_game_log(scale):
+    """ShotChartGenerator._extract_game_log over a season's (or career's) shot records."""
+    module = _load_shot_chart_module()
+    from submodules.pp_config import TEAM_INFO_PATH
+    if not os.path.exists(TEAM_INFO_PATH):
+        module.get_nba_teams = lambda: {'TEAM_NAMES': SAMPLE_TEAMS}  # The team info asset isn't part of every checkout
+    generator = module.ShotChartGenerator()
+    size = SCALES[scale]
+    shot_df = synthetic_shot_frame(size['shots'], size['games'] * size['seasons'], teams=module.get_nba_teams()['TEAM_NAMES'])
+    return lambda: generator._extract_game_log(shot_df)
+
+def _synthetic_shot_archive(scale):
+    """Creates a throwaway shot archive with one season partition holding every player of the scale."""
+
+    size = SCALES[scale]
+    n_teams = min(size['players'], 30)
+    player_frames = [synthetic_shot_frame(min(size['shots'], 1500), player_id=SAMPLE_PLAYER_ID + i, seed=i)
+                     for i in range(size['players'])]
+    for frame in player_frames:
+        frame['GAME_ID'], frame['GAME_EVENT_ID'] = frame['GAME_DATE'], np.arange(len(frame))
+
+    def fetch_team(team_id, season):
+        return pd.concat(player_frames[team_id::n_teams], ignore_index=True), synthetic_league_averages()
+
+    archive = ShotArchive(_scratch_dir('bench_shot_archive_'))
+    archive.ingest('2021-22', list(range(n_teams)), fetch_team, request_interval=0)
+    return archive
+
+def bench_archive_player_shots(scale):
+    """ShotArchive.player_season for one player, out of a season partition holding every player of the scale."""
+    archive = _synthetic_shot_archive(scale)
+    return lambda: archive.player_season(SAMPLE_PLAYER_ID + SCALES[scale]['players'] // 2, '2021-22')
+
+def bench_build_zone_table(scale):
+    """Counts every player's zone attempts & makes (plus league deltas) over an archived season."""
+
+    partition = _synthetic_shot_archive(scale).partition('2021-22')
+
+    def build():
+        counts_df = build_season_table(partition)
+        return add_rates(counts_df, counts_df[counts_df['PLAYER_ID'] == LEAGUE_ID])
+    return build
+
+def bench_lineup_fit(scale):
+    """rating_models.search_rating_model with a one-point grid (the visualizer's fallback forest) on a synthetic lineup table."""
+
+    with optional_dependencies():
+        from rating_models import N_SPLITS, feature_columns, search_rating_model
+    lineup_df = synthetic_lineup_table(SCALES[scale]['lineups'])
+    X, y = lineup_df[feature_columns(lineup_df)].to_numpy(dtype=np.float64), lineup_df['OffRtg'].to_numpy(dtype=np.float64)
+
+    def fit():
+        with tempfile.TemporaryDirectory(prefix='bench_models_') as cache_dir:  # Fresh cache, so every call searches & refits
+            return search_rating_model(X, y, LINEUP_MODEL_GRID, N_SPLITS, n_jobs=1, cache_dir=cache_dir)
+    return fit
+
+def bench_lineup_predict(scale):
+    """Predicts one lineup's offensive, defensive & net ratings with models from rating_models.load_rating_models."""
+
+    with optional_dependencies():
+        from rating_models import TARGETS, export_rating_models, load_rating_models, train_rating_models
+    lineup_df = synthetic_lineup_table(SCALES[scale]['lineups'])
+    logging.disable(logging.WARNING)  # Silences the per-target search & export output
+    with tempfile.TemporaryDirectory(prefix='bench_models_') as model_dir:
+        targets = {name: TARGETS[name] for name in ['off', 'def']}
+        models, reports = train_rating_models(lineup_df, targets, LINEUP_MODEL_GRID, n_jobs=1, cache_dir=model_dir)
+        export_rating_models(models, reports, model_dir)
+        models = load_rating_models(model_dir, names=['off', 'def'])
+    test_record = lineup_df[ARCHETYPE_COLS].to_numpy(dtype=np.float64)[:1]  # Same feature order the models were trained on
+
+    def predict():
+        o_pred = round(models['off'].predict(test_record)[0], 1)
+        d_pred = round(models['def'].predict(test_record)[0], 1)
+        return round(o_pred - d_pred, 1)
+    return predict
+
+# Benchmark registry: {name: setup function returning the zero-argument callable to time}
+BENCHMARKS = {
+    'streak.max_subarray': bench_max_subarray,
+    'streak.execute_mssdac': bench_execute_mssdac,
+    'streak.index_build': bench_streak_index_build,
+    'streak.index_query': bench_streak_index_query,
+    **{f'shot_chart.plot[{plot_type}]': (lambda scale, plot_type=plot_type: bench_plot_shot_data(scale, plot_type))
+       for plot_type in CHART_TYPES},
+    'shot_chart.aggregate_league_data': bench_aggregate_league_data,
+    'shot_chart.extract_game_log': bench_extract_game_log,
+    'shot_archive.player_shots': bench_archive_player_shots,
+    'zone_summaries.build_season_table': bench_build_zone_table,
+    'lineup.fit': bench_lineup_fit,
+    'lineup.predict': bench_lineup_predict,
+}
+
+def time_callable(fn, repeat=REPEAT):
+    """Times single calls of fn (after one warm-up call) & returns their min/median/mean in milliseconds."""
+    fn()
+    times = [seconds * 1000 for seconds in timeit.Timer(fn).repeat(repeat=repeat, number=1)]
+    return {'min_ms': round(min(times), 3), 'median_ms': round(statistics.median(times), 3),
+            'mean_ms': round(statistics.mean(times), 3), 'repeat': repeat}
+
+def run_benchmarks(scales=tuple(SCALES), patterns=None, repeat=REPEAT):
+    """Runs every registered benchmark (optionally only names matching the glob patterns) at each scale."""
+
+    results = {}
+    for scale in scales:
+        for name, setup in BENCHMARKS.items():
+            if patterns and not any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+                continue
+            key = f'{name}@{scale}'
+            try:
+                results[key] = time_callable(setup(scale), repeat)
+            except BenchmarkSkipped as e:
+                results[key] = {'skipped': str(e)}
+            except Exception as e:
+                results[key] = {'failed': repr(e)}
+            finally:
+                logging.disable(logging.NOTSET)
+                _remove_scratch_dirs()
+            if 'failed' in results[key]:
+                logging.error(f'LOG: {key}: failed, {results[key]["failed"]}')
+                continue
+            logging.info(f'LOG: {key}: ' + (f'skipped, {results[key]["skipped"]}' if 'skipped' in results[key]
+                                           else f'{results[key]["median_ms"]} ms (median of {repeat})'))
+    return results
+
+def git_commit():
+    """Returns (commit hash, whether the working tree has uncommitted changes), or (None, None) outside a repo."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], capture_output=True, text=True,
+                                check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None, None
+    return commit, bool(status.strip())
+
+def make_record(results, commit=None, dirty=None):
+    """Wraps a run's results with the commit, time & library versions they were measured with."""
+    if commit is None:
+        commit, dirty = git_commit()
+    return {'commit': commit, 'dirty': dirty, 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(), 'numpy': np.__version__, 'pandas': pd.__version__,
+            'machine': platform.machine(), 'results': results}
+
+def load_history(path=RESULTS_PATH):
+    """Reads every recorded run (oldest first); returns an empty list if nothing has been recorded yet."""
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def save_record(record, path=RESULTS_PATH):
+    """Appends a run's record to the benchmark history."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'a') as f:
+        f.write(json.dumps(record) + '\n')
+
+def baseline_record(history, commit):
+    """Returns the most recent recorded run of a different commit (the run to compare against), if any."""
+    return next((record for record in reversed(history) if record['commit'] != commit), None)
+
+def compare_results(baseline, current, threshold=REGRESSION_THRESHOLD):
+    """Compares median timings of benchmarks present in both runs.
+
+    Returns a dataframe of (benchmark, baseline ms, current ms, ratio, regression) rows, slowest-relative first.
+    """
+
+    rows = []
+    for key, result in current.items():
+        previous = baseline.get(key, {})
+        if 'median_ms' not in result or 'median_ms' not in previous:
+            continue
+        ratio = result['median_ms'] / previous['median_ms'] if previous['median_ms'] > 0 else float('inf')
+        rows.append({'benchmark': key, 'baseline_ms': previous['median_ms'], 'current_ms': result['median_ms'],
+                     'ratio': round(ratio, 3), 'regression': ratio > 1 + threshold})
+    columns = ['benchmark', 'baseline_ms', 'current_ms', 'ratio', 'regression']
+    return pd.DataFrame(rows, columns=columns).sort_values('ratio', ascending=False).reset_index(drop=True)
+
+def main():
+    """Parses command-line options, runs the offline benchmarks & compares them with the previous commit's run."""
+
+    parser = argparse.ArgumentParser(description='Times the streak, shot-chart & lineup hot paths on synthetic data.')
+    parser.add_argument('--only', nargs='+', metavar='PATTERN', help='glob patterns of benchmarks to run')
+    parser.add_argument('--scales', nargs='+', default=list(SCALES), choices=list(SCALES), help='data sizes to run')
+    parser.add_argument('--repeat', type=int, default=REPEAT, help='timed calls per benchmark')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help='relative slowdown reported as a regression')
+    parser.add_argument('--results', default=RESULTS_PATH, help='benchmark history file')
+    parser.add_argument('--no-save', action='store_true', help='do not record this run in the history')
+    parser.add_argument('--list', action='store_true', help='list the registered benchmarks & exit')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    if args.list:
+        for name, setup in BENCHMARKS.items():
+            print(f'{name:<40}{(setup.__doc__ or "").strip()}')
+        return
+
+    record = make_record(run_benchmarks(args.scales, args.only, args.repeat))
+    baseline = baseline_record(load_history(args.results), record['commit'])
+    if not args.no_save:
+        save_record(record, args.results)
+        logging.info(f'LOG: Recorded results for commit {str(record["commit"])[:10]} in {args.results}.')
+
+    failures = [key for key, result in record['results'].items() if 'failed' in result]
+    if baseline is None:
+        logging.info('LOG: No run of an earlier commit recorded yet, nothing to compare against.')
+        regressions = []
+    else:
+        comparison = compare_results(baseline['results'], record['results'], args.threshold)
+        logging.info(f'LOG: Compared with commit {str(baseline["commit"])[:10]} ({baseline["timestamp"]}):\n'
+                     + comparison.to_string(index=False))
+        regressions = comparison[comparison.regression].benchmark.tolist()
+        if regressions:
+            logging.warning(f'LOG: {len(regressions)} benchmark(s) slowed down by more than {args.threshold:.0%}.')
+    if failures:
+        logging.error(f'LOG: {len(failures)} benchmark(s) failed: {failures}')
+    if regressions or failures:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+# Defining the feature store location & the pipeline CSVs imported into it as (table name: source path, row key)
+FEATURE_STORE_DIR = './data/feature_store'
+CSV_SOURCES = {
+    'player_features': ('./cln_comprehensive_stats.csv', 'PLAYER'),
+    'clusters': ('./cln_clusters.csv', 'PLAYER'),
+    'lineup_train': ('./cln_train.csv', 'Lineups'),
+    'lineup_agg': ('./lineup_agg_stats.csv', 'Lineups'),
+}
+
+class FeatureTable:
+    """Memory-mapped (row x feature) float32 matrix with its row keys, text labels & provenance metadata."""
+
+    def __init__(self, matrix, labels, columns, metadata):
+        """Instantiates the table; the matrix is column-major so every single-column slice is a contiguous view."""
+        self.values = matrix
+        self.labels = labels
+        self.columns = pd.Index(columns)
+        self.metadata = metadata
+        self.row_key = metadata['row_key']
+        self.rows = pd.Index(labels[self.row_key])
+
+    @property
+    def version(self):
+        return self.metadata['version']
+
+    def column(self, name):
+        """Returns a zero-copy view of a single feature column."""
+        return self.values[:, self.columns.get_loc(name)]
+
+    def column_block(self, names):
+        """Returns a (row x feature) block, as a zero-copy view when the columns are stored contiguously (i.e. g_cls_1..b_cls_3)."""
+        positions = self.columns.get_indexer(names)
+        if (positions < 0).any():
+            raise KeyError(f'Columns not in [{self.metadata["name"]}]: {list(pd.Index(names)[positions < 0])}')
+        if len(positions) and (np.diff(positions) == 1).all():
+            return self.values[:, positions[0]:positions[-1] + 1]
+        return self.values[:, positions]
+
+    def row_positions(self, keys):
+        """Returns the matrix rows of the input row keys (-1 for unknown keys; the first row for duplicated keys)."""
+        first_rows = np.flatnonzero(~self.rows.duplicated(keep='first'))
+        positions = self.rows[first_rows].get_indexer(keys)
+        return np.where(positions >= 0, first_rows[positions], -1)
+
+    def row_block(self, keys):
+        """Returns the (key x feature) rows of the input row keys, raising a KeyError that names any keys not in the table."""
+        positions = self.row_positions(keys)
+        if (positions < 0).any():
+            raise KeyError(f'Rows not in [{self.metadata["name"]}]: {list(pd.Index(keys)[positions < 0])}')
+        return self.values[positions]
+
+    def to_frame(self, columns=None):
+        """Returns the text labels & selected features as a (copied) dataframe for pandas-based consumers."""
+        columns = list(self.columns) if columns is None else [col for col in columns if col not in self.labels.columns]
+        features_df = pd.DataFrame(np.asarray(self.column_block(columns)), columns=columns)
+        frame_df = pd.concat([self.labels.reset_index(drop=True), features_df], axis=1)
+        return frame_df[[col for col in self.metadata['column_order'] if col in frame_df.columns]]
+
+class FeatureStore:
+    """Versioned directory of feature tables; each version is a complete, immutable snapshot of every table."""
+
+    def __init__(self, root=FEATURE_STORE_DIR):
+        self.root = root
+
+    def current_version(self):
+        """Returns the latest published version number (None if nothing has been published yet)."""
+        try:
+            with open(os.path.join(self.root, 'CURRENT'), 'r') as f:
+                return int(f.read().strip())
+        except FileNotFoundError:
+            return None
+
+    def version_dir(self, version):
+        return os.path.join(self.root, f'v{version:04d}')
+
+    def table_names(self, version=None):
+        version = self.current_version() if version is None else version
+        return sorted(name[:-5] for name in os.listdir(self.version_dir(version)) if name.endswith('.json'))
+
+    def load(self, name, version=None):
+        """Memory-maps a table from the given (default: latest) version without parsing or copying its values."""
+
+        version = self.current_version() if version is None else version
+        if version is None:
+            raise FileNotFoundError(f'No feature store versions have been published under {self.root}.')
+        path = os.path.join(self.version_dir(version), name)
+
+        with open(path + '.json', 'r') as f:
+            metadata = json.load(f)
+        labels = pd.DataFrame(metadata.pop('labels'))
+        matrix = np.load(path + '.npy', mmap_mode='r')
+        return FeatureTable(matrix, labels, metadata['columns'], metadata)
+
+    def snapshot(self, names, version=None, sources=CSV_SOURCES):
+        """Loads several tables from one version so every consumer agrees on the same features (importing the CSVs first if needed)."""
+        if version is None and self.current_version() is None:
+            import_csvs(self, sources)
+        version = self.current_version() if version is None else version
+        return {name: self.load(name, version) for name in names}
+
+    def publish(self, tables, stage, sources=None):
+        """Publishes a new version with the input {name: (dataframe, row key)} tables, carrying over all other tables.
+
+        Tables are written into a temporary directory that is renamed into place before the CURRENT pointer moves,
+        so readers never observe a partially written version.
+        """
+
+        previous = self.current_version()
+        version = (previous or 0) + 1
+        os.makedirs(self.root, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix='.publishing_', dir=self.root)
+
+        # Unchanged tables are hard-linked from the previous version (copied where links aren't supported)
+        if previous is not None:
+            for file_name in os.listdir(self.version_dir(previous)):
+                if file_name.rsplit('.', 1)[0] not in tables:
+                    src, dst = os.path.join(self.version_dir(previous), file_name), os.path.join(tmp_dir, file_name)
+                    try:
+                        os.link(src, dst)
+                    except OSError:
+                        shutil.copy2(src, dst)
+
+        for name, (df, row_key) in tables.items():
+            source = (sources or {}).get(name)
+            _write_table(os.path.join(tmp_dir, name), df, row_key, {
+                'name': name, 'version': version, 'stage': stage, 'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'parent_version': previous, 'source': source, 'source_sha256': _file_sha256(source) if source else None,
+            })
+
+        os.replace(tmp_dir, self.version_dir(version))
+        pointer_path = os.path.join(self.root, 'CURRENT.tmp')
+        with open(pointer_path, 'w') as f:
+            f.write(str(version))
+        os.replace(pointer_path, os.path.join(self.root, 'CURRENT'))
+
+        logging.info(f'LOG: Published feature store v{version} ({stage}): {sorted(tables)}')
+        return version
+
+def _write_table(path, df, row_key, metadata):
+    """Writes a table's float32 matrix (column-major) & its JSON sidecar of columns, text labels and provenance."""
+
+    df = df.loc[:, [col for col in df.columns if not str(col).startswith('Unnamed')]].reset_index(drop=True)
+    text_cols = [col for col in df.columns if not pd.api.types.is_numeric_dtype(df[col])]
+    if row_key not in text_cols:
+        text_cols.insert(0, row_key)
+    feature_cols = [col for col in df.columns if col not in text_cols]
+
+    np.save(path + '.npy', np.asfortranarray(df[feature_cols].to_numpy(dtype=np.float32)))
+    labels = df[text_cols].astype(object).where(df[text_cols].notna(), None)
+    metadata.update({'row_key': row_key, 'columns': feature_cols, 'column_order': list(df.columns), 'n_rows': len(df),
+                     'labels': {col: labels[col].tolist() for col in text_cols}})
+    with open(path + '.json', 'w') as f:
+        json.dump(metadata, f)
+
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def import_csvs(store, sources=CSV_SOURCES, stage='csv_import'):
+    """Publishes the pipeline's CSV outputs into the store as a single new version."""
+    tables = {name: (pd.read_csv(path, sep=',', header=0), row_key) for name, (path, row_key) in sources.items()}
+    return store.publish(tables, stage, sources={name: path for name, (path, _) in sources.items()})
+
+def main():
+    """Imports the pipeline's feature CSVs into a new feature store version & summarizes the published tables."""
+
+    parser = argparse.ArgumentParser(description='Publishes the pipeline feature tables into the versioned feature store.')
+    parser.add_argument('--store', default=FEATURE_STORE_DIR, help='feature store directory')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    store = FeatureStore(args.store)
+    version = import_csvs(store)
+    for name in store.table_names(version):
+        table = store.load(name, version)
+        logging.info(f'LOG: [{name}] {table.values.shape[0]} rows x {table.values.shape[1]} features '
+                     f'(source: {table.metadata["source"]})')
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 import logging
 import pandas as pd
-from utils.max_sum_dac_algorithm import MSSDAC
+from max_sum_dac_algorithm import MSSDAC
+from streak_index import StreakIndex
 
 # Defining the paths for CSV file containing comprehensive player/game statistical information needed (from 2016)
 DATA_PATH = './data/intermediate/comprehensive_player_statistic.csv'
@@ -23,6 +24,7 @@ class StreakFinder:
         self.category = None
         self.dates = None
         self.comprehensive_stats_df = None
+        self.streak_indexes = {}  # {(player id, category): StreakIndex} built on first query
         self.load_csv()
 
     def load_csv(self):
@@ -62,6 +64,7 @@ class StreakFinder:
         stats_df.fillna(value='', inplace=True)
 
         self.comprehensive_stats_df = stats_df
+        self.streak_indexes = {}
         logging.info('LOG: Datasets loaded. Please provide information below to get started...')
 
     def input_validation(self):
@@ -138,6 +141,24 @@ class StreakFinder:
                     # print(f'sum: {sum(time_frame_stats)}')
                     # print(f'average: {round(sum(time_frame_stats) / len(time_frame_stats),1)}')
 
+            # Career-long stretch (may span seasons), answered by the streak index instead of another MSSDAC pass
+            streak = self.best_stretch(cat)
+            if streak is not None:
+                dates = self.streak_index(cat).stretch_dates(streak)
+                logging.info(f'Best career stretch for [{cat}] is between: {dates[0]} & {dates[1]}')
+
+    def streak_index(self, cat):
+        """Returns the segment-tree index of the player's per-game deviations for a category (built once per player & category)."""
+        key = (self.player, cat)
+        if key not in self.streak_indexes:
+            stats_df = self.comprehensive_stats_df[self.comprehensive_stats_df.player_id == self.player]
+            self.streak_indexes[key] = StreakIndex.from_game_log(stats_df, cat)
+        return self.streak_indexes[key]
+
+    def best_stretch(self, cat, start_date=None, end_date=None):
+        """Returns the player's best stretch for a category between two dates (any range, across seasons) in O(log n)."""
+        return self.streak_index(cat).query_dates(start_date, end_date)
+
 def main():
     """Instantiates StreakFinder class & sets up loop to keep conducting searches till told otherwise."""
     logger = logger_setup()
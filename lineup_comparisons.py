@@ -0,0 +1,63 @@
+import warnings
+import numpy as np
+import pandas as pd
+
+# Defining the paths for the aggregated lineup statistics & the cleaned player statistics used for comparisons
+LINEUP_AGG_PATH = './lineup_agg_stats.csv'
+PLAYER_STATS_PATH = './cln_comprehensive_stats.csv'
+
+# Offensive (shot-profile & play-type frequency) and defensive (opponent efficiency) comparison attributes
+OFF_COLS = ['%RA_FGA', '%PT_nonRA_FGA', '%MR_FGA', '%cns_2FGA', '%pullup_2FGA', '%Corner3_FGA', '%ATB3_FGA', '%cns_3PA',
+            '%pullup_3PA', '%trsn_FGA', '%iso_FGA', '%pnrbh_FGA', '%pnrrm_FGA', '%postup_FGA', '%spotup_FGA',
+            '%handoff_FGA', '%cuts_FGA', '%offscrn_FGA', '%putbk_FGA']
+DEF_COLS = ['Opp2P%', 'opp_RA_FG%', 'opp_PT_nonRA_FG%', 'opp_MR_FG%', 'Opp3P%', 'opp_Corner3_FG%', 'opp_ATB3_FG%',
+            'opp_iso_FG%', 'opp_pnrbh_FG%', 'opp_pnrrm_FG%', 'opp_postup_FG%', 'opp_spotup_FG%', 'opp_handoff_FG%',
+            'opp_offscrn_FG%']
+
+class LeagueDeltaComparator:
+    """Compares lineups' averaged player attributes against the league-average lineup, as percentage deltas."""
+
+    def __init__(self, lineup_agg_df, player_df, cols=OFF_COLS + DEF_COLS):
+        """Precomputes the league-average vector and a (player x feature) matrix over the comparison columns."""
+        self.cols = list(cols)
+        self.league_avg = lineup_agg_df[self.cols].mean().values
+
+        # Append an all-NaN row so padded / unknown players (row -1) drop out of the nan-aware means
+        features = player_df[self.cols].values.astype(np.float64)
+        self.player_matrix = np.vstack([features, np.full((1, len(self.cols)), np.nan)])
+        self._player_rows = {name: row for row, name in enumerate(player_df['PLAYER'].tolist())}
+
+    @classmethod
+    def from_csv(cls, lineup_agg_path=LINEUP_AGG_PATH, player_stats_path=PLAYER_STATS_PATH, cols=OFF_COLS + DEF_COLS):
+        """Loads only the comparison columns from the lineup & player CSVs and builds the comparator."""
+        lineup_agg_df = pd.read_csv(lineup_agg_path, usecols=cols)
+        player_df = pd.read_csv(player_stats_path, usecols=['PLAYER'] + list(cols))
+        return cls(lineup_agg_df, player_df, cols)
+
+    def lineup_deltas(self, players):
+        """Returns the percentage delta of the input lineup's averaged attributes from league average."""
+        return pd.Series(self._deltas(self._gather_rows([players]))[0], index=self.cols)
+
+    def batch_deltas(self, lineups):
+        """Returns a (lineup x feature) dataframe of deltas for many lineups (lists of names or comma-joined strings)."""
+        lineups = list(lineups)
+        labels = [lineup if isinstance(lineup, str) else ', '.join(lineup) for lineup in lineups]
+        return pd.DataFrame(self._deltas(self._gather_rows(lineups)), index=labels, columns=self.cols)
+
+    def _gather_rows(self, lineups):
+        """Builds a padded (lineup x max-lineup-size) array of player-matrix rows, with -1 for missing players.
+
+        A player picked more than once in a lineup counts once, as in the visualizer's original isin() selection.
+        """
+        lineups = [list(dict.fromkeys(lineup.split(', ') if isinstance(lineup, str) else lineup)) for lineup in lineups]
+        rows = np.full((len(lineups), max((len(lineup) for lineup in lineups), default=0)), -1, dtype=np.int64)
+        for i, lineup in enumerate(lineups):
+            rows[i, :len(lineup)] = [self._player_rows.get(name, -1) for name in lineup]
+        return rows
+
+    def _deltas(self, rows):
+        """Gathers the lineup rows in one indexing step and converts their means into league deltas."""
+        with warnings.catch_warnings(), np.errstate(invalid='ignore', divide='ignore'):
+            warnings.simplefilter('ignore', RuntimeWarning)  # Lineups with no known players yield NaN deltas
+            lineup_avg = np.nanmean(self.player_matrix[rows], axis=1)
+            return np.round((lineup_avg - self.league_avg) / self.league_avg * 100, 1)
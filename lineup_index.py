@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+from player_identity import normalize_name
+
+# Lineups are packed into one uint64 key: 5 dense player ids of 12 bits each, sorted so player order never matters
+LINEUP_SIZE = 5
+ID_BITS = 12
+MAX_PLAYER_ID = (1 << ID_BITS) - 1  # Dense id 0 is reserved for empty slots (lineups of fewer players)
+LINEUP_SEP = ', '
+
+# Key for lineups with players missing from the vocabulary (bit 63 is never set by a packed lineup, so it never matches)
+UNKNOWN_KEY = np.uint64(1) << np.uint64(63)
+
+class PlayerVocabulary:
+    """Assigns dense integer ids (1, 2, ...) to players, keyed by normalized name (or by NBA player id)."""
+
+    def __init__(self, players=(), normalize=True):
+        """Instantiates the vocabulary; normalize=False keys players on their exact names (i.e. for exact-match filters)."""
+        self.players = []
+        self.normalize = normalize
+        self._ids = {}
+        self.ids(players)
+
+    def player_key(self, player):
+        if isinstance(player, (int, np.integer)) or not self.normalize:
+            return player
+        return normalize_name(player)
+
+    def ids(self, players, add=True):
+        """Returns the dense ids of the input players, adding unseen players (or returning 0 for them if add=False)."""
+        ids = np.zeros(len(players), dtype=np.uint64)
+        for i, player in enumerate(players):
+            key = self.player_key(player)
+            if key not in self._ids and add:
+                if len(self.players) == MAX_PLAYER_ID:
+                    raise ValueError(f'Lineup keys support at most {MAX_PLAYER_ID} distinct players.')
+                self.players.append(player)
+                self._ids[key] = len(self.players)
+            ids[i] = self._ids.get(key, 0)
+        return ids
+
+    def names(self, ids):
+        return [self.players[player_id - 1] if player_id else None for player_id in ids]
+
+def pack_lineups(member_ids):
+    """Packs a (lineup x member) array of dense ids into canonical uint64 keys (members sorted, empty slots first)."""
+    member_ids = np.sort(np.asarray(member_ids, dtype=np.uint64), axis=1)
+    shifts = np.arange(member_ids.shape[1] - 1, -1, -1, dtype=np.uint64) * np.uint64(ID_BITS)
+    return np.bitwise_or.reduce(member_ids << shifts, axis=1)
+
+def unpack_lineups(keys):
+    """Unpacks uint64 lineup keys into a (lineup x 5) array of sorted dense ids."""
+    shifts = np.arange(LINEUP_SIZE - 1, -1, -1, dtype=np.uint64) * np.uint64(ID_BITS)
+    return (np.asarray(keys, dtype=np.uint64)[:, None] >> shifts) & np.uint64(MAX_PLAYER_ID)
+
+def encode_lineups(lineups, vocabulary, sep=LINEUP_SEP, add=True):
+    """Converts lineups (joined strings, i.e. 'A, B, C, D, E' or an id string '-1-2-3-4-5-', or sequences) into keys.
+
+    Each distinct player string is normalized & looked up only once, regardless of how many lineups it appears in.
+    With add=False, lineups that include players missing from the vocabulary are given UNKNOWN_KEY.
+    """
+
+    members = [lineup.strip(sep).split(sep) if isinstance(lineup, str) else list(lineup) for lineup in lineups]
+    sizes = np.array([len(lineup) for lineup in members], dtype=np.int64)
+    if (sizes > LINEUP_SIZE).any():
+        raise ValueError(f'Lineup keys hold at most {LINEUP_SIZE} players.')
+
+    # Id-string lineups (i.e. the stats endpoints' GROUP_ID) carry NBA player ids
+    flat = [player for lineup in members for player in lineup]
+    if sep == '-':
+        flat = [int(player) for player in flat]
+    codes, uniques = pd.factorize(pd.Series(flat, dtype=object))
+    unique_ids = vocabulary.ids(list(uniques), add=add)
+
+    member_ids = np.zeros((len(members), LINEUP_SIZE), dtype=np.uint64)
+    rows = np.repeat(np.arange(len(members)), sizes)
+    slots = np.arange(len(flat)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    member_ids[rows, slots] = unique_ids[codes]
+
+    keys = pack_lineups(member_ids)
+    keys[np.bincount(rows, weights=(unique_ids[codes] == 0), minlength=len(members)) > 0] = UNKNOWN_KEY
+    return keys
+
+class LineupIndex:
+    """Hash lookup & per-player posting lists over the canonical keys of one lineup table (row order preserved)."""
+
+    def __init__(self, keys, vocabulary):
+        """Builds the key lookup and a CSR layout of sorted row positions for every member player."""
+
+        self.keys = np.asarray(keys, dtype=np.uint64)
+        self.vocabulary = vocabulary
+        self._lookup = pd.Index(self.keys)
+
+        # Posting lists: rows sorted by member id, with offsets[player id] marking where each player's rows start
+        members = unpack_lineups(self.keys)
+        rows = np.repeat(np.arange(len(self.keys)), LINEUP_SIZE)
+        member_ids = members.ravel().astype(np.int64)
+        order = np.lexsort((rows, member_ids))
+        self._posting_rows = rows[order]
+        self._offsets = np.searchsorted(member_ids[order], np.arange(MAX_PLAYER_ID + 2))
+
+    @classmethod
+    def from_frame(cls, df, vocabulary=None, lineup_col='Lineups', sep=LINEUP_SEP):
+        vocabulary = vocabulary if vocabulary is not None else PlayerVocabulary()
+        return cls(encode_lineups(df[lineup_col], vocabulary, sep), vocabulary)
+
+    def lookup(self, lineups):
+        """Returns the row of each input lineup in any player order (-1 if absent; the first row for repeated lineups)."""
+        keys = encode_lineups(lineups, self.vocabulary, add=False)
+        if self._lookup.is_unique:
+            return self._lookup.get_indexer(keys)
+        first_rows = np.flatnonzero(~self._lookup.duplicated(keep='first'))
+        positions = self._lookup[first_rows].get_indexer(keys)
+        return np.where(positions >= 0, first_rows[positions], -1)
+
+    def containing(self, *players):
+        """Returns the (sorted) rows of lineups that include every input player, by intersecting their posting lists."""
+        rows = None
+        for player_id in self.vocabulary.ids(players, add=False).astype(np.int64):
+            if player_id == 0:
+                return np.array([], dtype=np.int64)
+            postings = self._posting_rows[self._offsets[player_id]:self._offsets[player_id + 1]]
+            rows = postings if rows is None else np.intersect1d(rows, postings, assume_unique=True)
+        return rows if rows is not None else np.arange(len(self.keys))
+
+    def members(self, rows):
+        """Returns the member players of the given rows as tuples (sorted by dense id)."""
+        return [tuple(name for name in self.vocabulary.names(ids) if name is not None) for ids in unpack_lineups(self.keys[rows])]
+
+def join_lineups(left_df, right_df, on=(), how='inner', vocabulary=None, lineup_col='Lineups', suffixes=('', '_right')):
+    """Joins two lineup tables on canonical lineup keys (plus any extra columns, i.e. TEAM), whatever each source's player order."""
+
+    vocabulary = vocabulary if vocabulary is not None else PlayerVocabulary()
+    left_df = left_df.assign(LINEUP_KEY=encode_lineups(left_df[lineup_col], vocabulary))
+    right_df = right_df.assign(LINEUP_KEY=encode_lineups(right_df[lineup_col], vocabulary))
+    return left_df.merge(right_df.drop(columns=[lineup_col]), on=['LINEUP_KEY'] + list(on), how=how, suffixes=suffixes)
@@ -0,0 +1,135 @@
+import logging
+import re
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+import numpy as np
+import pandas as pd
+
+# Defining the path for the persistent alias table (alternate / nick-names mapped to official NBA player ids)
+ALIAS_PATH = './player_aliases.csv'
+
+# Suffixes that sources inconsistently include (i.e. "Kenyon Martin Jr." vs "Kenyon Martin")
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+NGRAM_SIZE = 3
+
+def normalize_name(name):
+    """Converts a player name into a normalized key: accents, punctuation, casing & generational suffixes removed."""
+    name = unicodedata.normalize('NFKD', str(name)).encode('ascii', 'ignore').decode('ascii').lower()
+    tokens = re.sub(r"[^a-z0-9\s-]", '', name).replace('-', ' ').split()
+    return ' '.join(token for token in tokens if token not in NAME_SUFFIXES)
+
+def name_ngrams(key):
+    """Returns the set of padded character n-grams of a normalized name key."""
+    padded = f'  {key} '
+    return {padded[i:i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)}
+
+class PlayerIdentityResolver:
+    """Resolves player names from any source to integer NBA player ids, using aliases & an n-gram index for fuzzy matches."""
+
+    def __init__(self, players_df, aliases_df=None):
+        """Builds the exact-key lookup & n-gram inverted index from a dataframe of (player_id, name) records."""
+
+        # Active players first, so shared names resolve to the current player
+        if 'is_active' in players_df.columns:
+            players_df = players_df.sort_values('is_active', ascending=False, kind='stable')
+        self.ids = players_df['player_id'].astype('int64').values
+        self.names = players_df['name'].values
+        self.keys = [normalize_name(name) for name in self.names]
+
+        self._key_rows = {}
+        self._postings = defaultdict(list)
+        for row, key in enumerate(self.keys):
+            self._key_rows.setdefault(key, row)
+            for gram in name_ngrams(key):
+                self._postings[gram].append(row)
+        self._postings = {gram: np.array(rows, dtype=np.int64) for gram, rows in self._postings.items()}
+        self._gram_counts = np.array([len(name_ngrams(key)) for key in self.keys], dtype=np.int64)
+
+        self.aliases = {}
+        if aliases_df is not None:
+            for alias, player_id in zip(aliases_df['alias'], aliases_df['player_id']):
+                self.aliases[normalize_name(alias)] = int(player_id)
+
+    @classmethod
+    def from_nba_api(cls, alias_path=ALIAS_PATH):
+        """Builds the resolver from nba_api's static (offline) player list & the persisted alias table."""
+        from nba_api.stats.static import players
+        players_df = pd.DataFrame(players.get_players()).rename(columns={'id': 'player_id', 'full_name': 'name'})
+        return cls(players_df, load_aliases(alias_path))
+
+    @classmethod
+    def from_aliases(cls, alias_path=ALIAS_PATH):
+        """Builds the resolver from the persisted alias table alone (offline runs without nba_api), aliases doubling as names."""
+        aliases_df = load_aliases(alias_path)
+        players_df = pd.DataFrame({'player_id': aliases_df['player_id'].astype('int64'), 'name': aliases_df['alias']})
+        return cls(players_df, aliases_df)
+
+    def resolve(self, name, cutoff=0.85, restrict_to=None):
+        """Returns the player id for an input name (None if no match clears the cutoff), optionally among given ids."""
+
+        key = normalize_name(name)
+        allowed = None if restrict_to is None else set(int(player_id) for player_id in restrict_to)
+
+        # Exact alias or normalized-name hits don't need any fuzzy scoring
+        if key in self.aliases and (allowed is None or self.aliases[key] in allowed):
+            return self.aliases[key]
+        row = self._key_rows.get(key)
+        if row is not None and (allowed is None or self.ids[row] in allowed):
+            return int(self.ids[row])
+
+        for row, score in self._candidates(key, allowed):
+            if score >= cutoff:
+                return int(self.ids[row])
+        return None
+
+    def resolve_many(self, names, cutoff=0.85, restrict_to=None):
+        """Resolves a sequence of names (each distinct name only once) into an array of player ids (-1 if unresolved)."""
+        names = pd.Series(names)
+        resolved = {name: self.resolve(name, cutoff, restrict_to) for name in names.dropna().unique()}
+        return names.map(resolved).fillna(-1).astype('int64').values
+
+    def similar_names(self, name, cutoff=0.85, limit=3):
+        """Returns up to `limit` indexed names similar to the input (excluding exact matches), best first."""
+        key = normalize_name(name)
+        return [self.names[row] for row, score in self._candidates(key)[:limit] if score >= cutoff and self.names[row] != name]
+
+    def add_alias(self, alias, player_id):
+        self.aliases[normalize_name(alias)] = int(player_id)
+
+    def save_aliases(self, path=ALIAS_PATH):
+        """Persists the alias table so manual fixes are reused by every later run & pipeline stage."""
+        aliases_df = pd.DataFrame(sorted(self.aliases.items()), columns=['alias', 'player_id'])
+        aliases_df.to_csv(path, sep=',', index=False)
+
+    def _candidates(self, key, allowed=None, n_candidates=10):
+        """Scores only names sharing n-grams with the key (via the inverted index), best ratio first."""
+
+        grams = name_ngrams(key)
+        postings = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not postings:
+            return []
+
+        # Rank rows by their Dice coefficient over shared n-grams, then verify the best few with a full sequence ratio
+        rows, shared = np.unique(np.concatenate(postings), return_counts=True)
+        dice = 2 * shared / (len(grams) + self._gram_counts[rows])
+        top = rows[np.argsort(-dice, kind='stable')]
+        if allowed is not None:
+            top = top[np.isin(self.ids[top], list(allowed))]
+
+        scored = [(row, SequenceMatcher(None, key, self.keys[row]).ratio()) for row in top[:n_candidates]]
+        return sorted(scored, key=lambda item: -item[1])
+
+def load_aliases(path=ALIAS_PATH):
+    """Loads the alias table, returning an empty table if it hasn't been created yet."""
+    try:
+        return pd.read_csv(path, sep=',', header=0)
+    except FileNotFoundError:
+        logging.warning(f'No alias table found at {path}; resolving with official names only.')
+        return pd.DataFrame(columns=['alias', 'player_id'])
+
+def find_duplicate_names(names, cutoff=0.85):
+    """Flags names that are near-duplicates of other names in the same list (using the n-gram index, not a full scan)."""
+    unique_names = pd.Series(names).dropna().unique()
+    resolver = PlayerIdentityResolver(pd.DataFrame({'player_id': np.arange(len(unique_names)), 'name': unique_names}))
+    return {name: matches for name in unique_names if (matches := resolver.similar_names(name, cutoff))}
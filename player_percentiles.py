@@ -0,0 +1,136 @@
+import argparse
+import logging
+import numpy as np
+import pandas as pd
+from feature_store import FeatureStore, FEATURE_STORE_DIR, _file_sha256
+from player_identity import normalize_name
+
+# Defining the cleaned player statistics of each season (one table per season, so seasons rebuild independently)
+SEASON_SOURCES = {'2021-22': './cln_comprehensive_stats.csv'}
+LATEST_SEASON = max(SEASON_SOURCES)
+
+# Text columns carried as row labels alongside the percentile & rank matrices
+LABEL_COLS = ['PLAYER', 'POS', 'TEAM']
+
+# Stats where a lower value is better (turnovers, blocked shots & opponents' shooting when defended), ranked in reverse
+OPP_FG_PCT_COLS = [f'opp_{kind}_FG%' for kind in ['RA', 'PT_nonRA', 'MR', 'Corner3', 'ATB3', 'iso', 'pnrbh', 'pnrrm',
+                                                    'postup', 'spotup', 'handoff', 'offscrn']]
+LOWER_IS_BETTER = {'TOV/POSS', '%BLKA', 'Opp2P%', 'Opp3P%', *OPP_FG_PCT_COLS}
+
+# Stats shown as percentile badges by default (the profiler's PLAYER INSIGHTS section)
+DEFAULT_BADGE_STATS = ['PTS/POSS', '%AST', '%REB', 'TOV/POSS', '3P%', 'STL/MIN']
+
+def percentile_table_name(season):
+    return f'percentiles_{season}'
+
+def rank_table_name(season):
+    return f'league_ranks_{season}'
+
+def percentile_ranks(player_df):
+    """Ranks every numeric feature of a season's player table at once.
+
+    Returns (percentiles, league ranks) dataframes: percentiles are the % of players at or below each value (0-100,
+    as scipy's percentileofscore(kind='weak')), and ranks count from 1 for the league's highest value (ties share the
+    best rank). Stats in LOWER_IS_BETTER are reversed: their percentiles are the % of players at or above each value,
+    and rank 1 is the league's lowest value. Missing values stay missing and are excluded from every count.
+    """
+
+    label_cols = [col for col in LABEL_COLS if col in player_df.columns]
+    feature_cols = [col for col in player_df.columns if col not in label_cols and not str(col).startswith('Unnamed')
+                    and pd.api.types.is_numeric_dtype(player_df[col])]
+    features_df = player_df[feature_cols]
+    lower_cols = [col for col in feature_cols if col in LOWER_IS_BETTER]
+
+    pct_df = (features_df.rank(method='max', pct=True) * 100).round(1)
+    rank_df = features_df.rank(method='min', ascending=False)
+    pct_df[lower_cols] = (features_df[lower_cols].rank(method='max', pct=True, ascending=False) * 100).round(1)
+    rank_df[lower_cols] = features_df[lower_cols].rank(method='min', ascending=True)
+    labels_df = player_df[label_cols].reset_index(drop=True)
+    return (pd.concat([labels_df, pct_df.reset_index(drop=True)], axis=1),
+            pd.concat([labels_df, rank_df.reset_index(drop=True)], axis=1))
+
+def build_percentiles(store, season_sources=SEASON_SOURCES, force=False):
+    """Publishes the percentile & rank tables of every season whose source changed (or all of them if force=True).
+
+    Unchanged seasons are skipped by comparing each source's hash with the one recorded in its stored table, and the
+    feature store carries their tables over to the new version untouched.
+    """
+
+    stored = set(store.table_names()) if store.current_version() is not None else set()
+    tables, sources = {}, {}
+    for season, path in season_sources.items():
+        pct_name, rank_name = percentile_table_name(season), rank_table_name(season)
+        if not force and {pct_name, rank_name} <= stored \
+                and store.load(pct_name).metadata['source_sha256'] == _file_sha256(path):
+            logging.info(f'LOG: [{season}] percentiles are up to date.')
+            continue
+
+        pct_df, rank_df = percentile_ranks(pd.read_csv(path, sep=',', header=0))
+        tables.update({pct_name: (pct_df, 'PLAYER'), rank_name: (rank_df, 'PLAYER')})
+        sources.update({pct_name: path, rank_name: path})
+        logging.info(f'LOG: [{season}] Ranked {pct_df.shape[1] - len(LABEL_COLS)} features over {len(pct_df)} players.')
+
+    if not tables:
+        return store.current_version()
+    return store.publish(tables, stage='player_percentiles', sources=sources)
+
+class PlayerPercentiles:
+    """Constant-time percentile & league-rank lookups for one season, over the memory-mapped feature store tables."""
+
+    def __init__(self, pct_table, rank_table):
+        """Instantiates the lookup from a season's percentile & rank tables (which share rows and columns)."""
+        self.pct_table = pct_table
+        self.rank_table = rank_table
+        self.stats = list(pct_table.columns)
+        self._rows = {normalize_name(player): row for row, player in enumerate(pct_table.labels['PLAYER'])}
+        self._cols = {stat: col for col, stat in enumerate(self.stats)}
+
+    @classmethod
+    def load(cls, season=LATEST_SEASON, store=None):
+        store = store if store is not None else FeatureStore()
+        return cls(store.load(percentile_table_name(season)), store.load(rank_table_name(season)))
+
+    @property
+    def n_players(self):
+        return len(self._rows)
+
+    def _position(self, player, stat):
+        row = self._rows.get(normalize_name(player))
+        if row is None:
+            raise KeyError(f'{player} has no percentiles for this season.')
+        return row, self._cols[stat]
+
+    def percentile(self, player, stat):
+        """Returns the % of the league the player's value of a stat is at least as good as (NaN if the player has no value)."""
+        row, col = self._position(player, stat)
+        return round(float(self.pct_table.values[row, col]), 1)  # Stored as float32
+
+    def rank(self, player, stat):
+        """Returns the player's league rank in a stat (1 = best, i.e. the lowest value of LOWER_IS_BETTER stats; NaN if the player has no value)."""
+        row, col = self._position(player, stat)
+        return float(self.rank_table.values[row, col])
+
+    def player_summary(self, player, stats=None):
+        """Returns a (stat x [PERCENTILE, RANK]) dataframe of the player's standing across stats (default: all)."""
+        row, _ = self._position(player, self.stats[0])
+        cols = np.array([self._cols[stat] for stat in (stats if stats is not None else self.stats)], dtype=np.int64)
+        return pd.DataFrame({'PERCENTILE': self.pct_table.values[row, cols].astype(np.float64).round(1),
+                             'RANK': self.rank_table.values[row, cols].astype(np.float64)},
+                            index=pd.Index([self.stats[col] for col in cols], name='STAT'))
+
+def main():
+    """Parses command-line options & rebuilds the percentile tables of every changed season."""
+
+    parser = argparse.ArgumentParser(description='Precomputes per-season player percentiles & league ranks.')
+    parser.add_argument('--store', default=FEATURE_STORE_DIR, help='feature store directory')
+    parser.add_argument('--season', nargs=2, action='append', metavar=('SEASON', 'PATH'),
+                        help=f'season & cleaned player statistics CSV (default: {SEASON_SOURCES})')
+    parser.add_argument('--force', action='store_true', help='rebuild every season even if its source is unchanged')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    season_sources = dict(args.season) if args.season else SEASON_SOURCES
+    build_percentiles(FeatureStore(args.store), season_sources, force=args.force)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+from archetype_clusterer import POSITION_GROUPS, UTIL_COLS
+from player_identity import normalize_name
+
+# Defining the paths for the cleaned player statistics & the archetype one-hots used as optional search filters
+PLAYER_STATS_PATH = './cln_comprehensive_stats.csv'
+CLUSTERS_PATH = './cln_clusters.csv'
+
+# Number of query rows scored per matrix product during league-wide batch queries (bounds the distance block's memory)
+QUERY_CHUNK_SIZE = 1024
+
+class PlayerSimilarityIndex:
+    """Brute-force (BLAS) nearest-neighbor index over the standardized player features, stored as float32."""
+
+    def __init__(self, player_df, feature_cols=None, archetypes=None):
+        """Standardizes the feature table once & precomputes the squared norms used by every distance computation."""
+
+        feature_cols = feature_cols if feature_cols is not None else [col for col in player_df.columns if col not in UTIL_COLS]
+        self.feature_cols = list(feature_cols)
+        self.players = player_df['PLAYER'].reset_index(drop=True)
+        self.positions = player_df['POS'].reset_index(drop=True) if 'POS' in player_df.columns else pd.Series('', index=self.players.index)
+        self.groups = self.positions.map(POSITION_GROUPS).fillna(self.positions)
+        self.archetypes = self.players.map(archetypes) if archetypes is not None else pd.Series(np.nan, index=self.players.index)
+
+        # Standardize features (missing values land on the league mean) & scale by feature count so distances read
+        # as the typical per-feature gap in standard deviations
+        X = player_df[self.feature_cols].to_numpy(dtype='float64')
+        mean, scale = np.nanmean(X, axis=0), np.nanstd(X, axis=0)
+        scale[~(scale > 0)] = 1.0
+        Z = np.nan_to_num((X - mean) / scale, nan=0.0) / np.sqrt(len(self.feature_cols))
+        self.matrix = np.ascontiguousarray(Z, dtype=np.float32)
+        self.sq_norms = (self.matrix ** 2).sum(axis=1)
+
+        # Integer codes let the position-group & archetype filters compare as plain integer arrays (-1: no archetype)
+        self._group_codes = pd.factorize(self.groups)[0]
+        self._archetype_codes = pd.factorize(self.archetypes)[0]
+        self._rows = {normalize_name(name): row for row, name in enumerate(self.players)}
+
+    @classmethod
+    def from_csv(cls, player_stats_path=PLAYER_STATS_PATH, clusters_path=CLUSTERS_PATH):
+        """Builds the index from the cleaned player statistics, labelling archetypes from the cluster one-hots if available."""
+        player_df = pd.read_csv(player_stats_path, sep=',', header=0)
+        archetypes = None
+        if clusters_path is not None:
+            try:
+                cls_df = pd.read_csv(clusters_path, sep=',', header=0, index_col='PLAYER')
+                archetypes = cls_df.idxmax(axis=1)[cls_df.sum(axis=1) > 0].to_dict()
+            except FileNotFoundError:
+                pass
+        return cls(player_df, archetypes=archetypes)
+
+    def row(self, player):
+        """Returns the index row of a player name (matched on normalized names), or None if the player isn't indexed."""
+        return self._rows.get(normalize_name(player))
+
+    def query(self, player, k=5, same_group=False, same_archetype=False):
+        """Returns the k most similar players to the input player, optionally within its position group or archetype."""
+
+        row = self.row(player)
+        if row is None:
+            raise KeyError(f'{player} is not in the similarity index.')
+        distances, neighbors = self._top_k(np.array([row]), k, same_group, same_archetype)
+        return self._results(np.array([row]), distances, neighbors).drop(columns=['PLAYER'])
+
+    def batch_query(self, players=None, k=5, same_group=False, same_archetype=False):
+        """Returns the k most similar players for many players at once (default: the whole league) in long format."""
+
+        if players is None:
+            rows = np.arange(len(self.players))
+        else:
+            rows = [self.row(player) for player in players]
+            missing = [player for player, row in zip(players, rows) if row is None]
+            if missing:
+                raise KeyError(f'Players not in the similarity index: {missing}')
+            rows = np.array(rows, dtype=np.int64)
+
+        results = []
+        for start in range(0, len(rows), QUERY_CHUNK_SIZE):
+            chunk = rows[start:start + QUERY_CHUNK_SIZE]
+            results.append(self._results(chunk, *self._top_k(chunk, k, same_group, same_archetype)))
+        return pd.concat(results, ignore_index=True)
+
+    def _top_k(self, rows, k, same_group, same_archetype):
+        """Scores the query rows against every indexed player with one matrix product & partially sorts the top k."""
+
+        # Squared euclidean distances via ||q||^2 - 2 q.x + ||x||^2
+        sq_distances = self.sq_norms[rows, None] - 2 * self.matrix[rows] @ self.matrix.T + self.sq_norms[None, :]
+        sq_distances[np.arange(len(rows)), rows] = np.inf  # A player is never their own match
+
+        if same_group:
+            codes = self._group_codes
+            sq_distances[codes[rows][:, None] != codes[None, :]] = np.inf
+        if same_archetype:
+            codes = self._archetype_codes
+            sq_distances[(codes[rows][:, None] != codes[None, :]) | (codes[rows][:, None] < 0)] = np.inf
+
+        k = min(k, len(self.players) - 1)
+        neighbors = np.argpartition(sq_distances, k - 1, axis=1)[:, :k] if k > 0 else np.empty((len(rows), 0), dtype=np.int64)
+        order = np.argsort(np.take_along_axis(sq_distances, neighbors, axis=1), axis=1, kind='stable')
+        neighbors = np.take_along_axis(neighbors, order, axis=1)
+        distances = np.sqrt(np.maximum(np.take_along_axis(sq_distances, neighbors, axis=1), 0))
+        return distances, neighbors
+
+    def _results(self, rows, distances, neighbors):
+        """Flattens (query x k) neighbor arrays into a long dataframe, dropping slots excluded by the filters."""
+        valid = np.isfinite(distances).ravel()
+        matches = neighbors.ravel()[valid]
+        return pd.DataFrame({
+            'PLAYER': self.players.values[np.repeat(rows, neighbors.shape[1])[valid]],
+            'RANK': np.tile(np.arange(1, neighbors.shape[1] + 1), len(rows))[valid],
+            'MATCH': self.players.values[matches],
+            'POS': self.positions.values[matches],
+            'ARCHETYPE': self.archetypes.values[matches],
+            'DISTANCE': np.round(distances.ravel()[valid], 3),
+        })
+
+def main():
+    """Prints each player's closest statistical match across the league."""
+    index = PlayerSimilarityIndex.from_csv()
+    print(index.batch_query(k=1).to_string(index=False))
+
+if __name__ == '__main__':
+    main()
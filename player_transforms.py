@@ -0,0 +1,117 @@
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+
+# A group of attributes normalized by the same denominator, i.e. per-possession stats: (attr / POSS) * scale, named
+# by the format string (a suffix such as '{}/POSS' or a prefix such as '%{}')
+BasisTransform = namedtuple('BasisTransform', ['columns', 'denominator', 'scale', 'name_format', 'decimals'])
+
+BASIS_TRANSFORMS = [
+
+    # Offensive activity, converted to a per-possession basis
+    BasisTransform([
+        'PassesMade', 'PassesReceived', 'ScreenAssists', 'ASTAdj', 'TOV',
+        'PTS', 'DRIVES', 'ElbowTouches', 'PostUps', 'PaintTouches', 'Dist. Miles Off', 'Dist. Miles Def',
+    ], 'POSS', 1, '{}/POSS', 5),
+
+    # General & defensive activity, converted to a per-minute basis
+    BasisTransform([
+        'REB', 'Box Outs',
+        'STL', 'BLK', 'Deflections', 'Loose BallsRecovered', 'ChargesDrawn',
+        'Contested2PT Shots', 'Contested3PT Shots', 'OppTOV', 'OppPF', 'OppFTA',
+    ], 'MIN', 1, '{}/MIN', 5),
+
+    # Shot zones, shot styles & play types, as proportions of total FGA
+    BasisTransform([
+        'RA_FGA', 'PT_nonRA_FGA', 'MR_FGA', 'cns_2FGA', 'pullup_2FGA', 'Corner3_FGA', 'ATB3_FGA', 'cns_3PA', 'pullup_3PA',
+        'trsn_FGA', 'iso_FGA', 'pnrbh_FGA', 'pnrrm_FGA', 'postup_FGA', 'spotup_FGA', 'handoff_FGA', 'cuts_FGA',
+        'offscrn_FGA', 'putbk_FGA',
+    ], 'FGA', 1, '%{}', 5),
+
+    # Defended shot zones & play types, as proportions of total opponent FGA
+    BasisTransform([
+        'opp_RA_FGA', 'opp_PT_nonRA_FGA', 'opp_MR_FGA', 'opp_Corner3_FGA', 'opp_ATB3_FGA',
+        'opp_iso_FGA', 'opp_pnrbh_FGA', 'opp_pnrrm_FGA', 'opp_postup_FGA', 'opp_spotup_FGA', 'opp_handoff_FGA',
+        'opp_offscrn_FGA',
+    ], 'OppFGA', 1, '%{}', 5),
+]
+
+# (attempts, makes) pairs converted into efficiency percentages, named by swapping the attempt's trailing 'A' for '%'
+EFFICIENCY_PAIRS = [
+    ('FGA', 'FGM'), ('3PA', '3PM'), ('FTA', 'FTM'), ('OppFGA', 'OppFGM'), ('Opp3PA', 'Opp3PM'),
+    ('opp_RA_FGA', 'opp_RA_FGM'), ('opp_PT_nonRA_FGA', 'opp_PT_nonRA_FGM'), ('opp_MR_FGA', 'opp_MR_FGM'),
+    ('opp_Corner3_FGA', 'opp_Corner3_FGM'), ('opp_ATB3_FGA', 'opp_ATB3_FGM'), ('opp_iso_FGA', 'opp_iso_FGM'),
+    ('opp_pnrbh_FGA', 'opp_pnrbh_FGM'), ('opp_pnrrm_FGA', 'opp_pnrrm_FGM'), ('opp_postup_FGA', 'opp_postup_FGM'),
+    ('opp_spotup_FGA', 'opp_spotup_FGM'), ('opp_handoff_FGA', 'opp_handoff_FGM'), ('opp_offscrn_FGA', 'opp_offscrn_FGM'),
+]
+
+# Dribble & touch-time attempts combined into broader strata before conversion into proportions of total FGA
+COMBINED_FGA = {
+    '%dr_1_2_fga': ['dr_1_2FGA', 'dr_1_3PA', 'dr_2_2FGA', 'dr_2_3PA'],
+    '%dr_3plus_fga': ['dr_3_6_2FGA', 'dr_3_6_3PA', 'dr_7plus_2FGA', 'dr_7plus_3PA'],
+    '%tch_0_2_fga': ['tch_0_2_2FGA', 'tch_0_2_3PA'],
+    '%tch_2plus_fga': ['tch_2_6_2FGA', 'tch_2_6_3PA', 'tch_6plus_2FGA', 'tch_6plus_3PA'],
+}
+
+# Non-numeric player attributes that are never converted to floats
+TEXT_COLS = ['PLAYER', 'POS', 'TEAM']
+
+def clean_percent_columns(df):
+    """Converts every string-typed percentage column to floats at once, treating '-' as a missing value."""
+    pct_cols = [col for col in df.columns if '%' in col and not pd.api.types.is_numeric_dtype(df[col])]
+    if pct_cols:
+        df[pct_cols] = df[pct_cols].replace('-', np.nan).astype('float64')
+    return df
+
+def parse_heights(heights):
+    """Converts feet-inches height strings (i.e. '6-10') into float inches with vectorized string operations."""
+    parts = heights.astype(str).str.split('-', n=1, expand=True)
+    return parts[0].astype('float64') * 12 + parts[1].astype('float64')
+
+def to_float_columns(df, exclude=TEXT_COLS):
+    """Casts every remaining non-numeric column (apart from the text attributes) to floats in one step."""
+    obj_cols = [col for col in df.columns if not pd.api.types.is_numeric_dtype(df[col]) and col not in exclude]
+    if obj_cols:
+        df[obj_cols] = df[obj_cols].astype('float64')
+    return df
+
+def _divide(numerators, denominators, scale, decimals):
+    """Divides two aligned (player x attribute) blocks, keeping pandas' inf/NaN results for zero denominators."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.round(numerators / denominators * scale, decimals)
+
+def apply_basis_transforms(df, transforms=BASIS_TRANSFORMS):
+    """Applies each normalization group as a single 2-D division against its (broadcast) denominator column."""
+    for transform in transforms:
+        values = df[transform.columns].to_numpy(dtype='float64')
+        denominator = df[[transform.denominator]].to_numpy(dtype='float64')
+        new_cols = [transform.name_format.format(col) for col in transform.columns]
+        df[new_cols] = _divide(values, denominator, transform.scale, transform.decimals)
+    return df
+
+def apply_efficiency_transforms(df, pairs=EFFICIENCY_PAIRS):
+    """Computes every make/attempt efficiency percentage as one element-wise division of the two column blocks."""
+    attempts, makes = [list(cols) for cols in zip(*pairs)]
+    new_cols = [att_col[:-1] + '%' for att_col in attempts]
+    df[new_cols] = _divide(df[makes].to_numpy(dtype='float64'), df[attempts].to_numpy(dtype='float64'), 100, 2)
+    return df
+
+def apply_combined_transforms(df, combined=COMBINED_FGA):
+    """Sums each group of attempt columns & converts the totals into proportions of total FGA in one division."""
+    totals = np.column_stack([df[cols].to_numpy(dtype='float64').sum(axis=1) for cols in combined.values()])
+    df[list(combined)] = _divide(totals, df[['FGA']].to_numpy(dtype='float64'), 100, 2)
+    return df
+
+def transform_player_stats(df):
+    """Runs every per-basis, efficiency & combined transformation used by the processor on the player statistics."""
+
+    df = apply_basis_transforms(df)
+    df = apply_efficiency_transforms(df)
+    df = apply_combined_transforms(df)
+
+    # 2-pt efficiencies are derived from total & 3-pt makes and attempts (for both the player & their opponents)
+    makes = df[['FGM', 'OppFGM']].to_numpy(dtype='float64') - df[['3PM', 'Opp3PM']].to_numpy(dtype='float64')
+    attempts = df[['FGA', 'OppFGA']].to_numpy(dtype='float64') - df[['3PA', 'Opp3PA']].to_numpy(dtype='float64')
+    df[['2P%', 'Opp2P%']] = _divide(makes, attempts, 100, 2)
+
+    return df
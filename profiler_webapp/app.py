@@ -1,35 +1,28 @@
 ### ===================================== SETUP ===================================== ###
 ### ================================================================================= ###
 
-# Data Source
-from nba_api.stats.static import players
+# Settings (paths & JSON assets are resolved once, SEE SUBMODULE 'pp_config.py' FOR DETAILS)
+from submodules.pp_config import LOGO_PATH, STATIC_PLAYER_DATA_PATH, PLAYER_STATS_PATH, PLAYER_CLUSTERS_PATH, FEATURE_STORE_PATH
+from submodules.pp_config import SHOT_ARCHIVE_DIR, ZONE_SUMMARY_DIR
+from submodules.pp_config import get_sc_params, timed_import, import_report
+from submodules.pp_instrumentation import recorder, span
 
 # Data Management
-import json
-import numpy as np
-import pandas as pd
+with timed_import('Data Management'):
+    import json
+    import pandas as pd
 
 # Visualization
-import matplotlib.pyplot as plt
-import seaborn as sns
-import streamlit as st
-from streamlit.components.v1 import html
-from st_tabs import TabBar
-
-# Project Modules
-from submodules.pp_fetch_bio_info import PlayerInfoFetcher
-from submodules.pp_scrape_bio_desc import PlayerBioScraper
-from submodules.pp_fetch_off_stats import PlayerCareerStatsFetcher
-from submodules.pp_generate_shot_charts import ShotChartGenerator
-from utils.pp_md_templates import get_welcome_pg_html, progress_tracker, get_pp_header_html, get_pp_tab_html, get_player_bio_subtitle
-from utils.pp_md_templates import get_pp_bio_leftcol_html, get_pp_bio_rightcol_html, get_pp_tab_header, highlight_border_selected_rows
-
-# Utils
-from IPython.display import display, HTML, IFrame, Image
-import os
-import requests
-import sys
-import time
+with timed_import('Visualization'):
+    import streamlit as st
+    from streamlit.components.v1 import html
+
+# Project Modules (data-source & chart modules are imported by the Player Profiler only, SEE 'PLAYER PROFILE TOOL')
+with timed_import('Project Modules'):
+    from submodules.pp_profile_loader import ProfileLoader, RateLimiter
+    from submodules.pp_cache import PolicyCache, current_season
+    from utils.pp_md_templates import get_welcome_pg_html, progress_tracker, get_pp_header_html, get_pp_tab_html, get_player_bio_subtitle
+    from utils.pp_md_templates import get_pp_bio_leftcol_html, get_pp_bio_rightcol_html, get_pp_tab_header, highlight_border_selected_rows
 
 # Settings
 st.set_page_config(
@@ -52,46 +45,104 @@ st.markdown(
     </style>""",
     unsafe_allow_html=True
 )
-cwd = os.getcwd()
-while not cwd.endswith('NBA-Profiler'):
-    cwd = os.path.dirname(cwd)
-sys.path.append(cwd)
+# Shared request budget for all (concurrent) NBA-API & nba.com fetches
+REQUEST_INTERVAL = 0.5
 
-# Define paths (relative to user OS) for files to be used
-LOGO_PATH = os.path.join(cwd, './utils/images/sb_logo_dark_no_bg.png')
-SHOT_FILTER_PARAMS_PATH = os.path.join(cwd, './utils/shot_chart_params.json')
-STATIC_PLAYER_DATA_PATH = os.path.join(cwd, './data/static_player_data.pkl')
-TEAM_INFO_PATH = os.path.join(cwd, './data/nba_teams.json')
 
-# Pre-Requisite file loading
-with open(TEAM_INFO_PATH, 'r') as f:
-    nba_teams = json.load(f)
-with open(SHOT_FILTER_PARAMS_PATH, 'r') as f:
-    sc_params = json.load(f)
-static_player_data = pd.read_pickle(STATIC_PLAYER_DATA_PATH)
+### CACHED FUNCTIONS -- SEE SUBMODULES FOR DETAILED IMPLEMENTATIONS
 
+@st.cache_resource
+def load_static_player_data():
+    with timed_import('static_player_data.pkl'):
+        return pd.read_pickle(STATIC_PLAYER_DATA_PATH)
 
-### CACHED FUNCTIONS -- SEE SUBMODULES FOR DETAILED IMPLEMENTATIONS
+@st.cache_resource
+def get_request_limiter():
+    return RateLimiter(min_interval=REQUEST_INTERVAL)  # One budget per server process, shared by every session
+
+@st.cache_resource
+def get_profile_loader():
+    return ProfileLoader()
+
+@st.cache_resource
+def get_prefetch_loader():
+    return ProfileLoader(max_workers=1)  # Single background worker, so prefetches never crowd out requested data
 
-@st.cache_data
+@st.cache_resource
+def get_profile_cache():
+    return PolicyCache()  # Bounded by per-fetch entry limits, TTLs & a memory budget (SEE SUBMODULE 'pp_cache.py' FOR DETAILS)
+
+request_limiter = get_request_limiter()
+profile_loader = get_profile_loader()
+prefetch_loader = get_prefetch_loader()
+profile_cache = get_profile_cache()
+
+# Fetches run in the profile loader's worker threads, so spinners are drawn by the caller instead (see 'load_profile_data')
+@profile_cache.cached('player_info')
 def fetch_player_info(player_id):
-    return PlayerInfoFetcher().fetch_player_info(player_id)
+    return PlayerInfoFetcher(rate_limiter=request_limiter).fetch_player_info(player_id)
 
-@st.cache_data
+@profile_cache.cached('player_awards')
 def fetch_player_awards(player_id):
-    return PlayerInfoFetcher().fetch_player_awards(player_id)
+    return PlayerInfoFetcher(rate_limiter=request_limiter).fetch_player_awards(player_id)
 
-@st.cache_data
+@profile_cache.cached('player_bio')
 def fetch_player_bio(player_id):
-    return PlayerBioScraper().fetch_player_bio(player_id)
+    return PlayerBioScraper(rate_limiter=request_limiter).fetch_player_bio(player_id)
 
-@st.cache_data
+@profile_cache.cached('career_stats')
 def fetch_career_stats(player_id):
-    return PlayerCareerStatsFetcher().fetch_career_stats(player_id)
-
-@st.cache_data
-def fetch_total_shot_data(player_id, seasons):
-    return ShotChartGenerator().fetch_total_shot_data(player_id, seasons)
+    return PlayerCareerStatsFetcher(rate_limiter=request_limiter).fetch_career_stats(player_id)
+
+@profile_cache.cached('season_shot_data')
+def fetch_season_shot_data(player_id, season):
+    return ShotChartGenerator(rate_limiter=request_limiter).fetch_season_shot_data(player_id, season)
+
+def fetch_player_headshot(player_id):
+    return ShotChartGenerator().fetch_player_headshot(player_id)  # Kept (pre-decoded) in the local asset store
+
+def submit_profile_fetch(key, fetch_fn, *args):
+    """Starts a (cached) fetch in the background, once per session & key; its future is kept in the session state."""
+    futures = st.session_state.setdefault('profile_futures', {})
+    return profile_loader.submit(futures, key, fetch_fn, *args)
+
+def load_profile_data(key, message='Loading...', default=None):
+    """Waits (with a spinner) for a previously submitted fetch & returns its result."""
+    with st.spinner(message), span(f'wait.{key[0]}'):  # Time the page spends blocked on the fetch
+        return profile_loader.resolve(st.session_state['profile_futures'][key], default=default)
+
+def submit_shot_data_fetch(player_id, seasons):
+    """Starts the per-season shot data fetches; seasons fetched (or prefetched) before are reused rather than refetched."""
+    for season in seasons:
+        submit_profile_fetch(('season_shots', player_id, season), fetch_season_shot_data, player_id, season)
+
+def load_total_shot_data(player_id, seasons):
+    """Assembles the multi-season shot data from the per-(player, season) pieces."""
+    season_shot_data = [load_profile_data(('season_shots', player_id, season), f'Loading {season} shot data...') for season in seasons]
+    if any(shot_data is None for shot_data in season_shot_data):
+        st.error('Shot data could not be loaded. Please try again.')
+        st.stop()
+    return ShotChartGenerator().combine_season_shot_data(season_shot_data)
+
+def prefetch_profile_data(player_id, season_options, selected_seasons):
+    """Warms the data a user is likely to need next (adjacent seasons' shot data & the headshot) in a background thread."""
+    futures = st.session_state.setdefault('profile_futures', {})
+    prefetch_loader.submit(futures, ('headshot', player_id), fetch_player_headshot, player_id)
+    prefetch_loader.prefetch_seasons(futures, player_id, season_options, selected_seasons, fetch_season_shot_data)
+
+@st.cache_resource
+def load_similarity_index():
+    return PlayerSimilarityIndex.from_csv(PLAYER_STATS_PATH, PLAYER_CLUSTERS_PATH)
+
+@st.cache_resource
+def load_player_percentiles():
+    return PlayerPercentiles.load(store=FeatureStore(FEATURE_STORE_PATH))
+
+@st.cache_resource
+def load_zone_summaries():
+    zone_summaries = ZoneSummaries(ShotArchive(SHOT_ARCHIVE_DIR), ZONE_SUMMARY_DIR)
+    zone_summaries.refresh()  # Only seasons re-archived since the last build are recomputed
+    return zone_summaries
 
 ### ================================================================================= ###
 ### ================================================================================= ###
@@ -156,6 +207,22 @@ if tool == '':
 
 if tool == 'Player Profiler':
 
+    # Deferred imports (only needed once the profiler is launched)
+    with timed_import('Player Profiler Modules'):
+        from nba_api.stats.static import players
+        from submodules.pp_fetch_bio_info import PlayerInfoFetcher
+        from submodules.pp_scrape_bio_desc import PlayerBioScraper
+        from submodules.pp_fetch_off_stats import PlayerCareerStatsFetcher
+        from submodules.pp_generate_shot_charts import ShotChartGenerator
+        from submodules.pp_http import route_nba_api_requests
+        from player_similarity import PlayerSimilarityIndex
+        from player_percentiles import PlayerPercentiles, DEFAULT_BADGE_STATS
+        from feature_store import FeatureStore
+        from shot_archive import ShotArchive
+        from zone_summaries import ZoneSummaries
+    route_nba_api_requests()  # nba_api endpoint calls share the pooled keep-alive session (if supported)
+    static_player_data = load_static_player_data()
+
     # Retrieve sorted list of active NBA players and set up user options
     active_players_df = pd.DataFrame(players.get_active_players())  # STATIC API
     player_names = active_players_df.sort_values('first_name', ascending=True)['full_name'].tolist()
@@ -174,10 +241,14 @@ if tool == 'Player Profiler':
             bio_desc = static_player_data.loc[static_player_data.id == player_id, 'player_bio_desc'].iloc[0]
 
         # If static data unavailable, use API sources (SEE SUBMODULES 'pp_fetch_bio_info.py' & 'pp_scrape_bio_desc.py' FOR DETAILS)
+        # The independent fetches run concurrently; the bio is only collected once its tab renders
         else:
-            player_info = fetch_player_info(player_id)
-            player_awards = fetch_player_awards(player_id)
-            bio_desc = fetch_player_bio(player_id)
+            submit_profile_fetch(('player_info', player_id), fetch_player_info, player_id)
+            submit_profile_fetch(('player_awards', player_id), fetch_player_awards, player_id)
+            submit_profile_fetch(('bio_desc', player_id), fetch_player_bio, player_id)
+            player_info = load_profile_data(('player_info', player_id), 'Loading player info...', default={})
+            player_awards = load_profile_data(('player_awards', player_id), 'Loading player awards...', default={})
+            bio_desc = None  # Collected by the bio tab
 
         team_colors = player_info['current_team_colors']  # To be used for color scheme in app design
 
@@ -185,8 +256,10 @@ if tool == 'Player Profiler':
         pp_md_header_content = get_pp_header_html(player_id, player_info, player_awards)  # SEE SUBMODULE 'pp_md_templates.py' FOR DETAILS
         st.markdown(pp_md_header_content, unsafe_allow_html=True)
 
-        # Set up distinct tabs for each exploration, with custom markdown
-        tabs = st.tabs(['**PLAYER BIO**', '**OFFENSIVE PROFILE**', '**DEFENSIVE PROFILE**', '**PLAYER EVOLUTION**', '**PLAYER INSIGHTS**'])
+        # Set up a tab bar for each exploration, with custom markdown (only the selected tab's section is computed & rendered)
+        tab_names = ['PLAYER BIO', 'OFFENSIVE PROFILE', 'DEFENSIVE PROFILE', 'PLAYER EVOLUTION', 'PLAYER INSIGHTS']
+        selected_tab = st.segmented_control('Profile Section', tab_names, default=tab_names[0], key='pp_selected_tab',
+                                            label_visibility='collapsed') or tab_names[0]
         pp_md_tab_content = get_pp_tab_html(team_colors)  # SEE SUBMODULE 'pp_md_templates.py' FOR DETAILS
         st.markdown(pp_md_tab_content, unsafe_allow_html=True)
 
@@ -207,18 +280,48 @@ if tool == 'Player Profiler':
 
         ### DEBUG MODE -- TO BE DELETED(?)
         st.sidebar.markdown('<div style="padding-top: 750px; padding-bottom: 0px"></div>', unsafe_allow_html=True)  # Spacing
-        if st.sidebar.button('Clear Cache & Refresh Stats', width=200):
-            st.cache_data.clear()  # Clears all st.cache_data decorators
-            st.cache_resource.clear()  # Clears all st.cache_resource decorators
+        if st.sidebar.button('Refresh Player Stats', width=200):
+            profile_cache.invalidate(player_id=player_id)  # Only this player's cached data (other users' caches are kept)
+            st.session_state.pop('profile_futures', None)  # Drops this session's in-flight/completed fetches
+
+        # Hidden performance panel (append '?debug=1' to the app URL)
+        if st.query_params.get('debug') == '1':
+            with st.sidebar.expander('Performance', expanded=True):
+                st.dataframe(pd.DataFrame.from_dict(recorder.summary(), orient='index'))
+                st.download_button('Spans (JSON)', recorder.to_json(), file_name='pp_spans.json', mime='application/json')
+                st.download_button('Spans (Prometheus)', recorder.to_prometheus(), file_name='pp_spans.prom', mime='text/plain')
+                if st.button('Reset Spans'):
+                    recorder.reset()
+            with st.sidebar.expander('Cache'):
+                st.write(f'{profile_cache.memory_mb} of {profile_cache.memory_budget / (1024 * 1024):.0f} MB in use')
+                st.dataframe(pd.DataFrame.from_dict(profile_cache.usage(), orient='index'))
+                invalidations = {
+                    'Invalidate Player': lambda: profile_cache.invalidate(player_id=player_id),
+                    'Invalidate Selected Seasons': lambda: sum(profile_cache.invalidate(season=season) for season in selected_seasons),
+                    f'Invalidate {current_season()} Season': profile_cache.invalidate_current_season,
+                    'Invalidate All': profile_cache.invalidate,
+                }
+                for label, invalidate in invalidations.items():
+                    if st.button(label):
+                        st.toast(f'Dropped {invalidate()} cached entries.')
+                        st.session_state.pop('profile_futures', None)
+            with st.sidebar.expander('Import Times'):
+                st.code(import_report())
 
 
 
         # Set up sequence of events after user/auto selects season(s)
         if selected_seasons:
 
+            # Start the offensive profile's fetches & warm likely-next data as soon as the player/seasons are selected,
+            # whichever tab is shown (only rendering is deferred to the tabs, SEE 'prefetch_profile_data')
+            submit_profile_fetch(('career_stats', player_id), fetch_career_stats, player_id)
+            submit_shot_data_fetch(player_id, selected_seasons)
+            prefetch_profile_data(player_id, season_options, selected_seasons)
+
             ### ============================== BIO TAB ============================== ###
             ### ===================================================================== ###
-            with tabs[0]:
+            if selected_tab == 'PLAYER BIO':
 
                 @st.fragment
                 def config_pp_bio_tab():
@@ -244,15 +347,18 @@ if tool == 'Player Profiler':
                         st.markdown(pp_md_bio_title_content, unsafe_allow_html=True)
                         st.markdown('<div style="padding-top: 15px;"></div>', unsafe_allow_html=True)  # Spacing
 
-                        # Section Content
-                        html(bio_desc, height=1085, scrolling=True)
+                        # Section Content (the scraped bio may still be arriving if it wasn't available statically)
+                        if bio_desc is None:
+                            html(load_profile_data(('bio_desc', player_id), 'Loading player bio...', default=''), height=1085, scrolling=True)
+                        else:
+                            html(bio_desc, height=1085, scrolling=True)
 
                 config_pp_bio_tab()
 
 
             ### ============================== OP TAB ============================== ###
             ### ==================================================================== ###
-            with tabs[1]:
+            elif selected_tab == 'OFFENSIVE PROFILE':
 
                 # Output section title/header
                 pp_op_header_html = get_pp_tab_header('OFFENSIVE PROFILE', team_colors)  # SEE SUBMODULE 'pp_md_templates.py' FOR DETAILS
@@ -266,7 +372,7 @@ if tool == 'Player Profiler':
                 def config_pp_career_table():
 
                     # Retrieve offensive career (per-game, per-36) statistics (SEE SUBMODULE 'pp_fetch_off_stats.py' FOR DETAILS)
-                    per_game_rs_df, per_game_ps_df, per_36_rs_df, per_36_ps_df = fetch_career_stats(player_id)
+                    per_game_rs_df, per_game_ps_df, per_36_rs_df, per_36_ps_df = load_profile_data(('career_stats', player_id), 'Loading career stats...')
 
                     with st.expander('Career Overview', expanded=True, ):
                         # Create columns to designate dropdown menus on the side and chart title in the middle
@@ -301,13 +407,14 @@ if tool == 'Player Profiler':
                 def config_pp_scoring_prof():
 
                     # Gather baseline shot data w/o any adv filters (SEE SUBMODULES 'pp_generate_shot_charts.py' FOR DETAILS)
-                    total_plyr_shot_data, total_league_shot_data, game_log = fetch_total_shot_data(player_id, selected_seasons)
+                    total_plyr_shot_data, total_league_shot_data, game_log = load_total_shot_data(player_id, selected_seasons)
 
                     # Set up subsection title and high-level button setup in columns
                     st.markdown('<h4 style="text-align: center;">Scoring Profile</h4>', unsafe_allow_html=True)
                     st.markdown('<div style="margin-bottom: 0px;"></div>', unsafe_allow_html=True)  # Spacing
 
                     # Set up filter options
+                    sc_params = get_sc_params()
                     col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
 
                     with col1:
@@ -345,7 +452,8 @@ if tool == 'Player Profiler':
                     # Generate default (cumulative season) shot chart, if button unpressed
                     if not regenerate_shot_chart:
                         ax = ShotChartGenerator().plot_shot_data(player_id, total_plyr_shot_data, total_league_shot_data, selected_sc_type, team_colors)
-                        st.pyplot(ax.figure)
+                        with span('render.st_pyplot'):  # Figure serialization & transfer
+                            st.pyplot(ax.figure)
 
                     # Generate filtered shot chart, if button pressed
                     elif regenerate_shot_chart:
@@ -370,11 +478,31 @@ if tool == 'Player Profiler':
                         filtered_plyr_shot_data, filtered_league_shot_data = SCG.fetch_filtered_shot_data(player_id, selected_seasons, filters=filters)
 
                         ax = SCG.plot_shot_data(player_id, filtered_plyr_shot_data, filtered_league_shot_data, selected_sc_type, team_colors)
-                        st.pyplot(ax.figure)
+                        with span('render.st_pyplot'):  # Figure serialization & transfer
+                            st.pyplot(ax.figure)
 
                 config_pp_scoring_prof()
 
 
+                ### SHOT ZONES ###
+                ### ========== ###
+
+                @st.fragment
+                def config_pp_shot_zones():
+
+                    # Retrieve the materialized zone splits of the archived seasons (SEE MODULE 'zone_summaries.py' FOR DETAILS)
+                    zones_df = load_zone_summaries().player_zones(player_id, selected_seasons)
+                    if zones_df is None:
+                        st.info('Shot zones are available for archived seasons only (run shot_archive.py, then zone_summaries.py).')
+                        return
+
+                    with st.expander('Shot Zones vs League', expanded=True):
+                        st.markdown('<h4 style="text-align: center;">Shot Zones vs League</h4>', unsafe_allow_html=True)  # Subsection Title
+                        st.dataframe(zones_df, hide_index=True)
+
+                config_pp_shot_zones()
+
+
 
 
 
@@ -392,7 +520,7 @@ if tool == 'Player Profiler':
 
             ### ============================== DP TAB ============================== ###
             ### ==================================================================== ###
-            with tabs[2]:
+            elif selected_tab == 'DEFENSIVE PROFILE':
 
                 # Retrieve shot data (SEE SUBMODULE 'pp_fetch_shot_data.py' FOR DETAILS)
                 # per_game_rs_df, per_game_ps_df, per_36_rs_df, per_36_ps_df = fetch_career_stats(player_id)
@@ -413,7 +541,7 @@ if tool == 'Player Profiler':
 
             ### ============================== PE TAB ============================== ###
             ### ==================================================================== ###
-            with tabs[3]:
+            elif selected_tab == 'PLAYER EVOLUTION':
 
                 # Output section title/header
                 pp_pe_header_html = get_pp_tab_header('PLAYER EVOLUTION', team_colors)  # SEE SUBMODULE 'pp_md_templates.py' FOR DETAILS
@@ -427,13 +555,75 @@ if tool == 'Player Profiler':
 
             ### ============================= MISC TAB ============================= ###
             ### ==================================================================== ###
-            with tabs[4]:
+            elif selected_tab == 'PLAYER INSIGHTS':
 
                 # Output section title/header
                 pp_misc_header_html = get_pp_tab_header('PLAYER INSIGHTS', team_colors)  # SEE SUBMODULE 'pp_md_templates.py' FOR DETAILS
                 st.markdown(pp_misc_header_html, unsafe_allow_html=True)
 
 
+                ### SIMILAR PLAYERS ###
+                ### =============== ###
+
+                @st.fragment
+                def config_pp_similar_players():
+
+                    # Retrieve the (cached) league-wide similarity index (SEE MODULE 'player_similarity.py' FOR DETAILS)
+                    similarity_index = load_similarity_index()
+
+                    st.markdown('<h4 style="text-align: center;">Similar Players</h4>', unsafe_allow_html=True)  # Subsection Title
+
+                    # Only players within the cleaned statistical dataset have a profile to compare against
+                    if similarity_index.row(selected_player) is None:
+                        st.info(f'{selected_player} is not part of the statistical profile dataset yet.')
+                        return
+
+                    # Set up comparison scope and result-count options
+                    col1, col2 = st.columns([1, 1])
+                    with col1:
+                        selected_scope = st.selectbox('Compare Against', ['All Players', 'Same Position Group', 'Same Archetype'], index=0)
+                    with col2:
+                        num_similar = st.slider('Number of Players', min_value=1, max_value=15, value=5)
+
+                    similar_df = similarity_index.query(selected_player, k=num_similar,
+                                                        same_group=(selected_scope == 'Same Position Group'),
+                                                        same_archetype=(selected_scope == 'Same Archetype'))
+                    st.dataframe(similar_df, hide_index=True)
+
+                config_pp_similar_players()
+
+
+                ### LEAGUE PERCENTILES ###
+                ### ================== ###
+
+                @st.fragment
+                def config_pp_league_percentiles():
+
+                    # Retrieve the precomputed percentile & rank tables (SEE MODULE 'player_percentiles.py' FOR DETAILS)
+                    try:
+                        player_percentiles = load_player_percentiles()
+                    except FileNotFoundError:
+                        st.info('League percentiles have not been built yet (run player_percentiles.py).')
+                        return
+
+                    st.markdown('<h4 style="text-align: center;">Percentile vs League</h4>', unsafe_allow_html=True)  # Subsection Title
+
+                    try:
+                        summary_df = player_percentiles.player_summary(selected_player)
+                    except KeyError:
+                        st.info(f'{selected_player} is not part of the statistical profile dataset yet.')
+                        return
+
+                    default_stats = [stat for stat in DEFAULT_BADGE_STATS if stat in player_percentiles.stats]
+                    selected_stats = st.multiselect('Statistics', player_percentiles.stats, default=default_stats)
+                    badge_cols = st.columns(3)
+                    for i, stat in enumerate(selected_stats):
+                        badge_cols[i % 3].metric(stat, f'{summary_df.PERCENTILE[stat]:.0f}th pct',
+                                                 f'Rank {summary_df.RANK[stat]:.0f} of {player_percentiles.n_players}', delta_color='off')
+
+                config_pp_league_percentiles()
+
+
 
 
 
@@ -0,0 +1,221 @@
+### =========================== SETUP =========================== ###
+
+# Concurrency
+import threading
+
+# Utils
+from collections import OrderedDict
+from datetime import date
+from functools import wraps
+import os
+import time
+
+# Instrumentation
+from submodules.pp_instrumentation import span, mark_cache_miss, payload_bytes  # Span recording (SEE SUBMODULE 'pp_instrumentation.py' FOR DETAILS)
+
+### ============================================================= ###
+
+
+
+
+
+### CACHE POLICIES (per cached fetch: entry limit, time-to-live & the arguments entries are tagged by)
+
+HOUR = 60 * 60
+CACHE_POLICIES = {
+    'player_info': {'max_entries': 500, 'ttl': 24 * HOUR, 'tags': ('player_id',)},
+    'player_awards': {'max_entries': 500, 'ttl': 7 * 24 * HOUR, 'tags': ('player_id',)},
+    'player_bio': {'max_entries': 500, 'ttl': 7 * 24 * HOUR, 'tags': ('player_id',)},
+    'career_stats': {'max_entries': 300, 'ttl': 12 * HOUR, 'tags': ('player_id',)},
+    'season_shot_data': {'max_entries': 400, 'ttl': 7 * 24 * HOUR, 'current_season_ttl': 2 * HOUR, 'tags': ('player_id', 'season')},  # Past seasons are final
+}
+MEMORY_BUDGET_MB = float(os.environ.get('PP_CACHE_MEMORY_MB', 512))  # Total size of every cached result (per server process)
+
+
+
+def current_season(today=None):
+    """
+    Returns the NBA season in progress (seasons roll over in October).
+
+    Parameters:
+    - today (date): Reference date (default: today)
+
+    Returns:
+    - season (str): Season (format: 'YYYY-YY')
+    """
+
+    today = today or date.today()
+    start_year = today.year if today.month >= 10 else today.year - 1
+    return f'{start_year}-{(start_year + 1) % 100:02d}'
+
+
+
+
+
+class PolicyCache:
+    """
+    Process-wide cache of fetch results with per-function entry limits & TTLs, a shared memory budget (LRU eviction) and targeted invalidation.
+    """
+
+
+    def __init__(self, policies=CACHE_POLICIES, memory_budget_mb=MEMORY_BUDGET_MB):
+        self.policies = policies
+        self.memory_budget = int(memory_budget_mb * 1024 * 1024)  # In bytes
+        self._entries = OrderedDict()  # {(name, args): entry dict}, least recently used first
+        self._stats = {name: {'hits': 0, 'misses': 0, 'evictions': 0, 'expirations': 0, 'invalidations': 0} for name in policies}
+        self._nbytes = 0
+        self._lock = threading.RLock()
+        self._key_locks = {}  # One lock per key being computed, so concurrent sessions don't fetch the same data twice
+
+
+    def cached(self, name):
+        """
+        Decorates a fetch function so its results are kept under the named policy (replaces st.cache_data).
+
+        Parameters:
+        - name (str): Policy name (also the 'cache.<name>' span name)
+
+        Returns:
+        - decorator (callable): Function decorator
+        """
+
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(*args):
+                with span(f'cache.{name}', cache_hit=True):
+                    return self.get_or_compute(name, args, fn)
+            return wrapper
+        return decorator
+
+
+    def get_or_compute(self, name, args, fn):
+        """
+        Returns the cached result for the arguments, computing & storing it on a miss (or after expiry).
+
+        Parameters:
+        - name (str): Policy name
+        - args (tuple): Positional arguments of the fetch (the cache key)
+        - fn (callable): Fetch function
+
+        Returns:
+        - result: Cached or freshly computed result
+        """
+
+        key = (name, args)
+        found, result = self._lookup(key)
+        if found:
+            return result
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            try:
+                found, result = self._lookup(key, count=False)  # Another session may have computed it while this one waited
+                if found:
+                    return result
+
+                mark_cache_miss()
+                result = fn(*args)
+                if not (isinstance(result, dict) and not result):  # The fetchers return {} on errors, which shouldn't outlive the request
+                    self._store(key, result)
+            finally:
+                # Released while the key lock is still held (also if the fetch raised), leaving a newer caller's lock in place
+                with self._lock:
+                    if self._key_locks.get(key) is key_lock:
+                        del self._key_locks[key]
+        return result
+
+
+    def invalidate(self, name=None, player_id=None, season=None):
+        """
+        Drops the matching entries (every given criterion must match; no criteria clears the whole cache).
+
+        Parameters:
+        - name (str): Only this function's entries
+        - player_id (int): Only entries of this player
+        - season (str): Only entries of this season (entries not tagged by season are kept)
+
+        Returns:
+        - removed (int): Number of entries dropped
+        """
+
+        with self._lock:
+            matches = [key for key, entry in self._entries.items()
+                       if (name is None or key[0] == name)
+                       and (player_id is None or entry['tags'].get('player_id') == player_id)
+                       and (season is None or entry['tags'].get('season') == season)]
+            for key in matches:
+                self._remove(key, 'invalidations')
+            return len(matches)
+
+
+    def invalidate_current_season(self):
+        return self.invalidate(season=current_season())
+
+
+    def usage(self):
+        """
+        Summarizes the cache's contents & activity per function.
+
+        Returns:
+        - usage (dict): {name: {'entries', 'max_entries', 'mb', 'ttl_h', 'hits', 'misses', 'evictions', 'expirations', 'invalidations'}}
+        """
+
+        with self._lock:
+            usage = {name: {'entries': 0, 'max_entries': policy['max_entries'], 'mb': 0.0, 'ttl_h': round(policy['ttl'] / HOUR, 1), **self._stats[name]}
+                     for name, policy in self.policies.items()}
+            for (name, _), entry in self._entries.items():
+                usage[name]['entries'] += 1
+                usage[name]['mb'] += entry['nbytes'] / (1024 * 1024)
+        for stats in usage.values():
+            stats['mb'] = round(stats['mb'], 2)
+        return usage
+
+
+    @property
+    def memory_mb(self):
+        return round(self._nbytes / (1024 * 1024), 2)
+
+
+    def _lookup(self, key, count=True):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() >= entry['expires']:
+                self._remove(key, 'expirations')
+                entry = None
+            if entry is None:
+                if count:
+                    self._stats[key[0]]['misses'] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            if count:
+                self._stats[key[0]]['hits'] += 1
+            return True, entry['value']
+
+
+    def _store(self, key, value):
+        name, args = key
+        policy = self.policies[name]
+        tags = dict(zip(policy['tags'], args))
+        ttl = policy.get('current_season_ttl', policy['ttl']) if tags.get('season') == current_season() else policy['ttl']
+        entry = {'value': value, 'nbytes': payload_bytes(value), 'tags': tags, 'expires': time.monotonic() + ttl}
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._nbytes += entry['nbytes']
+
+            # Per-function entry limit (least recently used first), then the shared memory budget
+            name_keys = [cached_key for cached_key in self._entries if cached_key[0] == name]
+            for cached_key in name_keys[:max(0, len(name_keys) - policy['max_entries'])]:
+                self._remove(cached_key, 'evictions')
+            while self._nbytes > self.memory_budget and len(self._entries) > 1:
+                self._remove(next(iter(self._entries)), 'evictions')
+
+
+    def _remove(self, key, reason=None):
+        entry = self._entries.pop(key)
+        self._nbytes -= entry['nbytes']
+        if reason is not None:
+            self._stats[key[0]][reason] += 1
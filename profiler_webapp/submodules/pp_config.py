@@ -0,0 +1,167 @@
+### =========================== SETUP =========================== ###
+
+# Utils
+from contextlib import contextmanager
+from functools import lru_cache
+import json
+import os
+import subprocess
+import sys
+import time
+
+### ============================================================= ###
+
+
+
+
+
+### PROJECT PATHS (resolved once for the app & every submodule)
+
+PROJECT_DIR_NAME = 'NBA-Profiler'
+DEFAULT_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Fallback: the checkout containing this app
+
+
+def find_project_root(start=None, marker=PROJECT_DIR_NAME):
+    """
+    Walks up from the start directory to the project directory.
+
+    Parameters:
+    - start (str): Directory to start from (default: the current working directory)
+    - marker (str): Name of the project directory
+
+    Returns:
+    - root_dir (str): Project directory, or the checkout containing this app if no parent directory matches
+    """
+
+    path = os.path.abspath(start or os.getcwd())
+    while not path.endswith(marker):
+        parent = os.path.dirname(path)
+        if parent == path:  # Reached the filesystem root without finding the project directory
+            return DEFAULT_ROOT_DIR
+        path = parent
+    return path
+
+
+ROOT_DIR = find_project_root()
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+# Define paths (relative to user OS) for files to be used
+LOGO_PATH = os.path.join(ROOT_DIR, './utils/images/sb_logo_dark_no_bg.png')
+BRICK_IMG_PATH = os.path.join(ROOT_DIR, './utils/images/brick.png')
+BUCKET_IMG_PATH = os.path.join(ROOT_DIR, './utils/images/bucket.png')
+WOOD1_IMG_PATH = os.path.join(ROOT_DIR, './utils/images/wood1.png')
+WOOD2_IMG_PATH = os.path.join(ROOT_DIR, './utils/images/wood2.png')
+SHOT_FILTER_PARAMS_PATH = os.path.join(ROOT_DIR, './utils/shot_chart_params.json')
+STATIC_PLAYER_DATA_PATH = os.path.join(ROOT_DIR, './data/static_player_data.pkl')
+TEAM_INFO_PATH = os.path.join(ROOT_DIR, './data/nba_teams.json')
+PLAYER_STATS_PATH = os.path.join(ROOT_DIR, './cln_comprehensive_stats.csv')
+PLAYER_CLUSTERS_PATH = os.path.join(ROOT_DIR, './cln_clusters.csv')
+FEATURE_STORE_PATH = os.path.join(ROOT_DIR, './data/feature_store')
+FIXTURE_ARCHIVE_PATH = os.path.join(ROOT_DIR, './data/fixtures/nba_responses.zip')
+ASSET_DIR = os.path.join(ROOT_DIR, './data/assets')
+SHOT_ARCHIVE_DIR = os.path.join(ROOT_DIR, './data/shot_archive')
+ZONE_SUMMARY_DIR = os.path.join(ROOT_DIR, './data/zone_summaries')
+
+
+
+### JSON ASSETS (loaded on first use, then shared)
+
+@lru_cache(maxsize=None)
+def load_json_asset(path):
+    """
+    Loads a JSON asset once per process.
+
+    Parameters:
+    - path (str): Path to the JSON file
+
+    Returns:
+    - asset (dict): Parsed JSON content (shared -- treat as read-only)
+    """
+
+    with timed_import(f'json:{os.path.basename(path)}'):
+        with open(path, 'r') as f:
+            return json.load(f)
+
+
+def get_nba_teams():
+    return load_json_asset(TEAM_INFO_PATH)
+
+
+def get_sc_params():
+    return load_json_asset(SHOT_FILTER_PARAMS_PATH)
+
+
+
+### IMPORT-TIME REPORT
+
+IMPORT_TIMES = {}  # {label: seconds} for every timed import block/asset load in this process
+
+
+@contextmanager
+def timed_import(label):
+    """
+    Records the wall-clock time of an import block (or asset load) under the given label.
+
+    Parameters:
+    - label (str): Name shown in the import-time report
+    """
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        IMPORT_TIMES[label] = IMPORT_TIMES.get(label, 0.0) + time.perf_counter() - start
+
+
+def import_report():
+    """
+    Summarizes the recorded import times, slowest first.
+
+    Returns:
+    - report (str): One line per label with its time in milliseconds
+    """
+
+    rows = sorted(IMPORT_TIMES.items(), key=lambda item: item[1], reverse=True)
+    return '\n'.join(f'{label:<32}{seconds * 1000:>10.1f} ms' for label, seconds in rows)
+
+
+def profile_cold_imports(modules, top=15):
+    """
+    Measures each module's cold import in a fresh interpreter (via python -X importtime).
+
+    Parameters:
+    - modules (list): Module names to import (i.e. 'seaborn', 'submodules.pp_generate_shot_charts')
+    - top (int): Number of slowest nested imports listed per module
+
+    Returns:
+    - report (dict): {module: (total seconds, [(nested module, cumulative seconds), ...], import succeeded)}
+    """
+
+    report = {}
+    for module in modules:
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                                capture_output=True, text=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+        # Each stderr line: 'import time: <self us> | <cumulative us> | <indented module name>'
+        timings = []
+        for line in result.stderr.splitlines():
+            parts = line.split('|')
+            if line.startswith('import time:') and len(parts) == 3 and parts[1].strip().isdigit():
+                timings.append((parts[2].strip(), int(parts[1]) / 1e6))
+        total = max((seconds for _, seconds in timings), default=0.0)
+        report[module] = (total, sorted(timings, key=lambda item: item[1], reverse=True)[1:top + 1], result.returncode == 0)
+    return report
+
+
+
+def main(modules=('streamlit', 'pandas', 'matplotlib.pyplot', 'seaborn', 'scipy.ndimage', 'PIL.Image', 'nba_api.stats.endpoints',
+                  'submodules.pp_generate_shot_charts')):
+
+    for module, (total, slowest, succeeded) in profile_cold_imports(modules, top=5).items():
+        print(f'{module:<48}{total * 1000:>10.1f} ms' + ('' if succeeded else '  (import failed)'))
+        for name, seconds in slowest:
+            print(f'    {name:<44}{seconds * 1000:>10.1f} ms')
+
+if __name__ == '__main__':
+    main()  # Run from 'profiler_webapp' as: python -m submodules.pp_config
@@ -8,38 +8,32 @@ import pandas as pd
 
 # Utils
 from datetime import datetime
-import json
-import os
-import sys
-import time
 
-# Settings
-cwd = os.getcwd()
-while not cwd.endswith('NBA-Profiler'):
-    cwd = os.path.dirname(cwd)
-sys.path.append(cwd)
+# Instrumentation
+from submodules.pp_instrumentation import timed, record_error  # Span recording (SEE SUBMODULE 'pp_instrumentation.py' FOR DETAILS)
 
-# Define paths (relative to user OS) for files to be used
-TEAM_INFO_PATH = os.path.join(cwd, './data/nba_teams.json')
+# Request Pacing (shared rate budget or fixed wait-time, SEE SUBMODULE 'pp_profile_loader.py' FOR DETAILS)
+from submodules.pp_profile_loader import ThrottleMixin
 
-# Load necessary files
-with open(TEAM_INFO_PATH, 'r') as f:
-    nba_teams = json.load(f)
+# Settings (paths & JSON assets are resolved once, SEE SUBMODULE 'pp_config.py' FOR DETAILS)
+from submodules.pp_config import get_nba_teams
 
 ### ============================================================= ###
 
 
 
-class PlayerInfoFetcher:
+class PlayerInfoFetcher(ThrottleMixin):
     """
     Extracts player bio details for application display.
     """
 
 
-    def __init__(self):
+    def __init__(self, rate_limiter=None):
         self.request_interval = 1  # Custom wait-time to avoid API rate limits
+        self.rate_limiter = rate_limiter  # Optional shared RateLimiter (see 'rate_limiter.py'); replaces the fixed wait-time
 
 
+    @timed('fetch.player_info', measure_bytes=True)
     def fetch_player_info(self, player_id):
         """
         Retrieves and compiles basic player information.
@@ -54,7 +48,7 @@ class PlayerInfoFetcher:
         try:
 
             # Fetch data from the NBA API
-            time.sleep(self.request_interval)  # OPTIONAL (buffer for any previous request)
+            self._throttle()  # OPTIONAL (buffer for any previous request)
             common_player_info = commonplayerinfo.CommonPlayerInfo(player_id=player_id).get_data_frames()
             player_info, career_summary, played_seasons = common_player_info[0], common_player_info[1], common_player_info[2]
 
@@ -81,17 +75,18 @@ class PlayerInfoFetcher:
 
                 'played_seasons': self._format_played_seasons(played_seasons),  # Available season options for further data retrieval
                 'no_playdata_available': len(career_summary)==0,  # Binary value to determine if error message should be prompted in app
-                'current_team_colors': nba_teams['TEAM_COLORS'].get(player_info['TEAM_ABBREVIATION'].values[0], ["#1c1e21", "#ffffff"])  # Default W/B if not on roster
+                'current_team_colors': get_nba_teams()['TEAM_COLORS'].get(player_info['TEAM_ABBREVIATION'].values[0], ["#1c1e21", "#ffffff"])  # Default W/B if not on roster
             }
 
             return player_info
 
         except Exception as e:
 
-            print(f'An error occurred while fetching player info. Please try again.')
+            record_error(e, 'An error occurred while fetching player info')
             return {}
 
 
+    @timed('fetch.player_awards', measure_bytes=True)
     def fetch_player_awards(self, player_id):
         """
         Retrieves and compiles player honors.
@@ -106,6 +101,8 @@ class PlayerInfoFetcher:
         try:
 
             # Fetch data from the NBA API
+            if self.rate_limiter is not None:
+                self.rate_limiter.wait()  # Only when sharing a rate budget with concurrent fetches
             player_award_info = playerawards.PlayerAwards(player_id=player_id).get_data_frames()[0]
 
             # Extract relevant information and conduct necessary transformations
@@ -115,7 +112,7 @@ class PlayerInfoFetcher:
 
         except Exception as e:
 
-            print(f'An error occurred while fetching player award info: {e}. Try again.')
+            record_error(e, 'An error occurred while fetching player award info')
             return {}
 
 
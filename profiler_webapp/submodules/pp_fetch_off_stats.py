@@ -7,8 +7,11 @@ from nba_api.stats.endpoints import playercareerstats
 import numpy as np
 import pandas as pd
 
-# Utils
-import time
+# Instrumentation
+from submodules.pp_instrumentation import timed, record_error  # Span recording (SEE SUBMODULE 'pp_instrumentation.py' FOR DETAILS)
+
+# Request Pacing (shared rate budget or fixed wait-time, SEE SUBMODULE 'pp_profile_loader.py' FOR DETAILS)
+from submodules.pp_profile_loader import ThrottleMixin
 
 ### ============================================================= ###
 
@@ -16,16 +19,18 @@ import time
 
 
 
-class PlayerCareerStatsFetcher:
+class PlayerCareerStatsFetcher(ThrottleMixin):
     """
     Extracts career statistics for application display.
     """
 
 
-    def __init__(self):
+    def __init__(self, rate_limiter=None):
         self.request_interval = 0.5  # Custom wait-time to avoid API rate limits
+        self.rate_limiter = rate_limiter  # Optional shared RateLimiter (see 'rate_limiter.py'); replaces the fixed wait-time
 
 
+    @timed('fetch.career_stats', measure_bytes=True)
     def fetch_career_stats(self, player_id):
         """
         Fetches input player's career statistics and executes processing steps.
@@ -40,9 +45,9 @@ class PlayerCareerStatsFetcher:
         try:
 
             # Fetch data from NBA API endpoint
-            time.sleep(self.request_interval)  # OPTIONAL (buffer for any previous request)
+            self._throttle()  # OPTIONAL (buffer for any previous request)
             career_per_game_dfs = playercareerstats.PlayerCareerStats(player_id=player_id, per_mode36='PerGame').get_data_frames()
-            time.sleep(self.request_interval)  # OPTIONAL
+            self._throttle()  # OPTIONAL
             career_per_36_dfs = playercareerstats.PlayerCareerStats(player_id=player_id, per_mode36='Per36').get_data_frames()
 
             # Execute processing methods to retrieve formatted data
@@ -55,10 +60,11 @@ class PlayerCareerStatsFetcher:
 
         except Exception as e:
 
-            print(f'An error occurred while fetching player stats. Please try again.')
+            record_error(e, 'An error occurred while fetching player stats')
             return {}
 
 
+    @timed('process.career_stats')
     def _process_stats(self, dfs):
         """
         Wrangles the raw statistics from the DataFrame set and returns a processed and filtered set.
@@ -1,71 +1,55 @@
 ### =========================== SETUP =========================== ###
-# Data Acquisition
-import PIL.Image
-from nba_api.stats.endpoints import shotchartdetail
+# Data Acquisition (nba_api's shotchartdetail is imported where used, so charts can be drawn from archived or cached data alone)
 
 # Data Management
 import numpy as np
 import pandas as pd
 
-# Visualization
-from io import BytesIO
-import matplotlib.cm as cm
+# Visualization (seaborn, scipy.ndimage, PIL & streamlit are imported where used, to keep app start-up light)
 import matplotlib.colors as mcolors
-from matplotlib.colors import Normalize
 import matplotlib.image as mpimg
 from matplotlib.patches import Rectangle, Circle, Arc
 import matplotlib.pyplot as plt
 from matplotlib.offsetbox import OffsetImage, AnnotationBbox
-import PIL
-from PIL import Image
-import scipy.ndimage as ndimage
-from scipy.ndimage import gaussian_filter
-import seaborn as sns
-import streamlit as st
 
 # Utils
-from IPython.display import display, HTML, IFrame, Image
-import json
-import os
-import sys
-import requests
-import time
-import urllib.request
-
-# Settings
-cwd = os.getcwd()
-while not cwd.endswith('NBA-Profiler'):
-    cwd = os.path.dirname(cwd)
-sys.path.append(cwd)
-
-# Define paths (relative to user OS) for files to be used
-pwd = os.getcwd()
-TEAM_INFO_PATH = os.path.join(cwd, './data/nba_teams.json')
-SHOT_FILTER_PARAMS_PATH = os.path.join(cwd, './utils/shot_chart_params.json')
-BRICK_IMG_PATH = './utils/images/brick.png'
-BUCKET_IMG_PATH = './utils/images/bucket.png'
-WOOD1_IMG_PATH = './utils/images/wood1.png'
-WOOD2_IMG_PATH = './utils/images/wood2.png'
-LOGO_IMG_PATH = './utils/images/sb_logo_dark_no_bg.png'
-
-# Pre-Requisite file loading
-with open(TEAM_INFO_PATH, 'r') as f:
-    nba_teams = json.load(f)
-with open(SHOT_FILTER_PARAMS_PATH, 'r') as f:
-    sc_params = json.load(f)
+from functools import lru_cache
+
+# Transport
+from submodules.pp_http import get_session  # Pooled HTTP session (SEE SUBMODULE 'pp_http.py' FOR DETAILS)
+
+# Instrumentation
+from submodules.pp_instrumentation import timed, mark_cache_miss  # Span recording (SEE SUBMODULE 'pp_instrumentation.py' FOR DETAILS)
+
+# Request Pacing (shared rate budget or fixed wait-time, SEE SUBMODULE 'pp_profile_loader.py' FOR DETAILS)
+from submodules.pp_profile_loader import ThrottleMixin
+
+# Settings (paths & JSON assets are resolved once, SEE SUBMODULE 'pp_config.py' FOR DETAILS)
+from submodules.pp_config import BRICK_IMG_PATH, BUCKET_IMG_PATH, WOOD1_IMG_PATH, WOOD2_IMG_PATH, get_nba_teams, get_sc_params
+from submodules.pp_config import LOGO_PATH as LOGO_IMG_PATH
+from submodules.pp_config import ASSET_DIR, SHOT_ARCHIVE_DIR
+
+# Local store of pre-decoded headshots (SEE ROOT MODULE 'asset_cache.py' FOR DETAILS); shared by all instances
+from asset_cache import AssetCache
+asset_cache = AssetCache(ASSET_DIR, session=get_session())
+
+# Season-partitioned archive of league-wide shots (SEE ROOT MODULE 'shot_archive.py' FOR DETAILS); archived seasons need no API requests
+from shot_archive import ShotArchive
+shot_archive = ShotArchive(SHOT_ARCHIVE_DIR)
 
 ### ============================================================= ###
 
 
 
-class ShotChartGenerator:
+class ShotChartGenerator(ThrottleMixin):
     """
     Gathers shot data for NBA player based on selected filter(s).
     """
 
 
-    def __init__(self):
+    def __init__(self, rate_limiter=None):
         self.request_interval = 1  # Custom wait-time to avoid API rate limits
+        self.rate_limiter = rate_limiter  # Optional shared RateLimiter (see 'rate_limiter.py'); replaces the fixed wait-time
 
 
     def fetch_total_shot_data(self, player_id, seasons):
@@ -82,26 +66,65 @@ class ShotChartGenerator:
         game_log (dataframe): DataFrame containing formatted game dates & location info for front-end usage
         """
 
-        total_plyr_shot_data = pd.DataFrame()
-        total_league_shot_data = pd.DataFrame()
-
         # Iterate through each season and gather necessary data
-        for season in seasons:
+        season_shot_data = [self.fetch_season_shot_data(player_id, season) for season in seasons]
 
-            ### REGULAR-SEASON SHOT DATA
-            rs_shot_data = shotchartdetail.ShotChartDetail(
-                player_id=player_id,
-                team_id=0,
-                season_nullable=season,
-                season_type_all_star='Regular Season',
-                context_measure_simple='FGA',
-            ).get_data_frames()
-            rs_plyr_shot_data, rs_league_shot_data = rs_shot_data[0], rs_shot_data[1]
+        return self.combine_season_shot_data(season_shot_data)
+
+
+    @timed('fetch.season_shot_data', measure_bytes=True)
+    def fetch_season_shot_data(self, player_id, season):
+        """
+        Fetches a single season's shot data (the unit that gets cached & prefetched, so any season combination can be assembled).
+        Completed seasons in the local shot archive are read from disk with a range scan instead of requesting the API.
+
+        Parameters:
+        player_id (int): Unique player id number
+        season (str): Season of interest (format: 'YYYY-YY')
+
+        Returns:
+        plyr_shot_data (dataframe): DataFrame containing player shot data for the input season
+        league_shot_data (dataframe): DataFrame containing league-wide shot data for the input season
+        """
+
+        ### ARCHIVED SHOT DATA (same layout as the API response)
+        archived_shot_data = shot_archive.player_season(player_id, season)
+        if archived_shot_data is not None:
+            return archived_shot_data
+
+        ### REGULAR-SEASON SHOT DATA
+        from nba_api.stats.endpoints import shotchartdetail
+        self._throttle()  # OPTIONAL (buffer for any previous request)
+        rs_shot_data = shotchartdetail.ShotChartDetail(
+            player_id=player_id,
+            team_id=0,
+            season_nullable=season,
+            season_type_all_star='Regular Season',
+            context_measure_simple='FGA',
+        ).get_data_frames()
+        rs_plyr_shot_data, rs_league_shot_data = rs_shot_data[0], rs_shot_data[1]
+
+        rs_plyr_shot_data['SEASON'], rs_league_shot_data['SEASON'] = season, season
+
+        return rs_plyr_shot_data, rs_league_shot_data
+
+
+    @timed('process.combine_season_shots')
+    def combine_season_shot_data(self, season_shot_data):
+        """
+        Compiles per-season shot data into the multi-season totals used by the charts.
+
+        Parameters:
+        season_shot_data (list): List of (player shot data, league shot data) tuples, one per season
+
+        Returns:
+        total_plyr_shot_data (dataframe): DataFrame containing player shot data for entirety of input seasons
+        total_league_shot_data (dataframe): DataFrame containing league-wide shot data for entirety of input seasons
+        game_log (dataframe): DataFrame containing formatted game dates & location info for front-end usage
+        """
 
-            rs_plyr_shot_data['SEASON'], rs_league_shot_data['SEASON'] = season, season
-            total_plyr_shot_data = pd.concat([total_plyr_shot_data, rs_plyr_shot_data], ignore_index=True)
-            total_league_shot_data = pd.concat([total_league_shot_data, rs_league_shot_data], ignore_index=True)
-            time.sleep(self.request_interval)  # OPTIONAL
+        total_plyr_shot_data = pd.concat([plyr_shot_data for plyr_shot_data, _ in season_shot_data], ignore_index=True)
+        total_league_shot_data = pd.concat([league_shot_data for _, league_shot_data in season_shot_data], ignore_index=True)
 
         # Combine multiple seasons into single aggregate to use for hex-bin comparisons
         total_league_shot_data = self._aggregate_league_data(total_league_shot_data)
@@ -112,6 +135,7 @@ class ShotChartGenerator:
         return total_plyr_shot_data, total_league_shot_data, game_log
 
 
+    @timed('fetch.filtered_shot_data', measure_bytes=True)
     def fetch_filtered_shot_data(self, player_id, seasons, filters):
         """
         Fetches and compiles shot data for all input options.
@@ -130,10 +154,12 @@ class ShotChartGenerator:
         filtered_league_shot_data = pd.DataFrame()
 
         filter_params = self._parse_filters(filters)
+        from nba_api.stats.endpoints import shotchartdetail
 
         # Iterate through each season and gather necessary data
         for season in seasons:
 
+            self._throttle()  # OPTIONAL (buffer for any previous request)
             shot_data = shotchartdetail.ShotChartDetail(
                 player_id=player_id,
                 context_measure_simple='FGA',
@@ -146,7 +172,6 @@ class ShotChartGenerator:
             plyr_shot_data['SEASON'], league_shot_data['SEASON'] = season, season
             filtered_plyr_shot_data = pd.concat([filtered_plyr_shot_data, plyr_shot_data], ignore_index=True)
             filtered_league_shot_data = pd.concat([filtered_league_shot_data, league_shot_data], ignore_index=True)
-            time.sleep(self.request_interval)  # OPTIONAL
 
         # Combine multiple seasons into single aggregate to use for hex-bin comparisons
         filtered_league_shot_data = self._aggregate_league_data(filtered_league_shot_data)
@@ -154,6 +179,24 @@ class ShotChartGenerator:
         return filtered_plyr_shot_data, filtered_league_shot_data
 
 
+    @timed('fetch.player_headshot', cache=True, measure_bytes=True)
+    def fetch_player_headshot(self, player_id):
+        """
+        Retrieves a player's pre-decoded headshot, oriented for the (inverted-axis) court image (downloaded once into the local asset store).
+
+        Parameters:
+        player_id (int): Unique player id number
+
+        Returns:
+        headshot (ndarray): Rotated & mirrored RGBA headshot image (None if unavailable)
+        """
+
+        if not asset_cache.contains('headshot', player_id):
+            mark_cache_miss()
+        return asset_cache.ensure('headshot', player_id, 'court')
+
+
+    @timed('render.plot_shot_data')
     def plot_shot_data(self, player_id, plyr_shot_data, league_shot_data, plot_type='Make/Miss [V1]', team_colors=['#28282B', '#28282B']):
         """
         Generates shot chart for input shot data.
@@ -170,6 +213,7 @@ class ShotChartGenerator:
 
         # Output error message if selected filters yielded no data
         if plyr_shot_data.empty:
+            import streamlit as st  # Only the app shows this message (streamlit isn't needed to draw charts)
             return st.error(f'No shot data available for the selected filters.'), st.stop()
 
         # Initialize court figure
@@ -179,6 +223,7 @@ class ShotChartGenerator:
         ### STANDARD MAKE / MISS VERSION
         if plot_type == 'Make/Miss [V1]':
             size_factor = 1 if len(plyr_shot_data) < 30 else 0.5
+            import seaborn as sns  # Deferred import (only the Make/Miss [V1] chart uses seaborn)
             sns.scatterplot(
                 data=plyr_shot_data,
                 x='LOC_X',
@@ -197,8 +242,7 @@ class ShotChartGenerator:
 
         ### ALTERNATIVE MAKE / MISS VERSION
         elif plot_type == 'Make/Miss [V2]':
-            make_marker = mpimg.imread(BUCKET_IMG_PATH)
-            miss_marker = mpimg.imread(BRICK_IMG_PATH)
+            make_marker, miss_marker = load_shot_markers()
 
             for _, row in plyr_shot_data.iterrows():
                 x, y, made = row['LOC_X'], row['LOC_Y'], row['SHOT_MADE_FLAG']
@@ -294,6 +338,7 @@ class ShotChartGenerator:
         return ax
 
 
+    @timed('process.aggregate_league_data')
     def _aggregate_league_data(self, league_shot_data):
         """
         Combines league shot data from multiple seasons (for each shot type combination) for hex-bin usage.
@@ -312,6 +357,7 @@ class ShotChartGenerator:
         return aggregated_league_shot_data
 
 
+    @timed('process.extract_game_log')
     def _extract_game_log(self, player_shot_data):
         """
         Extracts player games and dates from retrieved shot data, without needing extra API call.
@@ -330,7 +376,7 @@ class ShotChartGenerator:
         game_log = game_log.drop_duplicates(subset='GAME_DATE', keep='first')
 
         # Convert full team name to abbreviation (standardized with HTM and VTM)
-        game_log['TEAM_ABBV'] = game_log['TEAM_NAME'].map({v: k for k, v in nba_teams['TEAM_NAMES'].items()})
+        game_log['TEAM_ABBV'] = game_log['TEAM_NAME'].map({v: k for k, v in get_nba_teams()['TEAM_NAMES'].items()})
 
         # Re-order data with recent dates first, and convert dates into parameter-acceptable format
         game_log = game_log.sort_values(by='GAME_DATE', ascending=False).reset_index(drop=True)
@@ -374,13 +420,14 @@ class ShotChartGenerator:
 
                 # Translate other filter selections to API-compatible versions using pre-made conversion doc
                 else:
-                    api_param_name = sc_params[filter_name][selected_value][0]
-                    api_value = sc_params[filter_name][selected_value][1]
+                    api_param_name = get_sc_params()[filter_name][selected_value][0]
+                    api_value = get_sc_params()[filter_name][selected_value][1]
                     parsed_filters[api_param_name] = api_value
 
         return parsed_filters
 
 
+    @timed('render.draw_court')
     def _draw_court(self, player_id, team_colors, court_color='white', line_color='black', line_width=1, title=None):
         """
         Draws a half-court basketball court for shot chart visualization.
@@ -433,58 +480,15 @@ class ShotChartGenerator:
         for patch in court_patches:
             ax.add_patch(patch)
 
-        # Load textures and logo images
-        wood_texture_one = mpimg.imread(WOOD1_IMG_PATH)
-        wood_texture_two = mpimg.imread(WOOD2_IMG_PATH)
-        wood_texture_one = ndimage.rotate(wood_texture_one, 90)
-        wood_texture_two = ndimage.rotate(wood_texture_two, 90)
-        sb_logo_dark = mpimg.imread(LOGO_IMG_PATH)
-        sb_logo_dark = np.flipud(sb_logo_dark)
-
-        outer_shade, outer_alpha = wood_texture_one, 0.25
-        midrange_shade, midrange_alpha = wood_texture_one, 0.6
-        paint_shade, paint_alpha = wood_texture_two, 0.4
+        # Load (pre-rotated & pre-masked) textures and logo images
+        wood_texture_one, wood_texture_two, wood_texture_masked, sb_logo_dark = load_court_textures()
+        midrange_alpha, paint_alpha, outer_alpha = 0.6, 0.4, 0.25
 
         # Apply textures and logo onto court
-        ax.imshow(midrange_shade, extent=[-250, 250, -52.5, 417.5], alpha=midrange_alpha, aspect='auto')
-        ax.imshow(paint_shade, extent=[-80, 80, -52.5, 137.5], alpha=paint_alpha, aspect='auto')
+        ax.imshow(wood_texture_one, extent=[-250, 250, -52.5, 417.5], alpha=midrange_alpha, aspect='auto')
+        ax.imshow(wood_texture_two, extent=[-80, 80, -52.5, 137.5], alpha=paint_alpha, aspect='auto')
         ax.imshow(sb_logo_dark, extent=[-60, 60, 358.5, 417.5], alpha=1, aspect='auto')
-
-        # Create high-resolution binary masks for three-point line and court areas
-        resolution = 300
-        x = np.linspace(-250, 250, resolution)
-        y = np.linspace(-52.5, 417.5, resolution)
-        xv, yv = np.meshgrid(x, y)
-        distance_from_center = np.sqrt(xv**2 + yv**2)
-
-        # Create a strict binary mask (no gradient) for areas outside the three-point arc
-        three_point_radius = 475/2
-        mask_arc = distance_from_center > three_point_radius
-
-        # Create binary mask for left corner (to the left of -220, extend it along baseline)
-        left_corner_x = -220
-        mask_left = xv < left_corner_x
-
-        # Create binary mask for right corner (to the right of +220, extend it along baseline)
-        right_corner_x = 220
-        mask_right = xv > right_corner_x
-
-        # Combine all masks (arc + left corner + right corner)
-        combined_mask = mask_arc | mask_left | mask_right
-
-        # Resize the wood texture to match the mask resolution
-        wood_texture_resized = ndimage.zoom(outer_shade, (resolution / outer_shade.shape[0], resolution / outer_shade.shape[1], 1))
-
-        # Apply the binary mask to the resized texture
-        wood_texture_masked = np.copy(wood_texture_resized)
-        for c in range(wood_texture_masked.shape[2]):
-            wood_texture_masked[:, :, c] *= combined_mask
-
-        # Flip the masked texture vertically to match the inverted y-axis
-        wood_texture_masked = np.flipud(wood_texture_masked)
-
-        # Plot the masked texture
-        ax.imshow(wood_texture_masked, extent=[-250, 250, -52.5, 417.5], alpha=outer_alpha, aspect='auto')
+        ax.imshow(wood_texture_masked, extent=[-250, 250, -52.5, 417.5], alpha=outer_alpha, aspect='auto')  # Shade beyond the 3-PT line
 
 
         ### PLOT SPECIFICATIONS
@@ -519,9 +523,9 @@ class ShotChartGenerator:
             plt.title(title, fontsize=16)
 
         # Add player photo [OPTIONAL]
-        req = requests.get(f'https://cdn.nba.com/headshots/nba/latest/260x190/{player_id}.png')
-        player_image = PIL.Image.open(BytesIO(req.content)).rotate(180).transpose(PIL.Image.FLIP_LEFT_RIGHT)
-        ax.imshow(player_image, extent=[-265, -120, 320.5, 432.5], aspect='auto', zorder=2)
+        player_image = self.fetch_player_headshot(player_id)
+        if player_image is not None:
+            ax.imshow(player_image, extent=[-265, -120, 320.5, 432.5], aspect='auto', zorder=2)
 
         return ax
 
@@ -529,6 +533,49 @@ class ShotChartGenerator:
 
 
 
+@lru_cache(maxsize=1)
+def load_court_textures():
+    """
+    Decodes, orients & masks the court's wood textures and logo once per process.
+
+    Returns:
+    - textures (tuple): (rotated wood texture one, rotated wood texture two, texture one masked to beyond the 3-PT line, flipped logo) image arrays
+    """
+
+    import scipy.ndimage as ndimage  # Deferred import (only needed once a court is drawn)
+    wood_texture_one = ndimage.rotate(mpimg.imread(WOOD1_IMG_PATH), 90)
+    wood_texture_two = ndimage.rotate(mpimg.imread(WOOD2_IMG_PATH), 90)
+    sb_logo_dark = np.flipud(mpimg.imread(LOGO_IMG_PATH))
+
+    # Create high-resolution binary masks for three-point line and court areas
+    resolution = 300
+    x = np.linspace(-250, 250, resolution)
+    y = np.linspace(-52.5, 417.5, resolution)
+    xv, yv = np.meshgrid(x, y)
+    distance_from_center = np.sqrt(xv**2 + yv**2)
+
+    # Combine a strict binary mask (no gradient) for areas outside the three-point arc with the left & right corners (beyond +/-220)
+    three_point_radius = 475/2
+    combined_mask = (distance_from_center > three_point_radius) | (xv < -220) | (xv > 220)
+
+    # Resize the wood texture to match the mask resolution, apply the mask & flip it vertically to match the inverted y-axis
+    wood_texture_resized = ndimage.zoom(wood_texture_one, (resolution / wood_texture_one.shape[0], resolution / wood_texture_one.shape[1], 1))
+    wood_texture_masked = np.flipud(wood_texture_resized * combined_mask[:, :, np.newaxis].astype(wood_texture_resized.dtype))
+
+    # Spline rotation/zoom overshoots slightly; clip float textures to the displayable range once instead of on every draw
+    textures = [wood_texture_one, wood_texture_two, wood_texture_masked]
+    textures = [np.clip(texture, 0, 1) if texture.dtype.kind == 'f' else texture for texture in textures]
+    return (*textures, sb_logo_dark)
+
+
+@lru_cache(maxsize=1)
+def load_shot_markers():
+    return mpimg.imread(BUCKET_IMG_PATH), mpimg.imread(BRICK_IMG_PATH)  # (make, miss) markers of the Make/Miss [V2] chart
+
+
+
+
+
 def main(player_id, seasons=[None]):
 
     SCG = ShotChartGenerator()
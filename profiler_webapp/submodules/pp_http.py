@@ -0,0 +1,85 @@
+### =========================== SETUP =========================== ###
+
+# Data Acquisition
+import requests
+from requests.adapters import HTTPAdapter
+
+# Concurrency
+import threading
+
+### ============================================================= ###
+
+
+
+
+
+### TRANSPORT SETTINGS (shared by every outbound request of the profiler & visualizer)
+
+POOL_CONNECTIONS = 8  # Hosts kept with pooled connections (stats.nba.com, www.nba.com, cdn.nba.com, ...)
+POOL_MAXSIZE = 16  # Keep-alive connections per host (>= the profile & prefetch loaders' combined threads)
+CONNECT_TIMEOUT = 3.05  # Seconds to establish a connection
+READ_TIMEOUT = 30  # Seconds to wait for a response (the stats endpoints can be slow)
+DEFAULT_HEADERS = {
+    'Accept-Encoding': 'gzip, deflate',  # Compressed responses (decoded transparently by requests)
+    'Connection': 'keep-alive',
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+
+def get_session():
+    """
+    Returns the process-wide pooled session (created on first use), so repeated requests reuse open TCP/TLS connections.
+
+    Returns:
+    - session (requests.Session): Shared session with keep-alive connection pools per host
+    """
+
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers.update(DEFAULT_HEADERS)
+            _session = session
+    return _session
+
+
+def http_get(url, params=None, headers=None, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT)):
+    """
+    Sends a GET request through the shared pooled session.
+
+    Parameters:
+    - url (str): Request URL
+    - params (dict): Query parameters
+    - headers (dict): Extra headers for this request (merged over the session's defaults)
+    - timeout (tuple): (connect, read) timeouts in seconds
+
+    Returns:
+    - response (requests.Response): Response (status is not checked)
+    """
+
+    return get_session().get(url, params=params, headers=headers, timeout=timeout)
+
+
+def route_nba_api_requests():
+    """
+    Routes nba_api's endpoint requests through the shared session (if the installed nba_api supports custom sessions).
+
+    Returns:
+    - routed (bool): Whether nba_api now uses the shared session
+    """
+
+    try:
+        from nba_api.stats.library.http import NBAStatsHTTP
+    except ImportError:
+        return False
+
+    if not hasattr(NBAStatsHTTP, 'set_session'):  # Older releases open a new connection per request
+        return False
+    NBAStatsHTTP.set_session(get_session())
+    return True
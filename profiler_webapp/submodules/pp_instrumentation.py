@@ -0,0 +1,224 @@
+### =========================== SETUP =========================== ###
+
+# Concurrency
+import threading
+
+# Utils
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+import json
+import logging
+import math
+import time
+
+logger = logging.getLogger('profiler')
+
+### ============================================================= ###
+
+
+
+
+
+class SpanRecorder:
+    """
+    Records timed spans (fetch, process & render steps) in process and aggregates them per step.
+    """
+
+
+    def __init__(self, max_spans=1000):
+        self.max_spans = max_spans  # Most recent spans kept per step (bounds memory & keeps percentiles current)
+        self._spans = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+
+    @contextmanager
+    def span(self, name, cache_hit=None, nbytes=None):
+        """
+        Times the enclosed block as one span of the named step.
+
+        Parameters:
+        - name (str): Step name (i.e. 'fetch.player_info', 'render.shot_chart')
+        - cache_hit (bool): Whether the step was served from a cache (None if not applicable)
+        - nbytes (int): Payload size, if known upfront
+
+        Returns:
+        - info (dict): Mutable span attributes ('cache_hit', 'bytes', 'error') the block may update
+        """
+
+        info = {'cache_hit': cache_hit, 'bytes': nbytes, 'error': None}
+        stack = self._stack()
+        stack.append(info)
+        start = time.perf_counter()
+        try:
+            yield info
+        except Exception as e:
+            info['error'] = repr(e)
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            stack.pop()
+            with self._lock:
+                self._spans.setdefault(name, deque(maxlen=self.max_spans)).append((duration, info['cache_hit'], info['bytes'], info['error']))
+
+
+    def timed(self, name, cache=False, measure_bytes=False):
+        """
+        Decorates a function so every call is recorded as a span.
+
+        Parameters:
+        - name (str): Step name
+        - cache (bool): Whether the function is a cache lookup (calls count as hits unless mark_cache_miss() runs inside)
+        - measure_bytes (bool): Whether to record the size of the returned payload
+
+        Returns:
+        - decorator (callable): Function decorator
+        """
+
+        def decorator(fn):
+            @wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.span(name, cache_hit=True if cache else None) as info:
+                    result = fn(*args, **kwargs)
+                    if measure_bytes:
+                        info['bytes'] = payload_bytes(result)
+                    return result
+            return wrapper
+        return decorator
+
+
+    def mark_cache_miss(self):
+        """
+        Flags the innermost open span on this thread as a cache miss (call inside a cached function's body).
+        """
+
+        stack = self._stack()
+        if stack:
+            stack[-1]['cache_hit'] = False
+
+
+    def record_error(self, error, message):
+        """
+        Flags the innermost open span on this thread as failed & logs the error (replaces bare prints).
+
+        Parameters:
+        - error (Exception): Caught exception
+        - message (str): Human-readable context for the log
+        """
+
+        stack = self._stack()
+        if stack:
+            stack[-1]['error'] = repr(error)
+        logger.warning(f'{message}: {error!r}')
+
+
+    def summary(self):
+        """
+        Aggregates the recorded spans per step.
+
+        Returns:
+        - summary (dict): {step: {'count', 'errors', 'p50_ms', 'p95_ms', 'max_ms', 'total_s', 'cache_hits', 'cache_misses', 'bytes'}}
+        """
+
+        with self._lock:
+            spans = {name: list(records) for name, records in self._spans.items()}
+
+        summary = {}
+        for name, records in sorted(spans.items()):
+            durations = sorted(duration for duration, _, _, _ in records)
+            summary[name] = {
+                'count': len(records),
+                'errors': sum(error is not None for _, _, _, error in records),
+                'p50_ms': round(percentile(durations, 0.50) * 1000, 2),
+                'p95_ms': round(percentile(durations, 0.95) * 1000, 2),
+                'max_ms': round(durations[-1] * 1000, 2),
+                'total_s': round(sum(durations), 4),
+                'cache_hits': sum(cache_hit is True for _, cache_hit, _, _ in records),
+                'cache_misses': sum(cache_hit is False for _, cache_hit, _, _ in records),
+                'bytes': sum(nbytes or 0 for _, _, nbytes, _ in records),
+            }
+        return summary
+
+
+    def to_json(self):
+        return json.dumps(self.summary(), indent=1)
+
+
+    def to_prometheus(self, prefix='nba_profiler'):
+        """
+        Renders the summary in the Prometheus text exposition format.
+
+        Parameters:
+        - prefix (str): Metric name prefix
+
+        Returns:
+        - text (str): Metrics text (summary quantiles, counts, errors, cache hits/misses & bytes per step)
+        """
+
+        lines = [f'# HELP {prefix}_span_seconds Duration of profiler steps (most recent {self.max_spans} per step).',
+                 f'# TYPE {prefix}_span_seconds summary']
+        summary = self.summary()
+        for name, stats in summary.items():
+            lines.append(f'{prefix}_span_seconds{{step="{name}",quantile="0.5"}} {stats["p50_ms"] / 1000}')
+            lines.append(f'{prefix}_span_seconds{{step="{name}",quantile="0.95"}} {stats["p95_ms"] / 1000}')
+            lines.append(f'{prefix}_span_seconds_sum{{step="{name}"}} {stats["total_s"]}')
+            lines.append(f'{prefix}_span_seconds_count{{step="{name}"}} {stats["count"]}')
+        for metric, key in [('span_errors', 'errors'), ('cache_hits', 'cache_hits'), ('cache_misses', 'cache_misses'), ('span_bytes', 'bytes')]:
+            lines.append(f'# TYPE {prefix}_{metric} gauge')
+            lines.extend(f'{prefix}_{metric}{{step="{name}"}} {stats[key]}' for name, stats in summary.items())
+        return '\n'.join(lines) + '\n'
+
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+
+
+    def _stack(self):
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+
+
+def percentile(sorted_values, q):
+    """
+    Returns the nearest-rank percentile of an ascending list (0 for an empty list).
+    """
+
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+
+def payload_bytes(payload):
+    """
+    Estimates the in-memory size of a fetched/processed payload (dataframes, arrays, bytes, strings & containers of them).
+
+    Parameters:
+    - payload: Value returned by an instrumented step
+
+    Returns:
+    - nbytes (int): Estimated size in bytes
+    """
+
+    if hasattr(payload, 'memory_usage'):
+        return int(payload.memory_usage(deep=True).sum())
+    if hasattr(payload, 'nbytes'):  # NumPy arrays (i.e. decoded images)
+        return int(payload.nbytes)
+    if isinstance(payload, (bytes, bytearray)):
+        return len(payload)
+    if isinstance(payload, str):
+        return len(payload.encode('utf-8'))
+    if isinstance(payload, (list, tuple)):
+        return sum(payload_bytes(item) for item in payload)
+    if isinstance(payload, dict):
+        return sum(payload_bytes(item) for item in payload.values())
+    return 0
+
+
+
+# Process-wide recorder shared by the app & every submodule
+recorder = SpanRecorder()
+span, timed, mark_cache_miss, record_error = recorder.span, recorder.timed, recorder.mark_cache_miss, recorder.record_error
@@ -0,0 +1,181 @@
+### =========================== SETUP =========================== ###
+
+# Concurrency
+from concurrent.futures import ThreadPoolExecutor
+
+# Profiler Submodules (the fetchers, which need nba_api & bs4, are imported by ProfileSessionSimulator, so run_load_test works with any simulator)
+from submodules.pp_profile_loader import ProfileLoader, RateLimiter  # Concurrent Fetches (SEE SUBMODULE 'pp_profile_loader.py' FOR DETAILS)
+from submodules.pp_replay import FixtureArchive, Recorder, ReplayServer  # Record/Replay (SEE SUBMODULE 'pp_replay.py' FOR DETAILS)
+from submodules.pp_http import route_nba_api_requests  # Pooled HTTP session (SEE SUBMODULE 'pp_http.py' FOR DETAILS)
+from submodules.pp_cache import PolicyCache  # Bounded Fetch Cache (SEE SUBMODULE 'pp_cache.py' FOR DETAILS)
+
+# Instrumentation
+from submodules.pp_instrumentation import recorder, span, percentile  # Span recording (SEE SUBMODULE 'pp_instrumentation.py' FOR DETAILS)
+
+# Utils
+import argparse
+import random
+import time
+
+# Path Config
+from submodules.pp_config import FIXTURE_ARCHIVE_PATH
+
+### ============================================================= ###
+
+
+
+
+
+class ProfileSessionSimulator:
+    """
+    Replays a user's Player Profiler visit (bio, awards, bio text, career stats, shot data & headshot) through the submodule APIs.
+    """
+
+
+    def __init__(self, min_interval=0.0, loader_workers=6, cache=True):
+        from submodules.pp_fetch_bio_info import PlayerInfoFetcher  # Player Bio Data (SEE SUBMODULE 'pp_fetch_bio_info.py' FOR DETAILS)
+        from submodules.pp_fetch_off_stats import PlayerCareerStatsFetcher  # Career Stats (SEE SUBMODULE 'pp_fetch_off_stats.py' FOR DETAILS)
+        from submodules.pp_generate_shot_charts import ShotChartGenerator  # Shot Data (SEE SUBMODULE 'pp_generate_shot_charts.py' FOR DETAILS)
+        from submodules.pp_scrape_bio_desc import PlayerBioScraper  # Bio Description (SEE SUBMODULE 'pp_scrape_bio_desc.py' FOR DETAILS)
+
+        route_nba_api_requests()  # Same pooled transport as the app
+        rate_limiter = RateLimiter(min_interval=min_interval)  # One request budget shared by every simulated session (as in the app)
+        self.info_fetcher = PlayerInfoFetcher(rate_limiter)
+        self.bio_scraper = PlayerBioScraper(rate_limiter)
+        self.stats_fetcher = PlayerCareerStatsFetcher(rate_limiter)
+        self.shot_generator = ShotChartGenerator(rate_limiter)
+        self.loader = ProfileLoader(max_workers=loader_workers)
+        self.cache = PolicyCache() if cache else None  # Same policies as the app's cached fetches
+
+
+    def run_session(self, player_id, season):
+        """
+        Issues one session's fetches concurrently (like the app's profile loader) & waits for all of them.
+
+        Parameters:
+        - player_id (int): Unique NBA player ID
+        - season (str): Season of the shot chart (format: 'YYYY-YY')
+
+        Returns:
+        - seconds (float): Session latency
+        - failed (bool): Whether any fetch failed or came back empty
+        """
+
+        fetches = {
+            ('player_info', player_id): (self.info_fetcher.fetch_player_info, player_id),
+            ('player_awards', player_id): (self.info_fetcher.fetch_player_awards, player_id),
+            ('player_bio', player_id): (self.bio_scraper.fetch_player_bio, player_id),
+            ('career_stats', player_id): (self.stats_fetcher.fetch_career_stats, player_id),
+            ('season_shot_data', player_id, season): (self.shot_generator.fetch_season_shot_data, player_id, season),
+            ('player_headshot', player_id): (self.shot_generator.fetch_player_headshot, player_id),
+        }
+
+        start = time.perf_counter()
+        with span('session.profile'):
+            futures = {}
+            for key, (fetch_fn, *args) in fetches.items():
+                if self.cache is not None and key[0] in self.cache.policies:  # The headshot comes from the local asset store
+                    fetch_fn = self.cache.cached(key[0])(fetch_fn)
+                self.loader.submit(futures, key, fetch_fn, *args)
+            results = [self.loader.resolve(future) for future in futures.values()]
+
+        failed = any(result is None or (isinstance(result, dict) and not result) for result in results)
+        return time.perf_counter() - start, failed
+
+
+
+
+
+def run_load_test(simulator, player_ids, season, n_sessions=100, concurrency=10, seed=0):
+    """
+    Runs N profiler sessions, at most [concurrency] at a time, over players drawn with skewed (1/rank) popularity.
+
+    Parameters:
+    - simulator (ProfileSessionSimulator): Session simulator (its cache persists across load tests unless invalidated)
+    - player_ids (list): Player IDs to visit, most popular first
+    - season (str): Season of the shot charts (format: 'YYYY-YY')
+    - n_sessions (int): Number of sessions
+    - concurrency (int): Number of simultaneous sessions
+    - seed (int): Seed of the player draws
+
+    Returns:
+    - report (dict): Throughput, session latency percentiles, failures & the per-step span summary
+    """
+
+    rng = random.Random(seed)
+    visits = rng.choices(player_ids, weights=[1 / (rank + 1) for rank in range(len(player_ids))], k=n_sessions)
+    recorder.reset()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='pp_load_test') as executor:
+        sessions = list(executor.map(lambda player_id: simulator.run_session(player_id, season), visits))
+    duration = time.perf_counter() - start
+
+    latencies = sorted(seconds for seconds, _ in sessions)
+    return {
+        'sessions': n_sessions,
+        'concurrency': concurrency,
+        'failed_sessions': sum(failed for _, failed in sessions),
+        'duration_s': round(duration, 3),
+        'sessions_per_s': round(n_sessions / duration, 2),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 1),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 1),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 1),
+        'max_ms': round(latencies[-1] * 1000, 1),
+        'spans': recorder.summary(),
+    }
+
+
+def print_report(report, server_stats=None):
+    """
+    Prints a load test's headline numbers & its per-step span table.
+    """
+
+    print(' | '.join(f'{name}: {value}' for name, value in report.items() if name != 'spans'))
+    if server_stats is not None:
+        print(f'replay server: {server_stats}')
+    print(f'{"step":<34}{"count":>7}{"hits":>6}{"misses":>8}{"errors":>8}{"p50 ms":>10}{"p95 ms":>10}{"max ms":>10}')
+    for name, stats in report['spans'].items():
+        print(f'{name:<34}{stats["count"]:>7}{stats["cache_hits"]:>6}{stats["cache_misses"]:>8}{stats["errors"]:>8}'
+              f'{stats["p50_ms"]:>10}{stats["p95_ms"]:>10}{stats["max_ms"]:>10}')
+
+
+
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description='Records nba_api/nba.com responses or load-tests the profiler against a local replay of them.')
+    parser.add_argument('--players', type=int, nargs='+', required=True, help='player IDs (most popular first)')
+    parser.add_argument('--season', default='2023-24', help='season of the shot charts')
+    parser.add_argument('--archive', default=FIXTURE_ARCHIVE_PATH, help='fixture archive')
+    parser.add_argument('--record', action='store_true', help='record live responses (one session per player) instead of replaying')
+    parser.add_argument('--sessions', type=int, default=100, help='simulated sessions')
+    parser.add_argument('--concurrency', type=int, default=10, help='simultaneous sessions')
+    parser.add_argument('--loader-workers', type=int, default=6, help='profile loader threads (shared by all sessions, as in the app)')
+    parser.add_argument('--latency', type=float, default=0.05, help='mean added latency per replayed response (seconds)')
+    parser.add_argument('--jitter', type=float, default=0.02, help='standard deviation of the added latency (seconds)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of replayed responses turned into errors')
+    parser.add_argument('--error-status', type=int, default=503, help='HTTP status of injected errors')
+    parser.add_argument('--min-interval', type=float, default=0.0, help='minimum seconds between requests (rate budget)')
+    parser.add_argument('--no-cache', action='store_true', help='bypass the fetch cache (every session hits the fetch layer)')
+    args = parser.parse_args()
+
+    if args.record:
+        archive = FixtureArchive(args.archive)
+        simulator = ProfileSessionSimulator(min_interval=max(args.min_interval, 1.0), cache=False)  # Live API: keep the real rate budget
+        with Recorder(archive):
+            for player_id in args.players:
+                simulator.run_session(player_id, args.season)
+        archive.save()
+        print(f'Recorded {len(archive)} responses to {args.archive}')
+        return
+
+    archive = FixtureArchive.load(args.archive)
+    simulator = ProfileSessionSimulator(min_interval=args.min_interval, loader_workers=args.loader_workers, cache=not args.no_cache)
+    with ReplayServer(archive, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, error_status=args.error_status) as server:
+        report = run_load_test(simulator, args.players, args.season, args.sessions, args.concurrency)
+    print_report(report, server.stats)
+
+if __name__ == '__main__':
+    main()  # Run from 'profiler_webapp' as: python -m submodules.pp_load_test --players 2544 201939 --record, then without --record
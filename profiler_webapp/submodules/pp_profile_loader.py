@@ -0,0 +1,133 @@
+### =========================== SETUP =========================== ###
+
+# Concurrency
+from concurrent.futures import ThreadPoolExecutor
+
+# Utils
+import time
+
+# Instrumentation
+from submodules.pp_instrumentation import timed, record_error  # Span recording (SEE SUBMODULE 'pp_instrumentation.py' FOR DETAILS)
+
+# Rate Limiting (one RateLimiter for the profiler, stats compiler & shot archive, SEE ROOT MODULE 'rate_limiter.py' FOR DETAILS)
+import submodules.pp_config  # Puts the project root on sys.path (for root modules)
+from rate_limiter import RateLimiter
+
+### ============================================================= ###
+
+
+
+
+
+class ThrottleMixin:
+    """
+    Request pacing shared by the profile fetchers (expects 'rate_limiter' & 'request_interval' attributes on the fetcher).
+    """
+
+
+    @timed('throttle.wait')
+    def _throttle(self):
+        """
+        Waits for a request slot in the shared rate budget (if provided), otherwise applies the fixed buffer.
+        """
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait()
+        else:
+            time.sleep(self.request_interval)
+
+
+
+
+
+def adjacent_seasons(season_options, selected_seasons):
+    """
+    Lists the seasons next to the selected ones (the likeliest next selections), in order & without duplicates.
+
+    Parameters:
+    - season_options (list): Every season the user can select, in display order
+    - selected_seasons (list): Currently selected seasons
+
+    Returns:
+    - seasons (list): Unselected seasons adjacent to a selected season
+    """
+
+    positions = [season_options.index(season) for season in selected_seasons]
+    seasons = [season_options[i] for position in positions for i in (position - 1, position + 1)
+               if 0 <= i < len(season_options) and season_options[i] not in selected_seasons]
+    return list(dict.fromkeys(seasons))
+
+
+
+
+
+class ProfileLoader:
+    """
+    Issues a player profile's independent fetches concurrently on a shared thread pool.
+    """
+
+
+    def __init__(self, max_workers=6):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pp_profile_loader')
+
+
+    def submit(self, futures, key, fetch_fn, *args):
+        """
+        Starts a fetch unless the same (key) fetch is already running or has succeeded.
+
+        Parameters:
+        - futures (dict): Per-session dictionary of in-flight/completed fetches (i.e. kept in st.session_state)
+        - key (tuple): Unique fetch identifier (i.e. ('player_info', player_id))
+        - fetch_fn (callable): Fetch function to run in a worker thread
+        - args: Positional arguments for the fetch function
+
+        Returns:
+        - future (Future): Handle for the fetch's result
+        """
+
+        future = futures.get(key)
+        if future is None or (future.done() and future.exception() is not None):  # Failed fetches are retried
+            future = self.executor.submit(fetch_fn, *args)
+            futures[key] = future
+        return future
+
+
+    def prefetch_seasons(self, futures, player_id, season_options, selected_seasons, fetch_fn):
+        """
+        Starts the shot data fetches of the seasons adjacent to the selected ones, keyed per (player, season) like requested seasons.
+
+        Parameters:
+        - futures (dict): Per-session dictionary of in-flight/completed fetches
+        - player_id (int): Unique player id number
+        - season_options (list): Every season the user can select, in display order
+        - selected_seasons (list): Currently selected seasons
+        - fetch_fn (callable): Per-season fetch function, called as fetch_fn(player_id, season) (paced by its own rate limiter)
+
+        Returns:
+        - seasons (list): Prefetched seasons
+        """
+
+        seasons = adjacent_seasons(season_options, selected_seasons)
+        for season in seasons:
+            self.submit(futures, ('season_shots', player_id, season), fetch_fn, player_id, season)
+        return seasons
+
+
+    def resolve(self, future, timeout=None, default=None):
+        """
+        Waits for a fetch and returns its result.
+
+        Parameters:
+        - future (Future): Handle returned by submit()
+        - timeout (float): Maximum seconds to wait (default: no limit)
+        - default: Value returned if the fetch failed or timed out
+
+        Returns:
+        - result: The fetch's result (or the default value)
+        """
+
+        try:
+            return future.result(timeout=timeout)
+        except Exception as e:
+            record_error(e, 'An error occurred while loading profile data')
+            return default
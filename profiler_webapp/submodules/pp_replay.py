@@ -0,0 +1,315 @@
+### =========================== SETUP =========================== ###
+
+# Data Acquisition
+import requests
+
+# Server
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Concurrency
+import threading
+
+# Utils
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import hashlib
+import json
+import os
+import random
+import time
+import zipfile
+
+# Path Config
+from submodules.pp_config import FIXTURE_ARCHIVE_PATH
+
+### ============================================================= ###
+
+
+
+
+
+def request_key(method, url):
+    """
+    Identifies a request independently of its host's scheme & query-parameter order (shared by recording & replay).
+
+    Parameters:
+    - method (str): HTTP method
+    - url (str): Full request URL, including the query string
+
+    Returns:
+    - key (str): Fixture key
+    """
+
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return hashlib.sha1(f'{method.upper()} {parts.netloc}{parts.path}?{query}'.encode('utf-8')).hexdigest()
+
+
+def prepared_url(method, url, params=None):
+    """
+    Returns the exact URL requests would send for the given parameters (None-valued parameters dropped, values stringified).
+    """
+
+    return requests.Request(method, url, params=params).prepare().url
+
+
+
+
+
+class FixtureArchive:
+    """
+    Compressed archive of recorded HTTP responses (nba_api endpoints, nba.com pages & CDN images), keyed by request.
+    """
+
+
+    def __init__(self, path=FIXTURE_ARCHIVE_PATH):
+        self.path = path
+        self.fixtures = {}  # {key: (metadata dict, body bytes)}
+        self._lock = threading.Lock()
+
+
+    @classmethod
+    def load(cls, path=FIXTURE_ARCHIVE_PATH):
+        """
+        Reads every recorded response from an archive on disk.
+
+        Parameters:
+        - path (str): Archive path
+
+        Returns:
+        - archive (FixtureArchive): Archive holding the recorded responses
+        """
+
+        archive = cls(path)
+        with zipfile.ZipFile(path, 'r') as zf:
+            for name in zf.namelist():
+                if name.endswith('.json'):
+                    key = name[:-len('.json')]
+                    archive.fixtures[key] = (json.loads(zf.read(name)), zf.read(f'{key}.body'))
+        return archive
+
+
+    def save(self, path=None):
+        """
+        Writes the archive (one metadata & one deflated body entry per response).
+
+        Parameters:
+        - path (str): Archive path (default: the path it was created/loaded with)
+        """
+
+        path = path or self.path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._lock, zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=9) as zf:
+            for key, (metadata, body) in sorted(self.fixtures.items()):
+                zf.writestr(f'{key}.json', json.dumps(metadata, indent=1))
+                zf.writestr(f'{key}.body', body)
+
+
+    def add(self, method, url, status, content_type, body):
+        """
+        Records one response (a later recording of the same request replaces the earlier one).
+        """
+
+        metadata = {'method': method.upper(), 'url': url, 'status': status, 'content_type': content_type,
+                    'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%S')}
+        with self._lock:
+            self.fixtures[request_key(method, url)] = (metadata, body)
+
+
+    def get(self, key):
+        return self.fixtures.get(key)
+
+
+    def __len__(self):
+        return len(self.fixtures)
+
+
+
+
+
+class Recorder:
+    """
+    Captures every live requests-based response (nba_api's endpoints included) into a fixture archive while active.
+    """
+
+
+    def __init__(self, archive):
+        self.archive = archive
+        self._original_request = None
+
+
+    def __enter__(self):
+        self._original_request = original_request = requests.Session.request
+        archive = self.archive
+
+        def recording_request(session, method, url, params=None, **kwargs):
+            response = original_request(session, method, url, params=params, **kwargs)
+            if method.upper() == 'GET':
+                archive.add(method, prepared_url(method, url, params), response.status_code,
+                            response.headers.get('Content-Type', ''), response.content)
+            return response
+
+        requests.Session.request = recording_request
+        return self.archive
+
+
+    def __exit__(self, *exc_info):
+        requests.Session.request = self._original_request
+
+
+
+
+
+class ReplayServer:
+    """
+    Local HTTP server answering recorded requests, with configurable latency & error injection.
+    """
+
+
+    def __init__(self, archive, latency=0.0, jitter=0.0, error_rate=0.0, error_status=503, missing_status=404, host='127.0.0.1', port=0, seed=None):
+        self.archive = archive
+        self.latency = latency  # Mean added delay per response (seconds)
+        self.jitter = jitter  # Standard deviation of the added delay (seconds)
+        self.error_rate = error_rate  # Share of requests answered with the error status instead of the fixture
+        self.error_status = error_status
+        self.missing_status = missing_status  # Status for requests with no recorded response
+        self.stats = {'served': 0, 'errors': 0, 'missing': 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+        self._redirect = None
+
+
+    @property
+    def address(self):
+        host, port = self._server.server_address[:2]
+        return f'{host}:{port}'
+
+
+    @property
+    def base_url(self):
+        return f'http://{self.address}'
+
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name='pp_replay_server', daemon=True)
+        self._thread.start()
+        return self
+
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+    def __enter__(self):
+        self.start()
+        self._redirect = ReplayRedirect(self)
+        self._redirect.__enter__()
+        return self
+
+
+    def __exit__(self, *exc_info):
+        self._redirect.__exit__(*exc_info)
+        self.stop()
+
+
+    def _respond(self, method, path):
+        """
+        Chooses the response for a request received as '/<original host>/<original path>?<query>'.
+
+        Returns:
+        - response (tuple): (status, content type, body bytes)
+        """
+
+        with self._lock:
+            delay = max(0.0, self._random.gauss(self.latency, self.jitter)) if self.latency or self.jitter else 0.0
+            inject_error = self._random.random() < self.error_rate
+
+        if delay:
+            time.sleep(delay)
+        if inject_error:
+            self._count('errors')
+            return self.error_status, 'text/plain', b'Injected error'
+
+        fixture = self.archive.get(request_key(method, f'http:/{path}'))
+        if fixture is None:
+            self._count('missing')
+            return self.missing_status, 'text/plain', b'No recorded response'
+
+        metadata, body = fixture
+        self._count('served')
+        return metadata['status'], metadata['content_type'], body
+
+
+    def _count(self, outcome):
+        with self._lock:
+            self.stats[outcome] += 1
+
+
+    def _handler_class(self):
+        server = self
+
+        class ReplayHandler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # Keep-alive, like the live endpoints
+
+            def do_GET(self):
+                status, content_type, body = server._respond('GET', self.path)
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Silenced (load tests issue thousands of requests)
+
+        return ReplayHandler
+
+
+
+
+
+class ReplayRedirect:
+    """
+    Points nba_api (via NBAStatsHTTP.base_url) & every other outbound requests call at a replay server while active.
+    """
+
+
+    def __init__(self, server):
+        self.server = server
+        self._original_request = None
+        self._original_base_url = None
+
+
+    def __enter__(self):
+        address = self.server.address
+
+        # nba_api builds its endpoint URLs from a class-level template
+        try:
+            from nba_api.stats.library.http import NBAStatsHTTP
+            self._original_base_url = NBAStatsHTTP.base_url
+            parts = urlsplit(NBAStatsHTTP.base_url)  # i.e. 'https://stats.nba.com/stats/{endpoint}'
+            NBAStatsHTTP.base_url = f'http://{address}/{parts.netloc}{parts.path}'
+        except ImportError:
+            pass
+
+        # Remaining hosts (nba.com pages & CDN images) are rewritten to '/<host>/<path>' on the replay server
+        self._original_request = original_request = requests.Session.request
+
+        def redirected_request(session, method, url, params=None, **kwargs):
+            parts = urlsplit(prepared_url(method, url, params))
+            if parts.netloc != address:
+                url, params = f'http://{address}/{parts.netloc}{parts.path}' + (f'?{parts.query}' if parts.query else ''), None
+            return original_request(session, method, url, params=params, **kwargs)
+
+        requests.Session.request = redirected_request
+        return self.server
+
+
+    def __exit__(self, *exc_info):
+        requests.Session.request = self._original_request
+        if self._original_base_url is not None:
+            from nba_api.stats.library.http import NBAStatsHTTP
+            NBAStatsHTTP.base_url = self._original_base_url
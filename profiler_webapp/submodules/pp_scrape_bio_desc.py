@@ -1,30 +1,37 @@
 ### =========================== SETUP =========================== ###
 
 # Data Acquisition
-import requests
 from bs4 import BeautifulSoup
 
-# Utils
-import time
+# Transport
+from submodules.pp_http import http_get  # Pooled HTTP session (SEE SUBMODULE 'pp_http.py' FOR DETAILS)
+
+# Instrumentation
+from submodules.pp_instrumentation import timed, record_error  # Span recording (SEE SUBMODULE 'pp_instrumentation.py' FOR DETAILS)
+
+# Request Pacing (shared rate budget or fixed wait-time, SEE SUBMODULE 'pp_profile_loader.py' FOR DETAILS)
+from submodules.pp_profile_loader import ThrottleMixin
 
 ### ============================================================= ###
 
 
 
-class PlayerBioScraper:
+class PlayerBioScraper(ThrottleMixin):
     """
     Extracts player bio for application display.
     """
 
 
-    def __init__(self):
+    def __init__(self, rate_limiter=None):
         self.base_url = 'https://www.nba.com/player/{}/bio'  # base URL for player bio webpage
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36'
         }
         self.request_interval = 0.5  # Custom wait-time to avoid API rate limits
+        self.rate_limiter = rate_limiter  # Optional shared RateLimiter (see 'rate_limiter.py'); replaces the fixed wait-time
 
 
+    @timed('fetch.player_bio', measure_bytes=True)
     def fetch_player_bio(self, player_id):
         """
         Scrapes the bio description from the league webpage for a given player ID.
@@ -39,9 +46,9 @@ class PlayerBioScraper:
         try:
 
             # Construct the player's bio URL and send GET request
-            time.sleep(self.request_interval)  # OPTIONAL (buffer for any previous request)
+            self._throttle()  # OPTIONAL (buffer for any previous request)
             url = self.base_url.format(player_id)
-            response = requests.get(url, headers=self.headers)
+            response = http_get(url, headers=self.headers)  # Pooled keep-alive session
             response.raise_for_status()  # Raise error for bad HTTP responses
 
             # Parse the response HTML and locate the bio section
@@ -54,12 +61,13 @@ class PlayerBioScraper:
 
             return formatted_bio
 
-        except Exception:
+        except Exception as e:
 
-            print(f'An error occurred while fetching player info. Please try again.')
+            record_error(e, 'An error occurred while fetching player bio')
             return {}
 
 
+    @timed('process.bio_text')
     def _clean_bio_text(self, bio_text, player_id):
         """
         Processes the raw bio text to add section titles and paragraph breaks.
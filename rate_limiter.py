@@ -0,0 +1,23 @@
+import threading
+import time
+
+class RateLimiter:
+    """Thread-safe limiter that spaces out request start times across all worker threads (and every fetcher sharing it)."""
+
+    def __init__(self, requests_per_second=None, min_interval=None):
+        """Spaces requests min_interval seconds apart (or 1 / requests_per_second; no spacing if neither is set)."""
+        if min_interval is None:
+            min_interval = 1 / requests_per_second if requests_per_second else 0
+        self.interval = min_interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Blocks until the calling thread's request slot opens up & returns the seconds spent waiting."""
+        with self._lock:  # Reserve the slot under the lock, then sleep outside of it so other threads can reserve theirs
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        waited = max(0.0, slot - now)
+        time.sleep(waited)
+        return waited
@@ -0,0 +1,182 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import time
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.model_selection import GridSearchCV
+from feature_store import FeatureStore, FEATURE_STORE_DIR
+
+# Defining the paths for the lineup training data, the exported models & the fold / search cache
+TRAIN_PATH = './cln_train.csv'
+MODEL_DIR = './data/models'
+CACHE_DIR = './data/models/cache'
+MANIFEST_NAME = 'manifest.json'
+
+# Rating models trained on the lineups' archetype counts: {model name: target column}
+TARGETS = {'off': 'OffRtg', 'def': 'DefRtg', 'net': 'NetRtg'}
+
+# Hyperparameter grid searched for every target (the visualizer's original forest is n_estimators=25, max_depth=10)
+PARAM_GRID = {
+    'n_estimators': [25, 50, 100],
+    'max_depth': [5, 10, None],
+    'min_samples_leaf': [1, 2, 4],
+    'max_features': [1.0, 'sqrt'],
+}
+
+# Cross-validation settings (fixed seed so folds & forests are reproducible across runs)
+N_SPLITS = 5
+SEED = 42
+N_JOBS = -1
+SCORING = 'neg_root_mean_squared_error'
+
+def feature_columns(df):
+    """Returns the archetype count columns (i.e. g_cls_1 ... b_cls_3) used as model features."""
+    return [col for col in df.columns if '_cls_' in str(col)]
+
+def data_hash(X, y):
+    """Hashes the feature matrix & target so cached folds/models are reused only for identical training data."""
+    digest = hashlib.sha256()
+    for array in (X, y):
+        array = np.ascontiguousarray(array, dtype=np.float64)
+        digest.update(str(array.shape).encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+def _cache_key(*parts):
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+def cached_folds(X_hash, n_rows, n_splits=N_SPLITS, seed=SEED, cache_dir=CACHE_DIR):
+    """Returns (train rows, test rows) splits from a cached per-row fold assignment, creating it on first use."""
+
+    path = os.path.join(cache_dir, f'folds_{_cache_key(X_hash, n_splits, seed)}.npy')
+    if os.path.exists(path):
+        fold_ids = np.load(path)
+    else:
+        # Shuffled, near-equal folds (the same assignment as a shuffled KFold)
+        fold_ids = np.empty(n_rows, dtype=np.int16)
+        fold_ids[np.random.RandomState(seed).permutation(n_rows)] = np.arange(n_rows) % n_splits
+        os.makedirs(cache_dir, exist_ok=True)
+        np.save(path, fold_ids)
+
+    return [(np.flatnonzero(fold_ids != fold), np.flatnonzero(fold_ids == fold)) for fold in range(n_splits)]
+
+def search_rating_model(X, y, param_grid=PARAM_GRID, n_splits=N_SPLITS, seed=SEED, n_jobs=N_JOBS, cache_dir=CACHE_DIR):
+    """Grid-searches a random forest for one target with cross-validation spread across n_jobs workers.
+
+    Returns the refit best model & a report of its hyperparameters, CV error and timings. Results are cached by
+    training-data hash, grid & CV settings, so unchanged targets are skipped on later runs.
+    """
+
+    X_hash = data_hash(X, np.zeros(0))
+    key = _cache_key(data_hash(X, y), param_grid, n_splits, seed, sklearn.__version__)
+    path = os.path.join(cache_dir, f'search_{key}.joblib')
+    if os.path.exists(path):
+        model, report = joblib.load(path)
+        return model, dict(report, cached=True)
+
+    start = time.perf_counter()
+    search = GridSearchCV(RandomForestRegressor(random_state=seed), param_grid, scoring=SCORING,
+                          cv=cached_folds(X_hash, len(y), n_splits, seed, cache_dir), n_jobs=n_jobs, refit=True)
+    search.fit(X, y)
+    search_seconds = time.perf_counter() - start
+
+    # Single-row predictions mirror the visualizer's use of the model
+    model = search.best_estimator_
+    start = time.perf_counter()
+    model.predict(X[:1])
+    predict_ms = (time.perf_counter() - start) * 1000
+
+    best = search.best_index_
+    report = {
+        'params': search.best_params_,
+        'cv_rmse': float(-search.cv_results_['mean_test_score'][best]),
+        'cv_rmse_std': float(search.cv_results_['std_test_score'][best]),
+        'candidates': len(search.cv_results_['params']),
+        'folds': n_splits,
+        'search_seconds': round(search_seconds, 3),
+        'mean_fit_seconds': round(float(search.cv_results_['mean_fit_time'][best]), 4),
+        'mean_score_seconds': round(float(search.cv_results_['mean_score_time'][best]), 4),
+        'refit_seconds': round(float(search.refit_time_), 4),
+        'predict_ms': round(predict_ms, 3),
+        'data_hash': data_hash(X, y),
+        'cached': False,
+    }
+
+    os.makedirs(cache_dir, exist_ok=True)
+    joblib.dump((model, report), path)
+    return model, report
+
+def train_rating_models(train_df, targets=TARGETS, param_grid=PARAM_GRID, n_splits=N_SPLITS, seed=SEED, n_jobs=N_JOBS,
+                        cache_dir=CACHE_DIR):
+    """Runs the cross-validated search for every target & returns ({name: model}, {name: report})."""
+
+    feature_cols = feature_columns(train_df)
+    X = train_df[feature_cols].to_numpy(dtype=np.float64)
+    models, reports = {}, {}
+    for name, target in targets.items():
+        y = train_df[target].to_numpy(dtype=np.float64)
+        models[name], reports[name] = search_rating_model(X, y, param_grid, n_splits, seed, n_jobs, cache_dir)
+        reports[name].update({'target': target, 'features': feature_cols})
+        report = reports[name]
+        timing = 'cached' if report['cached'] else f'{report["search_seconds"]}s search, {report["refit_seconds"]}s refit'
+        logging.info(f'LOG: [{name}] {target}: CV RMSE {report["cv_rmse"]:.2f} with {report["params"]} '
+                     f'({timing}, {report["predict_ms"]}ms predict)')
+    return models, reports
+
+def export_rating_models(models, reports, model_dir=MODEL_DIR):
+    """Writes each model (joblib) & a JSON manifest of their reports for the visualizer to load."""
+
+    os.makedirs(model_dir, exist_ok=True)
+    manifest = {}
+    for name, model in models.items():
+        file_name = f'{name}_model.joblib'
+        joblib.dump(model, os.path.join(model_dir, file_name))
+        manifest[name] = dict(reports[name], file=file_name)
+
+    with open(os.path.join(model_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=1)
+    logging.info(f'LOG: Exported {sorted(models)} models to {model_dir}.')
+
+def load_rating_models(model_dir=MODEL_DIR, names=None):
+    """Loads exported models as {name: model} (raises FileNotFoundError if nothing has been exported)."""
+    with open(os.path.join(model_dir, MANIFEST_NAME), 'r') as f:
+        manifest = json.load(f)
+    names = manifest if names is None else names
+    return {name: joblib.load(os.path.join(model_dir, manifest[name]['file'])) for name in names}
+
+def main():
+    """Parses command-line options, searches & exports the offensive, defensive and net rating models."""
+
+    parser = argparse.ArgumentParser(description='Cross-validates & exports the lineup rating models.')
+    parser.add_argument('--input', default=TRAIN_PATH, help='lineup training data CSV')
+    parser.add_argument('--model-dir', default=MODEL_DIR, help='directory the chosen models are exported to')
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help='directory for cached folds & searches')
+    parser.add_argument('--targets', nargs='+', default=list(TARGETS), choices=list(TARGETS), help='models to train')
+    parser.add_argument('--folds', type=int, default=N_SPLITS, help='cross-validation folds')
+    parser.add_argument('--jobs', type=int, default=N_JOBS, help='parallel workers (-1 uses all cores)')
+    parser.add_argument('--seed', type=int, default=SEED, help='random seed for reproducible folds & forests')
+    parser.add_argument('--from-store', action='store_true', help='read the training data from the feature store')
+    parser.add_argument('--store', default=FEATURE_STORE_DIR, help='feature store directory used with --from-store')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    if args.from_store:
+        lineup_train = FeatureStore(args.store).load('lineup_train')
+        train_df = lineup_train.to_frame()
+        logging.info(f'LOG: Loaded lineup training data from feature store v{lineup_train.version}.')
+    else:
+        train_df = pd.read_csv(args.input, sep=',', header=0)
+
+    targets = {name: TARGETS[name] for name in args.targets}
+    models, reports = train_rating_models(train_df, targets, n_splits=args.folds, seed=args.seed, n_jobs=args.jobs,
+                                          cache_dir=args.cache_dir)
+    export_rating_models(models, reports, args.model_dir)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+import argparse
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+import numpy as np
+import pandas as pd
+from rate_limiter import RateLimiter
+
+# Defining the archive location (one 'season=YYYY-YY' partition per season) & the staging area of in-progress ingests
+ARCHIVE_DIR = './data/shot_archive'
+STAGING_DIR_NAME = '_staging'
+META_NAME = 'meta.json'
+LEAGUE_AVG_NAME = 'league_averages.csv'
+
+# Shots are sorted by player (then game & event) within a partition, so each player's shots are one contiguous row range
+SORT_COLS = ['PLAYER_ID', 'GAME_ID', 'GAME_EVENT_ID']
+
+# Ingest settings (one league-wide ShotChartDetail request per team & season)
+MAX_WORKERS = 4
+REQUEST_INTERVAL = 1.0  # Minimum seconds between request starts across all workers, to stay under the API's rate limits
+
+def season_in_progress(season, today=None):
+    """Returns whether an NBA season (format: 'YYYY-YY') may still gain shots (seasons roll over in October)."""
+    today = today or date.today()
+    current_start_year = today.year if today.month >= 10 else today.year - 1
+    return int(season[:4]) >= current_start_year
+
+def fetch_team_season(team_id, season):
+    """Fetches every regular-season shot taken by a team's players in a season, plus the league averages (via nba_api)."""
+    from nba_api.stats.endpoints import shotchartdetail
+    shot_data = shotchartdetail.ShotChartDetail(
+        player_id=0,  # All players
+        team_id=team_id,
+        season_nullable=season,
+        season_type_all_star='Regular Season',
+        context_measure_simple='FGA',
+    ).get_data_frames()
+    return shot_data[0], shot_data[1]
+
+def all_team_ids():
+    """Returns the id of every NBA team (from the static list bundled with nba_api, no API requests)."""
+    from nba_api.stats.static import teams
+    return [team['id'] for team in teams.get_teams()]
+
+class SeasonPartition:
+    """One season of league-wide shots, stored column by column as memory-mapped arrays sorted by player id."""
+
+    def __init__(self, path):
+        """Opens a finalized partition; only the small offsets index is read up front, shot columns are mapped on first use."""
+        self.path = path
+        with open(os.path.join(path, META_NAME), 'r') as f:
+            self.meta = json.load(f)
+        self.season = self.meta['season']
+        self.player_ids = np.load(os.path.join(path, 'player_ids.npy'))
+        self.offsets = np.load(os.path.join(path, 'offsets.npy'))
+        self._columns = {}
+        self._league_averages = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.meta['n_rows']
+
+    @property
+    def complete(self):
+        return self.meta['complete']
+
+    def column(self, name):
+        """Returns a (memory-mapped) stored column; text columns come back as integer codes into meta['columns'][name]['categories']."""
+        array = self._columns.get(name)
+        if array is None:
+            array = np.load(os.path.join(self.path, f'{name}.npy'), mmap_mode='r')
+            with self._lock:
+                self._columns[name] = array
+        return array
+
+    def player_range(self, player_id):
+        """Returns the (start, stop) rows of a player's shots (an empty range if the player has none this season)."""
+        position = np.searchsorted(self.player_ids, player_id)
+        if position == len(self.player_ids) or self.player_ids[position] != player_id:
+            return 0, 0
+        return int(self.offsets[position]), int(self.offsets[position + 1])
+
+    def to_frame(self, start=0, stop=None):
+        """Decodes a row range of every column into a dataframe laid out like the ShotChartDetail response."""
+
+        stop = len(self) if stop is None else stop
+        data = {}
+        for name, spec in self.meta['columns'].items():
+            values = self.column(name)[start:stop]
+            if 'categories' in spec:
+                data[name] = np.asarray(spec['categories'], dtype=object)[values]
+            else:
+                data[name] = values.astype(spec['dtype'])
+        frame_df = pd.DataFrame(data, columns=list(self.meta['columns']))
+        frame_df['SEASON'] = self.season
+        return frame_df
+
+    def player_shots(self, player_id):
+        """Returns a player's shots for the season with a single range scan over the sorted columns."""
+        return self.to_frame(*self.player_range(int(player_id)))
+
+    def league_averages(self):
+        """Returns the season's league-average shooting by zone (read once per partition)."""
+        if self._league_averages is None:
+            self._league_averages = pd.read_csv(os.path.join(self.path, LEAGUE_AVG_NAME))
+            self._league_averages['SEASON'] = self.season
+        return self._league_averages.copy()
+
+class ShotArchive:
+    """Directory of season partitions that serves any player's season shots from disk, with no API requests."""
+
+    def __init__(self, root=ARCHIVE_DIR):
+        self.root = root
+        self._partitions = {}
+        self._lock = threading.Lock()
+
+    def partition_dir(self, season):
+        return os.path.join(self.root, f'season={season}')
+
+    def staging_dir(self, season):
+        return os.path.join(self.root, STAGING_DIR_NAME, season)
+
+    def seasons(self):
+        """Returns the finalized seasons, oldest first."""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name.split('=', 1)[1] for name in os.listdir(self.root)
+                      if name.startswith('season=') and os.path.exists(os.path.join(self.root, name, META_NAME)))
+
+    def partition(self, season):
+        """Returns a season's partition (opened once per archive instance), or None if the season hasn't been archived."""
+        partition = self._partitions.get(season)
+        if partition is None:
+            if not os.path.exists(os.path.join(self.partition_dir(season), META_NAME)):
+                return None
+            partition = SeasonPartition(self.partition_dir(season))
+            with self._lock:
+                self._partitions[season] = partition
+        return partition
+
+    def player_season(self, player_id, season, complete_only=True):
+        """Returns a player's (shots, league averages) for a season, or None if the season isn't archived (or, by default, was archived mid-season)."""
+        partition = self.partition(season)
+        if partition is None or (complete_only and not partition.complete):
+            return None
+        return partition.player_shots(player_id), partition.league_averages()
+
+    def ingest(self, season, team_ids, fetch_fn=fetch_team_season, max_workers=MAX_WORKERS, request_interval=REQUEST_INTERVAL, force=False,
+               rate_limiter=None):
+        """Fetches every team's shots for a season concurrently into staging, then finalizes the partition once all teams are in.
+
+        Each team's response is staged as soon as it arrives, so an interrupted or partly failed ingest resumes with only
+        the missing teams. Requests are spaced by one rate limiter shared across the workers (request_interval seconds apart,
+        unless a limiter shared with other ingests is given), so more workers never raise the request rate. Returns the team
+        ids that could not be fetched (the partition is only written if there are none).
+        """
+
+        if not force and self.partition(season) is not None:
+            logging.info(f'LOG: Season {season} is already archived (use force to rebuild it).')
+            return []
+
+        staging_dir = self.staging_dir(season)
+        if force:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+        os.makedirs(staging_dir, exist_ok=True)
+        pending = [team_id for team_id in team_ids if not os.path.exists(self._staged_path(season, team_id))]
+        logging.info(f'LOG: Ingesting {season} shots for {len(pending)} teams ({len(team_ids) - len(pending)} already staged)...')
+        rate_limiter = rate_limiter or RateLimiter(min_interval=request_interval)
+
+        def stage(team_id):
+            rate_limiter.wait()
+            try:
+                shots_df, league_avg_df = fetch_fn(team_id, season)
+            except Exception as e:
+                logging.warning(f'LOG: Could not fetch {season} shots of team {team_id} ({e!r}).')
+                return False
+            path = self._staged_path(season, team_id)
+            pd.to_pickle((shots_df, league_avg_df), path + '.tmp')
+            os.replace(path + '.tmp', path)  # A staged team is either complete or absent
+            return True
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            staged = list(executor.map(stage, pending))
+        failed = [team_id for team_id, ok in zip(pending, staged) if not ok]
+        if failed:
+            logging.warning(f'LOG: {len(failed)} teams missing for {season}; re-run the ingest to resume.')
+            return failed
+
+        self.finalize(season, team_ids)
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        return []
+
+    def finalize(self, season, team_ids):
+        """Sorts the staged shots by player & writes them as a partition (columns, player offsets index & league averages)."""
+
+        staged = [pd.read_pickle(self._staged_path(season, team_id)) for team_id in team_ids]
+        shots_df = pd.concat([shots_df for shots_df, _ in staged], ignore_index=True)
+        shots_df = shots_df.sort_values(SORT_COLS, kind='stable', ignore_index=True)
+        league_avg_df = staged[0][1] if staged else pd.DataFrame()
+
+        os.makedirs(self.root, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix='.finalizing_', dir=self.root)
+        columns = {}
+        for name in shots_df.columns:
+            values = shots_df[name]
+            if pd.api.types.is_numeric_dtype(values):
+                np.save(os.path.join(tmp_dir, f'{name}.npy'), values.to_numpy())
+                columns[name] = {'dtype': str(values.dtype)}
+            else:  # Text columns (names, zones, game ids & dates) are dictionary-encoded
+                codes, categories = pd.factorize(values.astype(str), sort=True)
+                np.save(os.path.join(tmp_dir, f'{name}.npy'), codes.astype(np.int16 if len(categories) < 2 ** 15 else np.int32))
+                columns[name] = {'dtype': 'object', 'categories': categories.tolist()}
+
+        player_ids, starts = np.unique(shots_df['PLAYER_ID'].to_numpy(dtype=np.int64), return_index=True)
+        np.save(os.path.join(tmp_dir, 'player_ids.npy'), player_ids)
+        np.save(os.path.join(tmp_dir, 'offsets.npy'), np.append(starts, len(shots_df)).astype(np.int64))
+        league_avg_df.to_csv(os.path.join(tmp_dir, LEAGUE_AVG_NAME), index=False)
+        with open(os.path.join(tmp_dir, META_NAME), 'w') as f:
+            json.dump({'season': season, 'n_rows': len(shots_df), 'n_players': len(player_ids), 'team_ids': [int(team_id) for team_id in team_ids],
+                       'complete': not season_in_progress(season), 'built_at': datetime.now().isoformat(timespec='microseconds'),  # Also identifies the build
+                       'columns': columns}, f)
+
+        # Swap the new partition into place (readers only ever see a fully written one)
+        partition_dir = self.partition_dir(season)
+        if os.path.exists(partition_dir):
+            shutil.rmtree(partition_dir)
+        os.replace(tmp_dir, partition_dir)
+        with self._lock:
+            self._partitions.pop(season, None)
+        logging.info(f'LOG: Archived {len(shots_df)} {season} shots of {len(player_ids)} players into {partition_dir}.')
+
+    def _staged_path(self, season, team_id):
+        return os.path.join(self.staging_dir(season), f'{team_id}.pkl')
+
+def main():
+    """Parses command-line options, ingests the given seasons' league-wide shots & optionally exports one as the explorer's CSVs."""
+
+    parser = argparse.ArgumentParser(description='Builds a season-partitioned archive of league-wide shot detail.')
+    parser.add_argument('--seasons', nargs='+', required=True, help='seasons to ingest (format: YYYY-YY)')
+    parser.add_argument('--archive', default=ARCHIVE_DIR, help='archive directory')
+    parser.add_argument('--teams', type=int, nargs='+', help='team ids (default: all teams, via nba_api)')
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS, help='concurrent team requests')
+    parser.add_argument('--interval', type=float, default=REQUEST_INTERVAL, help='minimum seconds between requests (shared by all workers)')
+    parser.add_argument('--force', action='store_true', help='re-ingest seasons that are already archived')
+    parser.add_argument('--export', metavar='SEASON', help="write a season's shots & league averages to shot_profiles.csv / league_avg.csv")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    archive = ShotArchive(args.archive)
+    team_ids = args.teams or all_team_ids()
+    rate_limiter = RateLimiter(min_interval=args.interval)  # One request budget across every season's workers
+    failed = {season: archive.ingest(season, team_ids, max_workers=args.workers, force=args.force, rate_limiter=rate_limiter)
+              for season in args.seasons}
+
+    partition = archive.partition(args.export) if args.export else None
+    if partition is not None:
+        partition.to_frame().drop(columns='SEASON').to_csv('./shot_profiles.csv', index=False)
+        partition.league_averages().drop(columns='SEASON').to_csv('./league_avg.csv', index=False)
+        logging.info(f'LOG: Exported {len(partition)} {args.export} shots to ./shot_profiles.csv.')
+    elif args.export:
+        logging.warning(f'LOG: Season {args.export} is not archived, nothing exported.')
+
+    if any(failed.values()):
+        raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+import logging
+import numpy as np
+import pandas as pd
+
+# Defining the paths for the league shot profiles CSV and the pre-binned index built from it
+SHOT_DATA_PATH = './shot_profiles.csv'
+INDEX_PATH = './shot_index.npz'
+
+# Fixed half-court grid (in LOC_X / LOC_Y units) that every player's shots are binned into
+GRID_SIZE = 100
+X_EDGES = np.linspace(-250, 250, GRID_SIZE + 1)
+Y_EDGES = np.linspace(-60, 410, GRID_SIZE + 1)
+
+def _grid_bins(edges, values):
+    """Returns each value's bin on the grid edges (-1 or GRID_SIZE outside of them, the last edge falls in the last bin)."""
+    bins = np.searchsorted(edges, values, side='right') - 1
+    bins[values == edges[-1]] = GRID_SIZE - 1
+    return bins
+
+class ShotIndex:
+    """Stores each player's shots pre-binned into a fixed court grid so lineup charts only sum a few histograms."""
+
+    def __init__(self, player_ids, player_names, attempts, makes):
+        """Instantiates the index from aligned arrays of player ids, names & per-player (grid x grid) histograms."""
+        self.player_ids = np.asarray(player_ids, dtype=np.int64)
+        self.player_names = np.asarray(player_names, dtype=object)
+        self.attempts = attempts
+        self.makes = makes
+        self._id_rows = {pid: row for row, pid in enumerate(self.player_ids.tolist())}
+        self._name_rows = {name: row for row, name in enumerate(self.player_names.tolist())}
+
+    @classmethod
+    def build(cls, shots_df):
+        """Bins every shot in the input dataframe into its player's histogram with a single bincount pass."""
+
+        logging.debug('Partitioning shot records by player id & binning onto the fixed court grid...')
+        shots_df = shots_df.dropna(subset=['PLAYER_ID'])  # Unattributed shots would get a -1 player code
+        codes, player_ids = pd.factorize(shots_df['PLAYER_ID'], sort=True)
+        names = shots_df.groupby('PLAYER_ID')['PLAYER_NAME'].first().reindex(player_ids).values
+
+        # Locate each shot's grid cell & drop shots that fall outside of the charted half-court
+        # (the last bin includes its right edge, as in np.histogram2d)
+        x_bin = _grid_bins(X_EDGES, shots_df['LOC_X'].values)
+        y_bin = _grid_bins(Y_EDGES, shots_df['LOC_Y'].values)
+        in_grid = (x_bin >= 0) & (x_bin < GRID_SIZE) & (y_bin >= 0) & (y_bin < GRID_SIZE)
+
+        # Flatten (player, x, y) into one cell id so all histograms are filled at once
+        n_cells = len(player_ids) * GRID_SIZE * GRID_SIZE
+        cell_ids = (codes * GRID_SIZE + x_bin) * GRID_SIZE + y_bin
+        cell_ids, made = cell_ids[in_grid], shots_df['SHOT_MADE_FLAG'].values[in_grid]
+        shape = (len(player_ids), GRID_SIZE, GRID_SIZE)
+        attempts = np.bincount(cell_ids, minlength=n_cells).astype(np.int32).reshape(shape)
+        makes = np.bincount(cell_ids, weights=made, minlength=n_cells).astype(np.int32).reshape(shape)
+
+        return cls(player_ids, names, attempts, makes)
+
+    @classmethod
+    def from_csv(cls, path=SHOT_DATA_PATH):
+        """Reads only the shot columns needed for binning from the raw shot profiles CSV & builds the index."""
+        cols = ['PLAYER_ID', 'PLAYER_NAME', 'LOC_X', 'LOC_Y', 'SHOT_MADE_FLAG']
+        return cls.build(pd.read_csv(path, usecols=cols))
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        """Loads a previously saved index from disk."""
+        data = np.load(path, allow_pickle=True)
+        return cls(data['player_ids'], data['player_names'], data['attempts'], data['makes'])
+
+    @classmethod
+    def load_or_build(cls, index_path=INDEX_PATH, shot_data_path=SHOT_DATA_PATH):
+        """Loads the saved index if available, otherwise builds it from the raw shot data & saves it for next time."""
+        try:
+            return cls.load(index_path)
+        except FileNotFoundError:
+            logging.info('LOG: No shot index found, building one from the raw shot profiles...')
+            index = cls.from_csv(shot_data_path)
+            index.save(index_path)
+            return index
+
+    def save(self, path=INDEX_PATH):
+        """Writes the index arrays to a compressed NumPy archive."""
+        np.savez_compressed(path, player_ids=self.player_ids, player_names=self.player_names,
+                            attempts=self.attempts, makes=self.makes)
+
+    def rows(self, players):
+        """Maps player ids or names to their histogram rows (players without any recorded shots are skipped)."""
+        rows = []
+        for player in players:
+            row = self._name_rows.get(player) if isinstance(player, str) else self._id_rows.get(int(player))
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    def lineup_histogram(self, players, made_only=False):
+        """Returns the combined (grid x grid) shot histogram for the input players, indexed as [x_bin, y_bin]."""
+        hists = self.makes if made_only else self.attempts
+        return hists[self.rows(players)].sum(axis=0)
+
+def main():
+    """Builds the shot index from the raw shot profiles and saves it for the lineup visualizer."""
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    index = ShotIndex.from_csv(SHOT_DATA_PATH)
+    index.save(INDEX_PATH)
+    logging.info(f'LOG: Indexed shots for {len(index.player_ids)} players into {INDEX_PATH}.')
+
+if __name__ == '__main__':
+    main()
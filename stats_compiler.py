@@ -0,0 +1,446 @@
+import argparse
+import json
+import logging
+import os
+import re
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
+import pandas as pd
+from player_identity import PlayerIdentityResolver
+from rate_limiter import RateLimiter
+
+# Defining the default season, output and checkpoint paths for the compiled player statistics & lineup data
+SEASON = '2021-22'
+SEASON_TYPE = 'Regular Season'
+OUTPUT_DIR = '.'
+CHECKPOINT_DIR = './data/compiler_checkpoints'
+
+# Request settings (stats endpoints throttle aggressive clients, so requests are spread out across workers)
+MAX_WORKERS = 4
+REQUESTS_PER_SECOND = 1.0
+MAX_RETRIES = 3
+REQUEST_TIMEOUT = 30
+
+# Shot-zone names returned by the shot-location endpoints & the short codes used in the column naming convention
+ZONE_CODES = {
+    'Restricted Area': 'RA', 'In The Paint (Non-RA)': 'PT_nonRA', 'Mid-Range': 'MR', 'Left Corner 3': 'LC',
+    'Right Corner 3': 'RC', 'Above the Break 3': 'ATB3', 'Backcourt': 'BC', 'Corner 3': 'Corner3',
+}
+
+# Each table is defined by its endpoint, endpoint parameters & a map of returned headers to the project's column names
+TableSpec = namedtuple('TableSpec', ['endpoint', 'params', 'columns', 'keys', 'aggregate'], defaults=[('PLAYER_ID', 'PLAYER'), False])
+
+def _dash(measure, columns):
+    return TableSpec('LeagueDashPlayerStats', {'measure_type_detailed_defense': measure, 'per_mode_detailed': 'Totals'}, columns)
+
+def _playtype(play_type, grouping, prefix):
+    params = {'play_type_nullable': play_type, 'type_grouping_nullable': grouping, 'player_or_team_abbreviation': 'P', 'per_mode_simple': 'Totals'}
+    return TableSpec('SynergyPlayTypes', params, {'FGM': prefix + 'FGM', 'FGA': prefix + 'FGA'}, aggregate=True)  # Traded players are listed per team
+
+def _pt_shot(range_param, range_value, prefix):
+    columns = {'FG2A': prefix + '2FGA', 'FG2M': prefix + '2FGM', 'FG3A': prefix + '3PA', 'FG3M': prefix + '3PM'}
+    return TableSpec('LeagueDashPlayerPtShot', {range_param: range_value, 'per_mode_simple': 'Totals'}, columns)
+
+def _pt_stats(measure, columns):
+    return TableSpec('LeagueDashPtStats', {'pt_measure_type': measure, 'player_or_team': 'Player', 'per_mode_simple': 'Totals'}, columns)
+
+def _zones(measure, prefix):
+    columns = {f'{code}_{stat}': f'{prefix}{code}_{stat}' for code in ['RA', 'PT_nonRA', 'MR', 'Corner3', 'ATB3'] for stat in ['FGA', 'FGM']}
+    return TableSpec('LeagueDashPlayerShotLocations', {'distance_range': 'By Zone', 'measure_type_simple': measure, 'per_mode_detailed': 'Totals'}, columns)
+
+TABLE_SPECS = {
+
+    # Standard stats
+    'player_bio': TableSpec('PlayerIndex', {}, {'TEAM_ABBREVIATION': 'TEAM', 'POSITION': 'POS', 'HEIGHT': 'H'}),
+    'trad_stats': _dash('Base', {
+        'GP': 'GP', 'MIN': 'MIN', 'PTS': 'PTS', 'FGM': 'FGM', 'FGA': 'FGA', 'FG_PCT': 'FG%', 'FG3M': '3PM', 'FG3A': '3PA', 'FG3_PCT': '3P%',
+        'FTM': 'FTM', 'FTA': 'FTA', 'FT_PCT': 'FT%', 'REB': 'REB', 'AST': 'AST', 'TOV': 'TOV', 'STL': 'STL', 'BLK': 'BLK'}),
+    'adv_stats': _dash('Advanced', {'POSS': 'POSS'}),
+    'usg_stats': _dash('Usage', {
+        'USG_PCT': 'USG%', 'PCT_FGA': '%FGA', 'PCT_FG3A': '%3PA', 'PCT_FTA': '%FTA', 'PCT_REB': '%REB', 'PCT_AST': '%AST',
+        'PCT_BLKA': '%BLKA', 'PCT_PFD': '%PFD', 'PCT_PTS': '%PTS'}),
+    'scoring_stats': _dash('Scoring', {
+        'PCT_FGA_2PT': '%FGA2PT', 'PCT_FGA_3PT': '%FGA3PT', 'PCT_PTS_2PT': '%PTS2PT', 'PCT_PTS_2PT_MR': '%PTS2PT MR',
+        'PCT_PTS_3PT': '%PTS3PT', 'PCT_PTS_FB': '%PTSFBPs', 'PCT_PTS_FT': '%PTSFT', 'PCT_PTS_OFF_TOV': '%PTSOffTO',
+        'PCT_PTS_PAINT': '%PTSPITP', 'PCT_AST_2PM': '2FGM%AST', 'PCT_UAST_2PM': '2FGM%UAST', 'PCT_AST_3PM': '3FGM%AST',
+        'PCT_UAST_3PM': '3FGM%UAST'}),
+    'opp_stats': TableSpec('LeagueDashPlayerStats', {'measure_type_detailed_defense': 'Opponent', 'per_mode_detailed': 'Totals'}, {
+        'OPP_FGA': 'OppFGA', 'OPP_FGM': 'OppFGM', 'OPP_FG3A': 'Opp3PA', 'OPP_FG3M': 'Opp3PM', 'OPP_FTA': 'OppFTA',
+        'OPP_TOV': 'OppTOV', 'OPP_PF': 'OppPF'}, aggregate=True),
+    'def_stats': _dash('Defense', {'OPP_PTS_FB': 'OppPTSFB', 'OPP_PTS_PAINT': 'OppPTSPAINT', 'DEF_WS': 'DEFWS'}),
+
+    # Offensive Play-Type stats
+    'trsn_o_stats': _playtype('Transition', 'offensive', 'trsn_'),
+    'iso_o_stats': _playtype('Isolation', 'offensive', 'iso_'),
+    'pnrbh_o_stats': _playtype('PRBallHandler', 'offensive', 'pnrbh_'),
+    'pnrrm_o_stats': _playtype('PRRollman', 'offensive', 'pnrrm_'),
+    'postup_o_stats': _playtype('Postup', 'offensive', 'postup_'),
+    'spotup_o_stats': _playtype('Spotup', 'offensive', 'spotup_'),
+    'handoff_o_stats': _playtype('Handoff', 'offensive', 'handoff_'),
+    'cuts_o_stats': _playtype('Cut', 'offensive', 'cuts_'),
+    'offscrn_o_stats': _playtype('OffScreen', 'offensive', 'offscrn_'),
+    'putbk_o_stats': _playtype('OffRebound', 'offensive', 'putbk_'),
+
+    # Defensive Play-Type stats
+    'iso_d_stats': _playtype('Isolation', 'defensive', 'opp_iso_'),
+    'pnrbh_d_stats': _playtype('PRBallHandler', 'defensive', 'opp_pnrbh_'),
+    'pnrrm_d_stats': _playtype('PRRollman', 'defensive', 'opp_pnrrm_'),
+    'postup_d_stats': _playtype('Postup', 'defensive', 'opp_postup_'),
+    'spotup_d_stats': _playtype('Spotup', 'defensive', 'opp_spotup_'),
+    'handoff_d_stats': _playtype('Handoff', 'defensive', 'opp_handoff_'),
+    'offscrn_d_stats': _playtype('OffScreen', 'defensive', 'opp_offscrn_'),
+
+    # Shooting stats (by zone)
+    'eff_o_stats': _zones('Base', ''),
+    'eff_d_stats': _zones('Opponent', 'opp_'),
+
+    # Tracking stats
+    'cns_stats': _pt_shot('general_range_nullable', 'Catch and Shoot', 'cns_'),
+    'pullup_stats': _pt_shot('general_range_nullable', 'Pullups', 'pullup_'),
+    'drives_stats': _pt_stats('Drives', {
+        'DRIVES': 'DRIVES', 'DRIVE_FGA': 'drives_FGA', 'DRIVE_FGM': 'drives_FGM', 'DRIVE_PTS': 'drives_PTS',
+        'DRIVE_PASSES_PCT': 'drives_PASS%', 'DRIVE_AST_PCT': 'drives_AST%'}),
+    'pass_stats': _pt_stats('Passing', {
+        'PASSES_MADE': 'PassesMade', 'PASSES_RECEIVED': 'PassesReceived', 'SECONDARY_AST': 'SecondaryAST',
+        'POTENTIAL_AST': 'PotentialAST', 'AST_POINTS_CREATED': 'AST PTSCreated', 'AST_ADJ': 'ASTAdj',
+        'AST_TO_PASS_PCT_ADJ': 'AST ToPass% Adj'}),
+    'touches_stats': _pt_stats('Possessions', {
+        'TOUCHES': 'TOUCHES', 'AVG_SEC_PER_TOUCH': 'Avg Sec PerTouch', 'AVG_DRIB_PER_TOUCH': 'Avg Drib PerTouch',
+        'PTS_PER_TOUCH': 'PTS PerTouch', 'ELBOW_TOUCHES': 'ElbowTouches', 'POST_TOUCHES': 'PostUps', 'PAINT_TOUCHES': 'PaintTouches',
+        'PTS_PER_ELBOW_TOUCH': 'PTS PerElbow Touch', 'PTS_PER_POST_TOUCH': 'PTS PerPost Touch', 'PTS_PER_PAINT_TOUCH': 'PTS PerPaint Touch'}),
+    'reb_stats': _pt_stats('Rebounding', {'REB_CONTEST_PCT': 'ContestedREB%', 'AVG_REB_DIST': 'AVG REBDistance'}),
+    'mvmt_stats': _pt_stats('SpeedDistance', {'DIST_MILES_OFF': 'Dist. Miles Off', 'DIST_MILES_DEF': 'Dist. Miles Def'}),
+    'hustle_stats': TableSpec('LeagueHustleStatsPlayer', {'per_mode_time': 'Totals'}, {
+        'SCREEN_ASSISTS': 'ScreenAssists', 'DEFLECTIONS': 'Deflections', 'LOOSE_BALLS_RECOVERED': 'Loose BallsRecovered',
+        'CHARGES_DRAWN': 'ChargesDrawn', 'CONTESTED_SHOTS_2PT': 'Contested2PT Shots', 'CONTESTED_SHOTS_3PT': 'Contested3PT Shots',
+        'BOX_OUTS': 'Box Outs'}),
+
+    # Dribble / Touch-time stats
+    'dr_0': _pt_shot('dribble_range_nullable', '0 Dribbles', 'dr_0_'),
+    'dr_1': _pt_shot('dribble_range_nullable', '1 Dribble', 'dr_1_'),
+    'dr_2': _pt_shot('dribble_range_nullable', '2 Dribbles', 'dr_2_'),
+    'dr_3_6': _pt_shot('dribble_range_nullable', '3-6 Dribbles', 'dr_3_6_'),
+    'dr_7plus': _pt_shot('dribble_range_nullable', '7+ Dribbles', 'dr_7plus_'),
+    'tch_0_2': _pt_shot('touch_time_range_nullable', 'Touch < 2 Seconds', 'tch_0_2_'),
+    'tch_2_6': _pt_shot('touch_time_range_nullable', 'Touch 2-6 Seconds', 'tch_2_6_'),
+    'tch_6plus': _pt_shot('touch_time_range_nullable', 'Touch 6+ Seconds', 'tch_6plus_'),
+
+    # Lineup stats (written out separately instead of being merged into the player data)
+    'lineup_stats': TableSpec('LeagueDashLineups', {'measure_type_detailed_defense': 'Advanced', 'group_quantity': 5, 'per_mode_detailed': 'Totals'}, {
+        'GROUP_NAME': 'Lineups', 'TEAM_ABBREVIATION': 'TEAM', 'GP': 'GP', 'MIN': 'MIN', 'OFF_RATING': 'OffRtg',
+        'DEF_RATING': 'DefRtg', 'NET_RATING': 'NetRtg', 'AST_PCT': 'AST%', 'AST_TO': 'AST/TO', 'AST_RATIO': 'AST Ratio',
+        'OREB_PCT': 'OREB%', 'DREB_PCT': 'DREB%', 'REB_PCT': 'REB%', 'TM_TOV_PCT': 'TO Ratio', 'EFG_PCT': 'eFG%',
+        'TS_PCT': 'TS%', 'PACE': 'PACE', 'PIE': 'PIE', 'GROUP_ID': 'LINEUP_IDS'}, keys=()),
+}
+LINEUP_TABLE = 'lineup_stats'
+
+# Final attribute ordering of the compiled player statistics (grouped the same way as the original compiler notebook)
+MASTER_COLUMNS = [
+    'PLAYER', 'PLAYER_ID', 'H', 'POS', 'TEAM', 'GP', 'MIN',  # Bio / Util info
+    'POSS', 'USG%', '%FGA', '%3PA', '%FTA', '%REB', '%AST', '%BLKA', '%PFD', '%PTS',  # Usage stats
+    'AST', 'PassesMade', 'PassesReceived', 'SecondaryAST', 'PotentialAST', 'ScreenAssists', 'AST PTSCreated', 'ASTAdj', 'AST ToPass% Adj', 'TOV',  # Passing info
+    'PTS', 'FGA', 'FGM', 'FG%',  # Base scoring stats
+    '%FGA2PT', '%PTS2PT', '%PTSPITP', '%PTS2PT MR',  # 2-Pt scoring vs. player's overall scoring
+    'RA_FGA', 'RA_FGM', 'PT_nonRA_FGA', 'PT_nonRA_FGM', 'MR_FGA', 'MR_FGM',  # 2-Pt scoring zones
+    'cns_2FGA', 'cns_2FGM', 'pullup_2FGA', 'pullup_2FGM',  # 2-Pt scoring styles
+    '3PA', '3PM', '3P%',  # Base 3-Pt scoring stats
+    '%FGA3PT', '%PTS3PT',  # 3-Pt scoring vs. player's overall scoring
+    'Corner3_FGA', 'Corner3_FGM', 'ATB3_FGA', 'ATB3_FGM',  # 3-Pt scoring zones
+    'cns_3PA', 'cns_3PM', 'pullup_3PA', 'pullup_3PM',  # 3-Pt scoring styles
+    'FTA', 'FTM', 'FT%',  # Base FT stats
+    '%PTSFT',  # FT scoring vs. player's overall scoring
+    '2FGM%AST', '2FGM%UAST', '3FGM%AST', '3FGM%UAST',  # Scoring dependency
+    'dr_0_2FGA', 'dr_0_2FGM', 'dr_0_3PA', 'dr_0_3PM', 'dr_1_2FGA', 'dr_1_2FGM', 'dr_1_3PA', 'dr_1_3PM', 'dr_2_2FGA', 'dr_2_2FGM',  # Dribbles vs. scoring/efficiency
+    'dr_2_3PA', 'dr_2_3PM', 'dr_3_6_2FGA', 'dr_3_6_2FGM', 'dr_3_6_3PA', 'dr_3_6_3PM', 'dr_7plus_2FGA', 'dr_7plus_2FGM', 'dr_7plus_3PA', 'dr_7plus_3PM',
+    'tch_0_2_2FGA', 'tch_0_2_2FGM', 'tch_0_2_3PA', 'tch_0_2_3PM', 'tch_2_6_2FGA', 'tch_2_6_2FGM',  # Touch-time vs. scoring/efficiency
+    'tch_2_6_3PA', 'tch_2_6_3PM', 'tch_6plus_2FGA', 'tch_6plus_2FGM', 'tch_6plus_3PA', 'tch_6plus_3PM',
+    'trsn_FGM', 'trsn_FGA', 'iso_FGM', 'iso_FGA', 'pnrbh_FGM', 'pnrbh_FGA', 'pnrrm_FGM', 'pnrrm_FGA', 'postup_FGM', 'postup_FGA',  # Offensive play-style
+    'spotup_FGM', 'spotup_FGA', 'handoff_FGM', 'handoff_FGA', 'cuts_FGM', 'cuts_FGA', 'offscrn_FGM', 'offscrn_FGA', 'putbk_FGM', 'putbk_FGA',
+    'DRIVES', 'drives_FGA', 'drives_FGM', 'drives_PTS', 'drives_PASS%', 'drives_AST%',
+    'TOUCHES', 'Avg Sec PerTouch', 'Avg Drib PerTouch', 'PTS PerTouch', 'ElbowTouches', 'PostUps', 'PaintTouches', 'PTS PerElbow Touch', 'PTS PerPost Touch', 'PTS PerPaint Touch',  # Player activity
+    'Dist. Miles Off', 'Dist. Miles Def',  # Player movement
+    'REB', 'ContestedREB%', 'AVG REBDistance', 'Box Outs',  # Rebound-related stats
+    'DEFWS',  # Adv defensive metric
+    'STL', 'BLK', 'Deflections', 'Loose BallsRecovered', 'ChargesDrawn', 'Contested2PT Shots', 'Contested3PT Shots', 'OppTOV', 'OppPF', 'OppFTA',  # Defensive activity
+    'OppFGA', 'OppFGM', 'OppPTSFB', 'OppPTSPAINT', 'opp_RA_FGA', 'opp_RA_FGM', 'opp_PT_nonRA_FGA', 'opp_PT_nonRA_FGM', 'opp_MR_FGA', 'opp_MR_FGM',  # Opponent 2-Pt efficiency
+    'Opp3PA', 'Opp3PM', 'opp_Corner3_FGA', 'opp_Corner3_FGM', 'opp_ATB3_FGA', 'opp_ATB3_FGM',  # Opponent 3-Pt efficiency
+    'opp_iso_FGM', 'opp_iso_FGA', 'opp_pnrbh_FGM', 'opp_pnrbh_FGA', 'opp_pnrrm_FGM', 'opp_pnrrm_FGA', 'opp_postup_FGM', 'opp_postup_FGA',  # Opponent play-style vs. efficiency
+    'opp_spotup_FGM', 'opp_spotup_FGA', 'opp_handoff_FGM', 'opp_handoff_FGA', 'opp_offscrn_FGM', 'opp_offscrn_FGA'
+]
+
+def fixture_name(endpoint, params):
+    """Builds a deterministic, file-system safe fixture name for an endpoint call."""
+    slug = '__'.join(f'{key}-{params[key]}' for key in sorted(params))
+    return re.sub(r'[^A-Za-z0-9_.+-]', '_', f'{endpoint}__{slug}')
+
+class StatsClient:
+    """Fetches raw JSON payloads from the NBA stats endpoints (through nba_api's endpoint wrappers)."""
+
+    def __init__(self, timeout=REQUEST_TIMEOUT):
+        self.timeout = timeout
+
+    def get(self, endpoint, params):
+        from nba_api.stats import endpoints  # Deferred so fixture-only runs don't need the API client installed
+        return getattr(endpoints, endpoint)(timeout=self.timeout, **params).get_dict()
+
+class FixtureClient:
+    """Stand-in client that replays payloads previously recorded to a fixture directory (for tests & offline runs)."""
+
+    def __init__(self, fixture_dir):
+        self.fixture_dir = fixture_dir
+
+    def get(self, endpoint, params):
+        with open(os.path.join(self.fixture_dir, fixture_name(endpoint, params) + '.json'), 'r') as f:
+            return json.load(f)
+
+class RecordingClient:
+    """Wraps a client & records every payload it returns into a fixture directory."""
+
+    def __init__(self, client, fixture_dir):
+        self.client = client
+        self.fixture_dir = fixture_dir
+        os.makedirs(fixture_dir, exist_ok=True)
+
+    def get(self, endpoint, params):
+        payload = self.client.get(endpoint, params)
+        with open(os.path.join(self.fixture_dir, fixture_name(endpoint, params) + '.json'), 'w') as f:
+            json.dump(payload, f)
+        return payload
+
+class StatsCompiler:
+    """Concurrently fetches, normalizes & checkpoints every stats table, then compiles the player & lineup CSVs."""
+
+    def __init__(self, client=None, season=SEASON, season_type=SEASON_TYPE, checkpoint_dir=CHECKPOINT_DIR,
+                 max_workers=MAX_WORKERS, requests_per_second=REQUESTS_PER_SECOND, max_retries=MAX_RETRIES, specs=None,
+                 resolver=None):
+        """Instantiates the compiler settings; checkpoints are kept per season so separate seasons never collide."""
+        if max_retries < 1:
+            raise ValueError(f'max_retries must be at least 1 (every table needs one attempt), got [{max_retries}].')
+        self.client = client if client is not None else StatsClient()
+        self.season = season
+        self.season_type = season_type
+        self.checkpoint_dir = os.path.join(checkpoint_dir, season)
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self.max_retries = max_retries
+        self.specs = specs if specs is not None else TABLE_SPECS
+        self.resolver = resolver
+
+    def checkpoint_path(self, name):
+        return os.path.join(self.checkpoint_dir, f'{name}.csv')
+
+    def fetch_all(self, fresh=False):
+        """Fetches every table that isn't already checkpointed & returns the names of tables that failed."""
+
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        pending = [name for name in self.specs if fresh or not os.path.exists(self.checkpoint_path(name))]
+        logging.info(f'LOG: {len(self.specs) - len(pending)} tables already checkpointed, fetching {len(pending)}...')
+
+        failed = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.fetch_table, name): name for name in pending}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    rows = future.result()
+                    logging.info(f'LOG: Checkpointed [{name}] ({rows} rows).')
+                except Exception as e:
+                    logging.error(f'Failed to fetch [{name}]: {e}')
+                    failed.append(name)
+
+        return failed
+
+    def fetch_table(self, name):
+        """Fetches a single table (retrying with backoff), normalizes it & writes its checkpoint atomically."""
+
+        spec = self.specs[name]
+        params = {'season': self.season, 'season_type_all_star': self.season_type, **spec.params}
+        if spec.endpoint == 'PlayerIndex':
+            params.pop('season_type_all_star')  # Player index isn't split by season type
+
+        for attempt in range(self.max_retries):
+            self.rate_limiter.wait()
+            try:
+                payload = self.client.get(spec.endpoint, params)
+                break
+            except Exception as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                logging.debug(f'Retrying [{name}] after error: {e}')
+                time.sleep(2 ** attempt)
+
+        table = normalize_table(spec, payload)
+        tmp_path = self.checkpoint_path(name) + '.tmp'
+        table.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, self.checkpoint_path(name))
+        return len(table)
+
+    def load_table(self, name):
+        return pd.read_csv(self.checkpoint_path(name), sep=',', header=0)
+
+    def compile(self):
+        """Combines the checkpointed player tables into the master player dataframe & returns it with the lineup data."""
+
+        player_tables = {name: self.load_table(name) for name in self.specs if name != LINEUP_TABLE}
+        master_df, self.merge_report = merge_tables(player_tables, resolver=self.resolver)
+        log_merge_report(self.merge_report)
+
+        # Only keep players of this season that have recorded stats
+        master_df = master_df[master_df.PLAYER_ID.isin(self.load_table('trad_stats').PLAYER_ID)].reset_index(drop=True)
+        master_df = master_df[[col for col in MASTER_COLUMNS if col in master_df.columns]]
+
+        return master_df, self.load_table(LINEUP_TABLE)
+
+def merge_tables(tables, key='PLAYER_ID', name_col='PLAYER', resolver=None):
+    """Aligns every table on a shared integer player-id index & joins all columns in one concat, reporting any issues.
+
+    Tables that only carry names are keyed by the names seen alongside ids; if a PlayerIdentityResolver is given, the
+    remaining names (nicknames, suffix or accent differences) are fuzzily resolved among the ids already present.
+    """
+
+    # Report of duplicated ids dropped per table, rows without a resolvable id & columns provided by several tables
+    report = {'duplicates': {}, 'unresolved': {}, 'conflicts': {}}
+
+    # Names seen alongside ids let tables that only carry names be keyed onto the same integer ids
+    name_to_id = {}
+    for table in tables.values():
+        if key in table.columns and name_col in table.columns:
+            pairs = table[[name_col, key]].dropna().drop_duplicates(name_col)
+            name_to_id.update(zip(pairs[name_col], pairs[key].astype('int64')))
+
+    keyed_tables = {}
+    for name, table in tables.items():
+        ids = table[key] if key in table.columns else table[name_col].map(name_to_id)
+        if key not in table.columns and resolver is not None and ids.isna().any():
+            fuzzy_ids = resolver.resolve_many(table.loc[ids.isna(), name_col], restrict_to=set(name_to_id.values()))
+            ids = ids.copy()
+            ids[ids.isna()] = np.where(fuzzy_ids >= 0, fuzzy_ids, np.nan)
+        ids = pd.to_numeric(ids, errors='coerce')
+        if ids.isna().any():
+            report['unresolved'][name] = int(ids.isna().sum())
+        table = table.assign(**{key: ids}).dropna(subset=[key]).astype({key: 'int64'})
+
+        dup_mask = table[key].duplicated(keep='first')
+        if dup_mask.any():
+            report['duplicates'][name] = table.loc[dup_mask, key].tolist()
+        keyed_tables[name] = table[~dup_mask].set_index(key)
+
+    union_index = pd.Index(np.unique(np.concatenate([table.index.values for table in keyed_tables.values()])), name=key)
+
+    # Reindex each table once against the union of keys; a column provided by several tables keeps the first
+    # table's values, only filling in players that table is missing
+    owners, aligned_names, aligned_tables = {}, [], []
+    for name, table in keyed_tables.items():
+        table = table.reindex(union_index)
+        if name_col in table.columns:
+            aligned_names.append(table.pop(name_col))
+
+        for col in [col for col in table.columns if col in owners]:
+            first_name, first_table = owners[col]
+            both = first_table[col].notna() & table[col].notna()
+            report['conflicts'].setdefault(col, {'tables': [first_name], 'mismatches': 0})
+            report['conflicts'][col]['tables'].append(name)
+            report['conflicts'][col]['mismatches'] += int((first_table[col][both] != table[col][both]).sum())
+            first_table[col] = first_table[col].fillna(table.pop(col))
+
+        owners.update({col: (name, table) for col in table.columns})
+        aligned_tables.append(table)
+
+    # Use the first available name for each player across tables
+    names = pd.concat(aligned_names, axis=1).bfill(axis=1).iloc[:, 0].rename(name_col) if aligned_names else None
+    merged_df = pd.concat(([names] if names is not None else []) + aligned_tables, axis=1)
+
+    return merged_df.reset_index(), report
+
+def log_merge_report(report):
+    """Logs the duplicates, unresolved rows & column conflicts found while merging."""
+    for name, dup_ids in report['duplicates'].items():
+        logging.warning(f'[{name}] had {len(dup_ids)} duplicated player id(s), kept first record: {dup_ids}')
+    for name, count in report['unresolved'].items():
+        logging.warning(f'[{name}] had {count} row(s) that could not be resolved to a player id & were dropped')
+    for col, conflict in report['conflicts'].items():
+        if conflict['mismatches']:
+            logging.warning(f'[{col}] differs between tables {conflict["tables"]} for {conflict["mismatches"]} player(s), '
+                            f'kept values from [{conflict["tables"][0]}]')
+
+def normalize_table(spec, payload):
+    """Converts a raw endpoint payload into a condensed dataframe with the project's column naming convention."""
+
+    table = _result_frame(payload)
+
+    # Percentages are returned as proportions, but the project's data (scraped from the stats pages) uses 0-100 values
+    pct_cols = [col for col in table.columns if 'PCT' in col and col in spec.columns]
+    table[pct_cols] = (table[pct_cols].astype(float) * 100).round(1)
+
+    # Standardize player identifiers & names across endpoints
+    if 'PERSON_ID' in table.columns:
+        table['PLAYER_ID'] = table['PERSON_ID']
+        table['PLAYER_NAME'] = table['PLAYER_FIRST_NAME'] + ' ' + table['PLAYER_LAST_NAME']
+    if 'GROUP_NAME' in table.columns:
+        table['GROUP_NAME'] = table['GROUP_NAME'].str.replace(' - ', ', ', regex=False)
+    table = table.rename(columns={'PLAYER_NAME': 'PLAYER', **spec.columns})
+
+    table = table[list(spec.keys) + list(spec.columns.values())]
+    if spec.aggregate:
+        table = table.groupby(list(spec.keys), as_index=False).sum()
+
+    return table.reset_index(drop=True)
+
+def _result_frame(payload):
+    """Builds a dataframe from the first result set of a payload (flattening multi-level shot-zone headers)."""
+
+    result = payload['resultSets'] if 'resultSets' in payload else payload['resultSet']
+    if isinstance(result, list):
+        result = result[0]
+
+    headers = result['headers']
+    if headers and isinstance(headers[0], dict):
+        # Shot-location endpoints return grouped headers, i.e. [zone names] x [FGM, FGA, FG_PCT]
+        zone_header, col_header = headers[0], headers[-1]
+        n_lead = zone_header.get('columnsToSkip', 0)
+        zones = [ZONE_CODES.get(zone, zone) for zone in zone_header['columnNames']]
+        span = zone_header.get('columnSpan', 3)
+        headers = col_header['columnNames'][:n_lead] + [
+            f'{zones[i // span]}_{col}' for i, col in enumerate(col_header['columnNames'][n_lead:])
+        ]
+
+    return pd.DataFrame(result['rowSet'], columns=headers)
+
+def main():
+    """Parses command-line options, fetches every missing table & writes the compiled CSVs."""
+
+    parser = argparse.ArgumentParser(description='Compiles player statistics and lineup data from the NBA stats endpoints.')
+    parser.add_argument('--season', default=SEASON, help='season to compile, i.e. 2021-22')
+    parser.add_argument('--output-dir', default=OUTPUT_DIR, help='directory for the raw_*.csv outputs')
+    parser.add_argument('--checkpoint-dir', default=CHECKPOINT_DIR, help='directory for per-table checkpoints')
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS, help='number of concurrent requests')
+    parser.add_argument('--rate', type=float, default=REQUESTS_PER_SECOND, help='maximum requests per second')
+    parser.add_argument('--fixtures', help='replay recorded payloads from this directory instead of calling the API')
+    parser.add_argument('--record', help='record every fetched payload into this directory')
+    parser.add_argument('--fresh', action='store_true', help='ignore existing checkpoints & refetch every table')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    client = FixtureClient(args.fixtures) if args.fixtures else StatsClient()
+    # Fixture replays resolve names with the alias table only, so nba_api is only needed for live runs
+    resolver = PlayerIdentityResolver.from_aliases() if args.fixtures else PlayerIdentityResolver.from_nba_api()
+    if args.record:
+        client = RecordingClient(client, args.record)
+
+    compiler = StatsCompiler(client, season=args.season, checkpoint_dir=args.checkpoint_dir,
+                             max_workers=args.workers, requests_per_second=args.rate,
+                             resolver=resolver)
+    failed = compiler.fetch_all(fresh=args.fresh)
+    if failed:
+        logging.error(f'\n{len(failed)} table(s) failed: {failed}. Re-run the same command to resume.')
+        raise SystemExit(1)
+
+    master_df, lineup_df = compiler.compile()
+    master_df.to_csv(os.path.join(args.output_dir, 'raw_comprehensive_stats.csv'), sep=',', index=False)
+    lineup_df.to_csv(os.path.join(args.output_dir, 'raw_lineup_stats.csv'), sep=',', index=False)
+    logging.info(f'LOG: Compiled {len(master_df)} players & {len(lineup_df)} lineups for the {args.season} season.')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+
+# Best stretch of a query: its summed deviation & the (inclusive) game positions it spans
+Streak = namedtuple('Streak', ['total', 'start', 'end'])
+
+# Node fields: (total, best prefix, prefix end, best suffix, suffix start, best subarray, subarray start, subarray end)
+EMPTY_NODE = (0.0, -np.inf, -1, -np.inf, -1, -np.inf, -1, -1)
+
+def combine(left, right):
+    """Merges two adjacent nodes (left ends where right starts) into the node of their union."""
+
+    l_total, l_prefix, l_prefix_end, l_suffix, l_suffix_start, l_best, l_best_start, l_best_end = left
+    r_total, r_prefix, r_prefix_end, r_suffix, r_suffix_start, r_best, r_best_start, r_best_end = right
+
+    prefix, prefix_end = (l_prefix, l_prefix_end) if l_prefix >= l_total + r_prefix else (l_total + r_prefix, r_prefix_end)
+    suffix, suffix_start = (r_suffix, r_suffix_start) if r_suffix >= r_total + l_suffix else (r_total + l_suffix, l_suffix_start)
+    best = max(l_best, r_best, l_suffix + r_prefix)
+    if best == l_best:
+        best_start, best_end = l_best_start, l_best_end
+    elif best == l_suffix + r_prefix:
+        best_start, best_end = l_suffix_start, r_prefix_end
+    else:
+        best_start, best_end = r_best_start, r_best_end
+    return l_total + r_total, prefix, prefix_end, suffix, suffix_start, best, best_start, best_end
+
+class StreakIndex:
+    """Segment tree over one player's per-game stat deviations that returns the best stretch of any game or date range in O(log n)."""
+
+    def __init__(self, values, dates=None, seasons=None):
+        """Builds every node bottom-up in O(n), one vectorized pass per tree level (games must be in chronological order)."""
+
+        values = np.asarray(values, dtype=np.float64)
+        self.n = len(values)
+        self.dates = None if dates is None else np.asarray(dates)
+        self.seasons = None if seasons is None else np.asarray(seasons)
+        self.size = 1 << max(self.n - 1, 0).bit_length()  # Leaves: the games, padded with empty nodes to a power of two
+
+        positions = np.arange(self.n)
+        self.total = np.zeros(2 * self.size)
+        self.prefix, self.suffix, self.best = (np.full(2 * self.size, -np.inf) for _ in range(3))
+        self.prefix_end, self.suffix_start, self.best_start, self.best_end = (np.full(2 * self.size, -1, dtype=np.int64) for _ in range(4))
+        for values_array in (self.total, self.prefix, self.suffix, self.best):
+            values_array[self.size:self.size + self.n] = values
+        for positions_array in (self.prefix_end, self.suffix_start, self.best_start, self.best_end):
+            positions_array[self.size:self.size + self.n] = positions
+
+        level = self.size // 2
+        while level >= 1:
+            self._combine_level(np.arange(level, 2 * level))
+            level //= 2
+
+    def _combine_level(self, parents):
+        """Vectorized combine() of every node on one tree level from its two children."""
+
+        left, right = 2 * parents, 2 * parents + 1
+        self.total[parents] = self.total[left] + self.total[right]
+
+        spanning_prefix = self.total[left] + self.prefix[right]
+        keep_left = self.prefix[left] >= spanning_prefix
+        self.prefix[parents] = np.where(keep_left, self.prefix[left], spanning_prefix)
+        self.prefix_end[parents] = np.where(keep_left, self.prefix_end[left], self.prefix_end[right])
+
+        spanning_suffix = self.total[right] + self.suffix[left]
+        keep_right = self.suffix[right] >= spanning_suffix
+        self.suffix[parents] = np.where(keep_right, self.suffix[right], spanning_suffix)
+        self.suffix_start[parents] = np.where(keep_right, self.suffix_start[right], self.suffix_start[left])
+
+        crossing = self.suffix[left] + self.prefix[right]
+        best = np.maximum(np.maximum(self.best[left], self.best[right]), crossing)
+        from_left, from_crossing = best == self.best[left], best == crossing
+        self.best[parents] = best
+        self.best_start[parents] = np.where(from_left, self.best_start[left], np.where(from_crossing, self.suffix_start[left], self.best_start[right]))
+        self.best_end[parents] = np.where(from_left, self.best_end[left], np.where(from_crossing, self.prefix_end[right], self.best_end[right]))
+
+    @classmethod
+    def from_game_log(cls, stats_df, category, baseline='season'):
+        """Indexes one player's game log (comprehensive_player_statistic layout) for a category.
+
+        Each game is scored as its deviation from the player's season average (as in StreakFinder.execute_MSSDAC), or from
+        the career average with baseline='career'; games without a value for the category are skipped.
+        """
+
+        games_df = stats_df[['fixture_id', 'played_on', category]].copy()
+        games_df[category] = pd.to_numeric(games_df[category], errors='coerce')
+        games_df = games_df.dropna(subset=[category]).sort_values('fixture_id', kind='stable')
+        seasons = (games_df['fixture_id'] // 1000000).astype(np.int64)
+
+        if baseline == 'season':
+            averages = games_df.groupby(seasons)[category].transform('mean').round(1)
+        elif baseline == 'career':
+            averages = round(games_df[category].mean(), 1)
+        else:
+            raise ValueError(f"Unknown baseline [{baseline}] (expected 'season' or 'career').")
+        deviations = (games_df[category] - averages).round(1)
+
+        return cls(deviations.values, dates=games_df['played_on'].values, seasons=seasons.values)
+
+    def node(self, i):
+        return (self.total[i], self.prefix[i], self.prefix_end[i], self.suffix[i], self.suffix_start[i],
+                self.best[i], self.best_start[i], self.best_end[i])
+
+    def query(self, start=0, end=None):
+        """Returns the best stretch (maximum-sum run of consecutive games) within game positions [start, end], or None if the range is empty."""
+
+        end = self.n - 1 if end is None else min(end, self.n - 1)
+        start = max(start, 0)
+        if start > end:
+            return None
+
+        left_node, right_node = EMPTY_NODE, EMPTY_NODE
+        lo, hi = start + self.size, end + self.size + 1
+        while lo < hi:
+            if lo & 1:
+                left_node = combine(left_node, self.node(lo))
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right_node = combine(self.node(hi), right_node)
+            lo, hi = lo // 2, hi // 2
+
+        _, _, _, _, _, best, best_start, best_end = combine(left_node, right_node)
+        return Streak(float(best), int(best_start), int(best_end))
+
+    def query_dates(self, start_date=None, end_date=None):
+        """Returns the best stretch among the games played between two dates (inclusive; open-ended if omitted)."""
+        start = 0 if start_date is None else int(np.searchsorted(self.dates, start_date, side='left'))
+        end = self.n - 1 if end_date is None else int(np.searchsorted(self.dates, end_date, side='right')) - 1
+        return self.query(start, end)
+
+    def query_seasons(self, first_season, last_season=None):
+        """Returns the best stretch within one season or across consecutive seasons (format: 2-digit start year, i.e. 18)."""
+        last_season = first_season if last_season is None else last_season
+        start = int(np.searchsorted(self.seasons, first_season, side='left'))
+        end = int(np.searchsorted(self.seasons, last_season, side='right')) - 1
+        return self.query(start, end)
+
+    def stretch_dates(self, streak):
+        """Returns the first & last game dates of a stretch."""
+        return [self.dates[streak.start], self.dates[streak.end]]
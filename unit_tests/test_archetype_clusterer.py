@@ -0,0 +1,54 @@
+import os
+import logging
+import sys
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '..')
+from archetype_clusterer import ArchetypeModel, select_k
+sys.path.remove('..')
+
+class TestArchetypeClusterer(unittest.TestCase):
+    """Carries out unittests for fitting, persisting & re-assigning the position-group archetypes."""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+        # Two well-separated play-styles for guards & two for forwards (plus a center, who isn't clustered)
+        rng = np.random.default_rng(0)
+        styles = np.repeat([[0, 0], [10, 10], [0, 0], [10, 10]], 10, axis=0)
+        features = styles + rng.normal(0, 0.5, size=styles.shape)
+        self.player_df = pd.DataFrame({
+            'PLAYER': [f'Player {i}' for i in range(41)],
+            'POS': ['G'] * 20 + ['F'] * 20 + ['C'],
+            'STAT_1': np.append(features[:, 0], 5),
+            'STAT_2': np.append(features[:, 1], 5),
+        })
+
+    def test_fit_save_assign(self):
+        """Checks separated styles land in separate archetypes & a reloaded model reproduces the same one-hots."""
+
+        model = ArchetypeModel.fit(self.player_df, {'g': 2, 'f': 2}, feature_cols=['STAT_1', 'STAT_2'])
+        one_hot_df = model.one_hot(self.player_df)
+
+        self.assertEqual(one_hot_df.columns.tolist(), ['PLAYER', 'g_cls_1', 'g_cls_2', 'f_cls_1', 'f_cls_2'])
+        self.assertEqual(len(one_hot_df), 40)
+        self.assertTrue((one_hot_df.iloc[:, 1:].sum(axis=1) == 1).all())
+        self.assertEqual(sorted(one_hot_df.iloc[:, 1:].sum().tolist()), [10, 10, 10, 10])
+        self.assertEqual(one_hot_df.iloc[:10, 1:].drop_duplicates().shape[0], 1)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'model.npz')
+            model.save(path)
+            reloaded = ArchetypeModel.load(path)
+        pd.testing.assert_frame_equal(reloaded.one_hot(self.player_df), one_hot_df)
+
+    def test_select_k(self):
+        best_k, scores_df = select_k(self.player_df, range(2, 5), feature_cols=['STAT_1', 'STAT_2'], n_jobs=1)
+        self.assertEqual(best_k, {'g': 2, 'f': 2})
+        self.assertEqual(len(scores_df), 6)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import sys
+import logging
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, '..')
+from asset_cache import AssetCache
+sys.path.remove('..')
+
+class TestAssetCache(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.image = np.random.RandomState(0).randint(0, 256, size=(190, 260, 4)).astype(np.uint8)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_variants_and_index(self):
+        """Checks stored assets come back with their precomputed variants, from a fresh instance's id index."""
+
+        AssetCache(self.tmp_dir.name).add('headshot', 2544, self.image)
+        cache = AssetCache(self.tmp_dir.name)
+        self.assertIsNone(cache.get('headshot', 2544))  # Only indexed assets are served
+
+        cache.add('headshot', 2544, self.image)
+        cache.save_index()
+        reopened = AssetCache(self.tmp_dir.name)
+        self.assertTrue(np.array_equal(reopened.get('headshot', 2544), self.image))
+        self.assertTrue(np.array_equal(reopened.get('headshot', '2544', 'court'), self.image[::-1]))
+        self.assertEqual(reopened.get('headshot', 2544, 'thumb').shape, (76, 104, 4))
+        self.assertIsNone(reopened.get('headshot', 1))
+
+    def test_build_from_server(self):
+        """Checks bulk downloads decode served images, report unavailable ones & don't retry them on demand."""
+
+        buffer = BytesIO()
+        Image.fromarray(self.image).save(buffer, format='PNG')
+        png, requests_seen = buffer.getvalue(), []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requests_seen.append(self.path)
+                body = png if self.path == '/2544.png' else b''
+                self.send_response(200 if body else 404)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            sources = {'headshot': f'http://127.0.0.1:{server.server_address[1]}/{{key}}.png'}
+            cache = AssetCache(self.tmp_dir.name, sources=sources)
+            self.assertEqual(cache.build('headshot', [2544, 1], max_workers=2), ['1'])
+            self.assertTrue(np.array_equal(cache.get('headshot', 2544), self.image))
+            self.assertIsNone(cache.ensure('headshot', 1))
+            self.assertEqual(len(requests_seen), 2)
+            self.assertEqual(cache.build('headshot', [2544]), [])  # Already stored
+            self.assertEqual(len(requests_seen), 2)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+if __name__ == '__main__':
+    unittest.main()
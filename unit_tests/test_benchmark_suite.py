@@ -0,0 +1,105 @@
+import os
+import sys
+import logging
+import tempfile
+import unittest
+
+sys.path.insert(0, '..')
+import benchmark_suite
+from benchmark_suite import (BenchmarkSkipped, baseline_record, compare_results, is_repo_module, load_history, make_record,
+                             optional_dependencies, run_benchmarks, save_record, synthetic_game_log, synthetic_lineup_table,
+                             synthetic_shot_frame)
+import hot_streak_finder, rating_models  # noqa: F401 (imported lazily by the benchmarks, after '..' leaves sys.path)
+sys.path.remove('..')
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def test_synthetic_data(self):
+        """Checks the generators' sizes & that the game log only holds regular-season fixtures."""
+        game_log = synthetic_game_log(n_players=3, n_seasons=2, n_games=10)
+        self.assertEqual(len(game_log), 60)
+        self.assertTrue(((game_log.fixture_id % 1000000) // 100000 == 2).all())
+        self.assertLessEqual(synthetic_shot_frame(n_shots=200, n_games=5).GAME_DATE.nunique(), 5)
+        lineup_df = synthetic_lineup_table(50)
+        self.assertTrue((lineup_df.filter(like='_cls_').sum(axis=1) == 5).all())
+
+    def test_history_and_regressions(self):
+        """Checks runs are recorded per commit and slowdowns beyond the threshold are flagged against the prior commit."""
+
+        results = run_benchmarks(scales=['season'], patterns=['streak.max_subarray'], repeat=2)
+        self.assertIn('median_ms', results['streak.max_subarray@season'])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'history.jsonl')
+            save_record(make_record({'a': {'median_ms': 10.0}, 'b': {'median_ms': 10.0}}, 'c1', False), path)
+            save_record(make_record({'a': {'median_ms': 20.0}, 'b': {'skipped': 'x'}}, 'c2', False), path)
+            history = load_history(path)
+            self.assertEqual(baseline_record(history, 'c2')['commit'], 'c1')
+            self.assertIsNone(baseline_record(history[:1], 'c1'))
+
+            comparison = compare_results(history[0]['results'], history[1]['results'], threshold=0.25)
+            self.assertEqual(comparison.benchmark.tolist(), ['a'])
+            self.assertTrue(comparison.regression[0])
+            self.assertEqual(comparison.ratio[0], 2.0)
+
+    def test_lineup_benchmarks(self):
+        """Checks the lineup benchmarks time the rating_models search & exported models without leaving files behind."""
+
+        before = set(os.listdir(tempfile.gettempdir()))
+        results = run_benchmarks(scales=['season'], patterns=['lineup.*'], repeat=1)
+        self.assertIn('median_ms', results['lineup.fit@season'])
+        self.assertIn('median_ms', results['lineup.predict@season'])
+        self.assertFalse([name for name in set(os.listdir(tempfile.gettempdir())) - before if name.startswith('bench_models_')])
+
+        model, report = benchmark_suite.bench_lineup_fit('season')()
+        self.assertEqual(report['candidates'], 1)
+        self.assertFalse(report['cached'])
+        self.assertEqual((model.n_estimators, model.max_depth), (25, 10))
+
+    def test_scratch_dirs(self):
+        """Checks the asset caches & shot archives created during setup are removed once each benchmark has run."""
+
+        paths = [benchmark_suite._synthetic_asset_cache().asset_dir, benchmark_suite._synthetic_shot_archive('season').root]
+        self.assertTrue(all(os.path.isdir(path) for path in paths))
+        benchmark_suite._remove_scratch_dirs()
+        self.assertFalse(any(os.path.exists(path) for path in paths))
+
+        before = set(os.listdir(tempfile.gettempdir()))
+        results = run_benchmarks(scales=['season'], patterns=['shot_archive.*', 'zone_summaries.*'], repeat=1)
+        self.assertIn('median_ms', results['shot_archive.player_shots@season'])
+        self.assertIn('median_ms', results['zone_summaries.build_season_table@season'])
+        self.assertFalse([name for name in set(os.listdir(tempfile.gettempdir())) - before if name.startswith('bench_')])
+        self.assertEqual(benchmark_suite._SCRATCH_DIRS, [])
+
+    def test_import_failures(self):
+        """Checks only missing third-party packages skip a benchmark, while broken in-repo imports fail it."""
+
+        self.assertTrue(is_repo_module('max_sum_dac_algorithm'))
+        self.assertTrue(is_repo_module('utils.missing_module'))
+        self.assertTrue(is_repo_module('submodules.pp_config'))
+        self.assertFalse(is_repo_module('seaborn'))
+
+        with self.assertRaises(BenchmarkSkipped):
+            with optional_dependencies():
+                import some_missing_third_party_package  # noqa: F401
+        with self.assertRaises(ModuleNotFoundError):
+            with optional_dependencies():
+                import utils.missing_module  # noqa: F401
+
+        def broken_setup(scale):
+            with optional_dependencies():
+                raise ModuleNotFoundError("No module named 'utils.missing_module'", name='utils.missing_module')
+
+        benchmark_suite.BENCHMARKS['test.broken'] = broken_setup
+        try:
+            results = run_benchmarks(scales=['season'], patterns=['test.broken', 'streak.execute_mssdac'], repeat=1)
+        finally:
+            del benchmark_suite.BENCHMARKS['test.broken']
+        self.assertIn('failed', results['test.broken@season'])
+        self.assertIn('median_ms', results['streak.execute_mssdac@season'])
+
+if __name__ == '__main__':
+    unittest.main()
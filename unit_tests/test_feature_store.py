@@ -0,0 +1,59 @@
+import logging
+import os
+import sys
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '..')
+from feature_store import FeatureStore
+sys.path.remove('..')
+
+class TestFeatureStore(unittest.TestCase):
+    """Carries out unittests for publishing, versioning & memory-mapped reads of feature tables."""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.player_df = pd.DataFrame({'PLAYER': ['A B', 'C D', 'E F'], 'POS': ['G', 'F', None],
+                                       'GP': [70, 12, 5], 'FG%': [45.1, np.nan, 50.0], '3P%': [35.5, 30.0, 0.0]})
+
+    def test_publish_and_load(self):
+        """Checks a published table round-trips as a column-major float32 memmap with zero-copy column slices."""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = FeatureStore(tmp_dir)
+            self.assertIsNone(store.current_version())
+            self.assertEqual(store.publish({'players': (self.player_df, 'PLAYER')}, stage='test'), 1)
+
+            table = store.load('players')
+            self.assertIsInstance(table.values, np.memmap)
+            self.assertEqual(table.values.dtype, np.float32)
+            self.assertEqual(table.columns.tolist(), ['GP', 'FG%', '3P%'])
+            self.assertTrue(table.column('GP').flags['C_CONTIGUOUS'])
+            self.assertTrue(np.shares_memory(table.column_block(['FG%', '3P%']), table.values))
+            self.assertEqual(table.row_positions(['E F', 'X Y']).tolist(), [2, -1])
+            np.testing.assert_array_equal(table.row_block(['E F', 'A B']), table.values[[2, 0]])
+            with self.assertRaisesRegex(KeyError, 'X Y'):
+                table.row_block(['A B', 'X Y'])
+            pd.testing.assert_frame_equal(table.to_frame(), self.player_df, check_dtype=False)
+            self.assertEqual((table.metadata['stage'], table.version), ('test', 1))
+
+    def test_versions(self):
+        """Checks publishing one table creates a new version that carries over the other tables unchanged."""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = FeatureStore(tmp_dir)
+            store.publish({'players': (self.player_df, 'PLAYER'), 'other': (self.player_df[['PLAYER', 'GP']], 'PLAYER')}, 'import')
+            store.publish({'other': (self.player_df[['PLAYER', '3P%']], 'PLAYER')}, 'update')
+
+            self.assertEqual(store.current_version(), 2)
+            self.assertEqual(store.table_names(), ['other', 'players'])
+            self.assertEqual(store.load('other').columns.tolist(), ['3P%'])
+            self.assertEqual(store.load('other', version=1).columns.tolist(), ['GP'])
+            self.assertEqual(store.load('players').metadata['version'], 1)
+            self.assertEqual(store.load('other').metadata['parent_version'], 1)
+            self.assertFalse(any(name.startswith('.publishing_') for name in os.listdir(tmp_dir)))
+
+if __name__ == '__main__':
+    unittest.main()
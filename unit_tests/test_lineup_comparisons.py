@@ -0,0 +1,58 @@
+import sys
+import logging
+import unittest
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '..')
+from lineup_comparisons import LeagueDeltaComparator, OFF_COLS, DEF_COLS
+sys.path.remove('..')
+
+class TestLineupComparisons(unittest.TestCase):
+    """Carries out unittests for the vectorized league-delta comparisons of the lineup visualizer."""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        rng = np.random.RandomState(0)
+        cols = OFF_COLS + DEF_COLS
+        self.player_df = pd.DataFrame(rng.uniform(1, 60, (8, len(cols))).round(1), columns=cols)
+        self.player_df.insert(0, 'PLAYER', [f'Player {i}' for i in range(8)])
+        self.player_df.loc[3, '%iso_FGA'] = np.nan  # Missing values are skipped by both computations
+        self.lineup_agg_df = pd.DataFrame(rng.uniform(1, 60, (20, len(cols))).round(1), columns=cols)
+        self.comparator = LeagueDeltaComparator(self.lineup_agg_df, self.player_df)
+
+    def reference_deltas(self, players, cols):
+        """The visualizer's original per-column pandas computation."""
+        comp_df = pd.DataFrame(self.lineup_agg_df[cols].mean(), columns=['league_avg'])
+        comp_df['plyr_avg'] = pd.Series(self.player_df[self.player_df.PLAYER.isin(players)][cols].mean())
+        comp_df['delta'] = round((comp_df.plyr_avg - comp_df.league_avg) / comp_df.league_avg * 100, 1)
+        return comp_df['delta']
+
+    def test_lineup_deltas(self):
+        """Checks a lineup's offensive & defensive deltas match the original computation (unknown & repeated players included)."""
+
+        lineups = [['Player 0', 'Player 1', 'Player 2', 'Player 3', 'Player 4'],
+                   ['Player 5', 'Player 6', 'Unknown Player', 'Player 7', 'Player 3'],
+                   ['Player 1', 'Player 1', 'Player 2', 'Player 6', 'Player 0']]
+        for players in lineups:
+            deltas = self.comparator.lineup_deltas(players)
+            for cols in [OFF_COLS, DEF_COLS]:
+                pd.testing.assert_series_equal(deltas[cols], self.reference_deltas(players, cols), check_names=False)
+
+        self.assertTrue(self.comparator.lineup_deltas(['Unknown Player']).isna().all())
+
+    def test_batch_deltas(self):
+        """Checks batch deltas (names or comma-joined strings, lineups of any size) equal the one-lineup results."""
+
+        lineups = [['Player 0', 'Player 1', 'Player 2', 'Player 3', 'Player 4'], 'Player 5, Unknown Player, Player 7',
+                   ['Player 2']]
+        batch_df = self.comparator.batch_deltas(lineups)
+        self.assertEqual(batch_df.index.tolist(), ['Player 0, Player 1, Player 2, Player 3, Player 4',
+                                                   'Player 5, Unknown Player, Player 7', 'Player 2'])
+        for label, players in zip(batch_df.index, lineups):
+            pd.testing.assert_series_equal(batch_df.loc[label], self.comparator.lineup_deltas(players), check_names=False)
+            pd.testing.assert_series_equal(batch_df.loc[label, OFF_COLS], self.reference_deltas(label.split(', '), OFF_COLS),
+                                           check_names=False)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import sys
+import unittest
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '..')
+from lineup_index import PlayerVocabulary, LineupIndex, UNKNOWN_KEY, encode_lineups, join_lineups, pack_lineups, unpack_lineups
+sys.path.remove('..')
+
+class TestLineupIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.lineup_df = pd.DataFrame({
+            'Lineups': ['A, B, C, D, E', 'A, B, C, D, F', 'B, C, G, H, I', 'E, D, C, B, A'],
+            'TEAM': ['X', 'X', 'Y', 'Z'],
+            'NetRtg': [1.0, 2.0, 3.0, 4.0],
+        })
+        self.index = LineupIndex.from_frame(self.lineup_df)
+
+    def test_pack_unpack(self):
+        """Checks keys are canonical (order-independent) & unpack back to the sorted member ids."""
+        member_ids = np.array([[5, 3, 1, 4, 2], [2, 4, 1, 3, 5], [4095, 1, 2, 3, 0]], dtype=np.uint64)
+        keys = pack_lineups(member_ids)
+        self.assertEqual(keys[0], keys[1])
+        self.assertTrue((unpack_lineups(keys) == np.sort(member_ids, axis=1)).all())
+
+    def test_lookup(self):
+        """Checks lookups ignore player order & name formatting, and return -1 for absent or unknown lineups."""
+        rows = self.index.lookup(['D, A, E, C, B', 'c, b, a, d, f', 'A, B, C, D, Z', ['I', 'H', 'G', 'C', 'B']])
+        self.assertEqual(rows.tolist(), [0, 1, -1, 2])
+
+    def test_containing(self):
+        """Checks posting-list intersections match a brute-force scan."""
+        for players in [('A',), ('B', 'C'), ('A', 'F'), ('G', 'A'), ('Unknown',)]:
+            expected = [row for row, lineup in enumerate(self.lineup_df.Lineups) if set(players) <= set(lineup.split(', '))]
+            self.assertEqual(self.index.containing(*players).tolist(), expected)
+
+    def test_encode(self):
+        """Checks id-string lineups & unknown players are keyed correctly."""
+        vocabulary = PlayerVocabulary([101, 102, 103, 104, 105])
+        keys = encode_lineups(['-105-104-103-102-101-', '-101-102-103-104-999-'], vocabulary, sep='-', add=False)
+        self.assertEqual(keys[0], pack_lineups([[1, 2, 3, 4, 5]])[0])
+        self.assertEqual(keys[1], UNKNOWN_KEY)
+
+        exact = PlayerVocabulary(['Monte Morris'], normalize=False)
+        self.assertEqual(exact.ids(['Monte Morris Sr.'], add=False).tolist(), [0])
+        self.assertEqual(PlayerVocabulary(['Monte Morris']).ids(['Monte Morris Sr.'], add=False).tolist(), [1])
+
+    def test_join(self):
+        """Checks lineups join across sources regardless of player order."""
+        other_df = pd.DataFrame({'Lineups': ['B, A, E, D, C', 'I, H, G, C, B'], 'TEAM': ['X', 'Y'], 'OffRtg': [110.0, 100.0]})
+        joined_df = join_lineups(self.lineup_df, other_df, on=['TEAM'])
+        self.assertEqual(joined_df.NetRtg.tolist(), [1.0, 3.0])
+        self.assertEqual(joined_df.OffRtg.tolist(), [110.0, 100.0])
+
+if __name__ == '__main__':
+    unittest.main()
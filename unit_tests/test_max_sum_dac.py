@@ -2,7 +2,7 @@ import sys
 import unittest
 
 sys.path.insert(0, '..')
-from utils.max_sum_dac_algorithm import MSSDAC
+from max_sum_dac_algorithm import MSSDAC
 sys.path.remove('..')
 
 class TestMSSDAC(unittest.TestCase):
@@ -0,0 +1,69 @@
+import logging
+import os
+import sys
+import tempfile
+import unittest
+import pandas as pd
+
+sys.path.insert(0, '..')
+from player_identity import PlayerIdentityResolver, find_duplicate_names, load_aliases, normalize_name
+sys.path.remove('..')
+
+class TestPlayerIdentity(unittest.TestCase):
+    """Carries out unittests for name normalization, alias/fuzzy resolution & duplicate detection."""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.players_df = pd.DataFrame({
+            'player_id': [2226, 1630231, 1630538, 203999, 1629029],
+            'name': ['Kenyon Martin', 'Kenyon Martin', "Nah'Shon Hyland", 'Nikola Jokić', 'Luka Doncic'],
+            'is_active': [False, True, True, True, True],
+        })
+
+    def test_normalize_name(self):
+        self.assertEqual(normalize_name('Nikola Jokić'), 'nikola jokic')
+        self.assertEqual(normalize_name('Kenyon Martin Jr.'), 'kenyon martin')
+        self.assertEqual(normalize_name("D'Angelo  Russell"), 'dangelo russell')
+
+    def test_resolve(self):
+        """Checks exact, suffix, alias, fuzzy & restricted lookups resolve to the expected ids."""
+
+        resolver = PlayerIdentityResolver(self.players_df, pd.DataFrame({'alias': ['Bones Hyland'], 'player_id': [1630538]}))
+        self.assertEqual(resolver.resolve('Kenyon Martin Jr.'), 1630231)  # active player preferred
+        self.assertEqual(resolver.resolve('Bones Hyland'), 1630538)
+        self.assertEqual(resolver.resolve('Nikola Jokic'), 203999)
+        self.assertEqual(resolver.resolve('Luka Doncich'), 1629029)
+        self.assertIsNone(resolver.resolve('Completely Different'))
+        self.assertEqual(resolver.resolve('Kenyon Martin', restrict_to=[2226]), 2226)
+        self.assertEqual(resolver.resolve_many(['Luka Doncic', None, 'Nobody Here']).tolist(), [1629029, -1, -1])
+
+        # Check added aliases persist through the alias table
+        resolver.add_alias('The Joker', 203999)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'aliases.csv')
+            resolver.save_aliases(path)
+            reloaded = PlayerIdentityResolver(self.players_df, load_aliases(path))
+        self.assertEqual(reloaded.resolve('the joker'), 203999)
+
+    def test_from_aliases(self):
+        """Checks a resolver built from the alias table alone resolves aliases (and close variants) without nba_api."""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'aliases.csv')
+            pd.DataFrame({'alias': ['bones hyland', 'kenyon martin'], 'player_id': [1630538, 1630231]}).to_csv(path, index=False)
+            resolver = PlayerIdentityResolver.from_aliases(path)
+            empty = PlayerIdentityResolver.from_aliases(os.path.join(tmp_dir, 'missing.csv'))
+        self.assertEqual(resolver.resolve('Bones Hyland'), 1630538)
+        self.assertEqual(resolver.resolve('Kenyon Martin Jr.'), 1630231)
+        self.assertEqual(resolver.resolve('Bones Hylnd'), 1630538)
+        self.assertIsNone(resolver.resolve('Nikola Jokic'))
+        self.assertEqual(empty.resolve_many(['Bones Hyland']).tolist(), [-1])
+
+    def test_find_duplicate_names(self):
+        duplicates = find_duplicate_names(['Luka Doncic', 'Luka Dončić Jr', 'Luka Doncic', 'Trae Young'])
+        self.assertEqual(duplicates, {'Luka Doncic': ['Luka Dončić Jr'], 'Luka Dončić Jr': ['Luka Doncic']})
+        duplicates = find_duplicate_names(['Luka Doncic', 'Luka Doncich', 'Trae Young'])
+        self.assertEqual(duplicates, {'Luka Doncic': ['Luka Doncich'], 'Luka Doncich': ['Luka Doncic']})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import logging
+import os
+import sys
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from scipy.stats import percentileofscore
+
+sys.path.insert(0, '..')
+from feature_store import FeatureStore
+from player_percentiles import PlayerPercentiles, build_percentiles, percentile_ranks
+sys.path.remove('..')
+
+class TestPlayerPercentiles(unittest.TestCase):
+    """Carries out unittests for the precomputed percentile & league-rank tables."""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.player_df = pd.DataFrame({'PLAYER': ['A B', 'C D', 'E F', 'Nikola Jokić'], 'POS': ['G', 'F', 'F', 'C'],
+                                       'TEAM': ['X', 'Y', 'Y', 'DEN'], 'GP': [70, 12, 12, 74],
+                                       'FG%': [45.1, np.nan, 50.0, 58.3]})
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = FeatureStore(os.path.join(self.tmp_dir.name, 'store'))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write_season(self, season, df):
+        path = os.path.join(self.tmp_dir.name, f'{season}.csv')
+        df.to_csv(path, index=False)
+        return path
+
+    def test_percentile_ranks(self):
+        """Checks percentiles match scipy's weak percentileofscore & ranks count from the league's highest value."""
+        pct_df, rank_df = percentile_ranks(self.player_df)
+        for stat in ['GP', 'FG%']:
+            values = self.player_df[stat].dropna()
+            for row, value in values.items():
+                self.assertAlmostEqual(pct_df[stat][row], percentileofscore(values, value, kind='weak'), places=1)
+        self.assertEqual(rank_df.GP.tolist(), [2, 3, 3, 1])
+        self.assertTrue(np.isnan(pct_df['FG%'][1]))
+
+    def test_lower_is_better(self):
+        """Checks lower-is-better stats rank the league's lowest value first (percentiles: % of players at or above)."""
+        pct_df, rank_df = percentile_ranks(self.player_df.assign(**{'TOV/POSS': [0.10, 0.05, 0.05, 0.20]}))
+        values = pd.Series([0.10, 0.05, 0.05, 0.20])
+        for row, value in values.items():
+            self.assertAlmostEqual(pct_df['TOV/POSS'][row], percentileofscore(-values, -value, kind='weak'), places=1)
+        self.assertEqual(rank_df['TOV/POSS'].tolist(), [3, 1, 1, 4])
+        self.assertEqual(rank_df.GP.tolist(), [2, 3, 3, 1])
+
+    def test_lookup_and_incremental_build(self):
+        """Checks lookups by (normalized) name & that only changed seasons are republished."""
+
+        sources = {'2020-21': self._write_season('2020-21', self.player_df),
+                   '2021-22': self._write_season('2021-22', self.player_df)}
+        self.assertEqual(build_percentiles(self.store, sources), 1)
+        self.assertEqual(build_percentiles(self.store, sources), 1)
+
+        percentiles = PlayerPercentiles.load('2021-22', self.store)
+        self.assertEqual(percentiles.percentile('nikola jokic', 'FG%'), 100.0)
+        self.assertEqual(percentiles.rank('Nikola Jokić', 'GP'), 1.0)
+        self.assertEqual(percentiles.player_summary('A B', ['GP']).RANK.tolist(), [2.0])
+        with self.assertRaises(KeyError):
+            percentiles.percentile('Unknown Player', 'GP')
+
+        self._write_season('2021-22', self.player_df.assign(GP=[1, 2, 3, 4]))
+        self.assertEqual(build_percentiles(self.store, sources), 2)
+        self.assertEqual(self.store.load('percentiles_2020-21').metadata['version'], 1)
+        self.assertEqual(self.store.load('percentiles_2021-22').metadata['version'], 2)
+        self.assertEqual(PlayerPercentiles.load('2021-22', self.store).rank('Nikola Jokić', 'GP'), 1.0)
+        self.assertEqual(PlayerPercentiles.load('2021-22', self.store).rank('A B', 'GP'), 4.0)
+
+if __name__ == '__main__':
+    unittest.main()
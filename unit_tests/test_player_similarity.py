@@ -0,0 +1,41 @@
+import sys
+import unittest
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '..')
+from player_similarity import PlayerSimilarityIndex
+sys.path.remove('..')
+
+class TestPlayerSimilarity(unittest.TestCase):
+
+    def setUp(self):
+        self.player_df = pd.DataFrame({
+            'PLAYER': ['A B', 'C D', 'E F', 'G H', 'Nikola Jokić'],
+            'POS': ['G', 'G', 'F', 'F', 'C'],
+            'STAT_1': [1.0, 1.2, 5.0, 1.1, 9.0],
+            'STAT_2': [2.0, 2.1, 6.0, np.nan, 9.0],
+        })
+        self.index = PlayerSimilarityIndex(self.player_df, archetypes={'A B': 'g_cls_1', 'C D': 'g_cls_2', 'G H': 'g_cls_1'})
+
+    def test_query(self):
+        """Checks neighbors are ranked by distance, exclude the player itself & respect group / archetype filters."""
+
+        self.assertEqual(self.index.query('A B', k=2).MATCH.tolist(), ['C D', 'G H'])
+        self.assertEqual(self.index.query('A B', k=2, same_group=True).MATCH.tolist(), ['C D'])
+        self.assertEqual(self.index.query('A B', k=2, same_archetype=True).MATCH.tolist(), ['G H'])
+        self.assertEqual(self.index.query('nikola jokic', k=1).MATCH.tolist(), ['E F'])
+        with self.assertRaises(KeyError):
+            self.index.query('Unknown Player')
+
+    def test_batch_query(self):
+        """Checks league-wide batch results match the per-player queries."""
+        batch_df = self.index.batch_query(k=3)
+        self.assertEqual(len(batch_df), 15)
+        for player, group_df in batch_df.groupby('PLAYER'):
+            expected_df = self.index.query(player, k=3)
+            self.assertEqual(group_df.MATCH.tolist(), expected_df.MATCH.tolist())
+            self.assertTrue(np.allclose(group_df.DISTANCE, expected_df.DISTANCE))
+
+if __name__ == '__main__':
+    unittest.main()
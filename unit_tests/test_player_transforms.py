@@ -0,0 +1,36 @@
+import sys
+import unittest
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '..')
+from player_transforms import BasisTransform, apply_basis_transforms, apply_efficiency_transforms, clean_percent_columns, \
+    parse_heights
+sys.path.remove('..')
+
+class TestPlayerTransforms(unittest.TestCase):
+
+    def test_basis_and_efficiency_transforms(self):
+        """Checks grouped 2-D divisions match the per-column computations (including zero denominators)."""
+
+        df = pd.DataFrame({'POSS': [100.0, 0.0], 'PTS': [110.0, 4.0], 'TOV': [12.0, 0.0],
+                           'FGA': [20.0, 0.0], 'FGM': [9.0, 0.0], '3PA': [8.0, 2.0], '3PM': [3.0, 1.0]})
+        transforms = [BasisTransform(['PTS', 'TOV'], 'POSS', 1, '{}/POSS', 5), BasisTransform(['3PA'], 'FGA', 1, '%{}', 5)]
+
+        df = apply_basis_transforms(df, transforms)
+        df = apply_efficiency_transforms(df, [('FGA', 'FGM'), ('3PA', '3PM')])
+
+        self.assertEqual(df['PTS/POSS'].tolist()[0], 1.1)
+        self.assertTrue(np.isinf(df['PTS/POSS'][1]) and np.isnan(df['TOV/POSS'][1]))
+        self.assertEqual(df['%3PA'].tolist()[0], 0.4)
+        self.assertEqual(df['FG%'].tolist()[0], 45.0)
+        self.assertEqual(df['3P%'].tolist(), [37.5, 50.0])
+
+    def test_cleanup_and_heights(self):
+        df = pd.DataFrame({'FG%': ['45.1', '-'], 'H': ['6-10', '7-6']})
+        df = clean_percent_columns(df)
+        self.assertEqual(df['FG%'].fillna(-1).tolist(), [45.1, -1])
+        self.assertEqual(parse_heights(df.H).tolist(), [82.0, 90.0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import sys
+import logging
+import threading
+import unittest
+from unittest import mock
+import numpy as np
+
+sys.path.insert(0, '../profiler_webapp')
+from submodules import pp_cache
+from submodules.pp_cache import PolicyCache, current_season
+sys.path.remove('../profiler_webapp')
+
+class TestPolicyCache(unittest.TestCase):
+    """Carries out unittests for the profiler's policy cache (TTLs, entry limits, memory budget & invalidation)."""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.policies = {
+            'player_info': {'max_entries': 2, 'ttl': 60, 'tags': ('player_id',)},
+            'season_shot_data': {'max_entries': 10, 'ttl': 600, 'current_season_ttl': 60, 'tags': ('player_id', 'season')},
+        }
+        self.cache = PolicyCache(self.policies, memory_budget_mb=1)
+        self.calls = []
+
+    def fetch(self, *args):
+        self.calls.append(args)
+        return np.zeros(1000, dtype=np.uint8)  # 1 KB payload
+
+    def test_ttl_expiry(self):
+        """Checks entries expire after their TTL, and current-season shot data after the shorter current-season TTL."""
+
+        with mock.patch.object(pp_cache.time, 'monotonic', return_value=1000.0) as monotonic:
+            self.cache.get_or_compute('player_info', (1,), self.fetch)
+            self.cache.get_or_compute('season_shot_data', (1, '2015-16'), self.fetch)
+            self.cache.get_or_compute('season_shot_data', (1, current_season()), self.fetch)
+
+            monotonic.return_value = 1059.0
+            for name, args in [('player_info', (1,)), ('season_shot_data', (1, '2015-16')), ('season_shot_data', (1, current_season()))]:
+                self.cache.get_or_compute(name, args, self.fetch)
+            self.assertEqual(len(self.calls), 3)
+
+            monotonic.return_value = 1061.0
+            for name, args in [('player_info', (1,)), ('season_shot_data', (1, '2015-16')), ('season_shot_data', (1, current_season()))]:
+                self.cache.get_or_compute(name, args, self.fetch)
+            self.assertEqual(self.calls[3:], [(1,), (1, current_season())])  # The past season's entry outlives both
+
+        usage = self.cache.usage()
+        self.assertEqual(usage['player_info']['expirations'], 1)
+        self.assertEqual(usage['season_shot_data']['expirations'], 1)
+
+    def test_entry_limits(self):
+        """Checks each policy evicts its own least recently used entries beyond its entry limit."""
+
+        for player_id in [1, 2]:
+            self.cache.get_or_compute('player_info', (player_id,), self.fetch)
+        self.cache.get_or_compute('season_shot_data', (1, '2015-16'), self.fetch)
+        self.cache.get_or_compute('player_info', (1,), self.fetch)  # Player 1 becomes the most recently used
+        self.cache.get_or_compute('player_info', (3,), self.fetch)
+
+        usage = self.cache.usage()
+        self.assertEqual((usage['player_info']['entries'], usage['player_info']['evictions']), (2, 1))
+        self.assertEqual(usage['season_shot_data']['entries'], 1)  # Other policies' entries don't count toward the limit
+        self.cache.get_or_compute('player_info', (1,), self.fetch)
+        self.cache.get_or_compute('player_info', (2,), self.fetch)
+        self.assertEqual(self.calls.count((2,)), 2)
+        self.assertEqual(self.calls.count((1,)), 1)
+
+    def test_memory_budget(self):
+        """Checks the least recently used entries (of any policy) are evicted once results exceed the memory budget."""
+
+        cache = PolicyCache(self.policies, memory_budget_mb=2.5 / 1024)  # Room for two 1 KB results
+        cache.get_or_compute('season_shot_data', (1, '2015-16'), self.fetch)
+        cache.get_or_compute('player_info', (1,), self.fetch)
+        cache.get_or_compute('season_shot_data', (1, '2015-16'), self.fetch)  # Hit: player_info (1,) is now the least recently used
+        cache.get_or_compute('season_shot_data', (2, '2015-16'), self.fetch)
+
+        self.assertEqual(cache.usage()['player_info']['entries'], 0)
+        self.assertEqual(cache.usage()['season_shot_data']['entries'], 2)
+        self.assertLessEqual(cache.memory_mb, 2.5 / 1024)
+
+    def test_invalidation(self):
+        """Checks invalidation by function, player & season (entries without a season tag survive season invalidation)."""
+
+        for player_id in [1, 2]:
+            self.cache.get_or_compute('player_info', (player_id,), self.fetch)
+            for season in ['2015-16', current_season()]:
+                self.cache.get_or_compute('season_shot_data', (player_id, season), self.fetch)
+
+        self.assertEqual(self.cache.invalidate_current_season(), 2)
+        self.assertEqual(self.cache.invalidate(player_id=1), 2)
+        self.assertEqual(self.cache.invalidate(name='season_shot_data', player_id=2), 1)
+        self.assertEqual(self.cache.usage()['player_info']['entries'], 1)
+        self.assertEqual(self.cache.invalidate(), 1)
+        self.assertEqual(self.cache.memory_mb, 0)
+
+    def test_failed_fetches(self):
+        """Checks error results ({}) aren't cached and a raising fetch releases its key lock."""
+
+        self.assertEqual(self.cache.get_or_compute('player_info', (1,), lambda player_id: {}), {})
+        self.assertEqual(self.cache.usage()['player_info']['entries'], 0)
+
+        def failing_fetch(player_id):
+            raise ConnectionError('API unavailable')
+
+        with self.assertRaises(ConnectionError):
+            self.cache.get_or_compute('player_info', (1,), failing_fetch)
+        self.assertEqual(self.cache._key_locks, {})
+
+    def test_concurrent_misses(self):
+        """Checks concurrent sessions missing the same key fetch it only once."""
+
+        started, release = threading.Event(), threading.Event()
+
+        def slow_fetch(player_id):
+            started.set()
+            release.wait(5)
+            return self.fetch(player_id)
+
+        threads = [threading.Thread(target=self.cache.get_or_compute, args=('player_info', (1,), slow_fetch)) for _ in range(4)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(self.calls, [(1,)])
+        self.assertEqual(self.cache._key_locks, {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import sys
+import logging
+import threading
+import types
+import unittest
+from unittest import mock
+from requests.adapters import HTTPAdapter
+
+sys.path.insert(0, '../profiler_webapp')
+from submodules import pp_http
+sys.path.remove('../profiler_webapp')
+
+def nba_api_modules(http_class):
+    """Builds stand-in nba_api modules exposing the given class as nba_api.stats.library.http.NBAStatsHTTP."""
+    names = ['nba_api', 'nba_api.stats', 'nba_api.stats.library', 'nba_api.stats.library.http']
+    modules = {name: types.ModuleType(name) for name in names}
+    for parent, child in zip(names, names[1:]):
+        setattr(modules[parent], child.rsplit('.', 1)[1], modules[child])
+    modules['nba_api.stats.library.http'].NBAStatsHTTP = http_class
+    return modules
+
+class TestHTTP(unittest.TestCase):
+    """Carries out unittests for the shared pooled session & nba_api routing."""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.session_patch = mock.patch.object(pp_http, '_session', None)  # Fresh shared session per test
+        self.session_patch.start()
+
+    def tearDown(self):
+        self.session_patch.stop()
+
+    def test_get_session(self):
+        """Checks every caller (across threads) gets one session with the configured pools & gzip headers."""
+
+        sessions = []
+        threads = [threading.Thread(target=lambda: sessions.append(pp_http.get_session())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        session = pp_http.get_session()
+        self.assertTrue(all(s is session for s in sessions))
+
+        for prefix in ('https://', 'http://'):
+            adapter = session.get_adapter(f'{prefix}stats.nba.com/stats/')
+            self.assertIsInstance(adapter, HTTPAdapter)
+            self.assertEqual(adapter._pool_connections, pp_http.POOL_CONNECTIONS)
+            self.assertEqual(adapter._pool_maxsize, pp_http.POOL_MAXSIZE)
+        self.assertEqual((pp_http.POOL_CONNECTIONS, pp_http.POOL_MAXSIZE), (8, 16))
+        self.assertEqual(session.headers['Accept-Encoding'], 'gzip, deflate')
+        self.assertEqual(session.headers['Connection'], 'keep-alive')
+
+    def test_route_nba_api_requests(self):
+        """Checks the shared session is installed when nba_api has the session hook, and nothing happens otherwise."""
+
+        class NBAStatsHTTP:
+            set_session = mock.Mock()
+
+        with mock.patch.dict(sys.modules, nba_api_modules(NBAStatsHTTP)):
+            self.assertTrue(pp_http.route_nba_api_requests())
+        NBAStatsHTTP.set_session.assert_called_once_with(pp_http.get_session())
+
+        class LegacyNBAStatsHTTP:  # Releases without the session hook
+            pass
+
+        pp_http._session = None
+        with mock.patch.dict(sys.modules, nba_api_modules(LegacyNBAStatsHTTP)):
+            self.assertFalse(pp_http.route_nba_api_requests())
+        self.assertFalse(hasattr(LegacyNBAStatsHTTP, 'set_session'))
+
+        with mock.patch.dict(sys.modules, {'nba_api': None}):  # nba_api not installed
+            self.assertFalse(pp_http.route_nba_api_requests())
+        self.assertIsNone(pp_http._session)  # No session is created when nothing is routed
+
+if __name__ == '__main__':
+    unittest.main()
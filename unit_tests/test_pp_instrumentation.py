@@ -0,0 +1,108 @@
+import sys
+import logging
+import threading
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '../profiler_webapp')
+from submodules import pp_instrumentation
+from submodules.pp_instrumentation import SpanRecorder, payload_bytes, percentile
+sys.path.remove('../profiler_webapp')
+
+class TestInstrumentation(unittest.TestCase):
+    """Carries out unittests for the profiler's span recorder, its percentiles & the Prometheus export."""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.recorder = SpanRecorder()
+
+    def test_percentile(self):
+        """Checks the nearest-rank percentile at the extremes, the median & p95, and on one or no samples."""
+        values = [float(i) for i in range(1, 21)]  # 1..20
+        self.assertEqual(percentile(values, 0), 1.0)
+        self.assertEqual(percentile(values, 0.5), 10.0)
+        self.assertEqual(percentile(values, 0.95), 19.0)
+        self.assertEqual(percentile(values, 1), 20.0)
+        for q in [0, 0.5, 0.95, 1]:
+            self.assertEqual(percentile([0.25], q), 0.25)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+    def test_payload_bytes(self):
+        """Checks payload sizes of arrays, dataframes, bytes, text & (nested) containers."""
+        df = pd.DataFrame({'A': np.arange(10, dtype=np.int64)})
+        self.assertEqual(payload_bytes(np.zeros(100, dtype=np.uint8)), 100)
+        self.assertEqual(payload_bytes(df), int(df.memory_usage(deep=True).sum()))
+        self.assertEqual(payload_bytes({'a': b'1234', 'b': ['é', (b'12', None)]}), 8)
+
+    def test_nested_spans_across_threads(self):
+        """Checks hit/miss/error counts of nested spans recorded concurrently, with inner flags never leaking outward."""
+
+        rec = self.recorder
+
+        @rec.timed('cache.fetch', cache=True, measure_bytes=True)
+        def cached_fetch(i):
+            if i % 2:
+                rec.mark_cache_miss()
+            return b'x' * 10
+
+        @rec.timed('fetch.fail')
+        def failing_fetch():
+            raise ValueError('endpoint unavailable')
+
+        barrier = threading.Barrier(8)
+
+        def session(i):
+            barrier.wait()  # Every thread records at the same time
+            with rec.span('page'):
+                cached_fetch(i)
+                try:
+                    failing_fetch()
+                except ValueError:
+                    pass
+                with rec.span('fetch.soft'):
+                    rec.record_error(ValueError('bad payload'), 'Could not parse the payload')
+
+        threads = [threading.Thread(target=session, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        summary = rec.summary()
+        self.assertEqual(sorted(summary), ['cache.fetch', 'fetch.fail', 'fetch.soft', 'page'])
+        self.assertEqual({key: summary['cache.fetch'][key] for key in ['count', 'cache_hits', 'cache_misses', 'errors', 'bytes']},
+                         {'count': 8, 'cache_hits': 4, 'cache_misses': 4, 'errors': 0, 'bytes': 80})
+        self.assertEqual((summary['fetch.fail']['errors'], summary['fetch.soft']['errors']), (8, 8))
+        self.assertEqual({key: summary['page'][key] for key in ['count', 'cache_hits', 'cache_misses', 'errors']},
+                         {'count': 8, 'cache_hits': 0, 'cache_misses': 0, 'errors': 0})
+        self.assertEqual(rec._stack(), [])
+
+    def test_prometheus_format(self):
+        """Checks the exposition text of known span durations (quantiles, sum, count & per-step gauges)."""
+
+        with mock.patch.object(pp_instrumentation.time, 'perf_counter', side_effect=[0.0, 0.1, 1.0, 1.3]):
+            with self.recorder.span('fetch.a', cache_hit=True, nbytes=5):
+                pass
+            with self.recorder.span('fetch.a', cache_hit=False, nbytes=7):
+                pass
+
+        text = self.recorder.to_prometheus(prefix='test')
+        self.assertTrue(text.endswith('\n'))
+        lines = text.splitlines()
+        for line in lines:
+            self.assertRegex(line, r'^(# (HELP|TYPE) test_\w+ .+|test_\w+\{step="[\w.]+"(,quantile="[\d.]+")?\} [\d.e-]+)$')
+        for expected in ['# TYPE test_span_seconds summary',
+                         'test_span_seconds{step="fetch.a",quantile="0.5"} 0.1',
+                         'test_span_seconds{step="fetch.a",quantile="0.95"} 0.3',
+                         'test_span_seconds_sum{step="fetch.a"} 0.4',
+                         'test_span_seconds_count{step="fetch.a"} 2',
+                         '# TYPE test_span_errors gauge', 'test_span_errors{step="fetch.a"} 0',
+                         'test_cache_hits{step="fetch.a"} 1', 'test_cache_misses{step="fetch.a"} 1',
+                         'test_span_bytes{step="fetch.a"} 12']:
+            self.assertIn(expected, lines)
+        self.assertEqual(len([line for line in lines if line.startswith('# TYPE')]), 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import sys
+import logging
+import threading
+import time
+import unittest
+
+sys.path.insert(0, '../profiler_webapp')
+from submodules.pp_cache import PolicyCache
+from submodules.pp_profile_loader import ProfileLoader, RateLimiter, ThrottleMixin, adjacent_seasons
+sys.path.remove('../profiler_webapp')
+
+SEASONS = ['2018-19', '2019-20', '2020-21', '2021-22', '2022-23']
+
+class StubShotChartGenerator(ThrottleMixin):
+    """Stands in for ShotChartGenerator: paces each (recorded) request through the shared limiter, no API access."""
+
+    requests = []
+    lock = threading.Lock()
+
+    def __init__(self, rate_limiter=None):
+        self.request_interval = 0
+        self.rate_limiter = rate_limiter
+
+    def fetch_season_shot_data(self, player_id, season):
+        self._throttle()
+        with self.lock:
+            self.requests.append((player_id, season, time.monotonic()))
+        return f'shots {player_id} {season}', f'league {season}'
+
+class TestProfileLoader(unittest.TestCase):
+    """Carries out unittests for the profile loader's background prefetch of adjacent seasons."""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        StubShotChartGenerator.requests = []
+        self.interval = 0.05
+        self.limiter = RateLimiter(min_interval=self.interval)
+        cache = PolicyCache({'season_shot_data': {'max_entries': 10, 'ttl': 60, 'tags': ('player_id', 'season')}})
+
+        @cache.cached('season_shot_data')  # As in the app: one cache entry per (player, season)
+        def fetch_season_shot_data(player_id, season):
+            return StubShotChartGenerator(rate_limiter=self.limiter).fetch_season_shot_data(player_id, season)
+
+        self.fetch_season_shot_data = fetch_season_shot_data
+        self.loader = ProfileLoader(max_workers=4)
+
+    def test_adjacent_seasons(self):
+        """Checks only unselected neighbours of the selected seasons are prefetched, in order & once each."""
+        self.assertEqual(adjacent_seasons(SEASONS, ['2020-21']), ['2019-20', '2021-22'])
+        self.assertEqual(adjacent_seasons(SEASONS, ['2018-19', '2020-21']), ['2019-20', '2021-22'])
+        self.assertEqual(adjacent_seasons(SEASONS, SEASONS), [])
+
+    def test_prefetch_seasons(self):
+        """Checks prefetched seasons are keyed per (player, season), reused by later requests & paced by the rate budget."""
+
+        futures = {}
+        seasons = self.loader.prefetch_seasons(futures, 1, SEASONS, ['2019-20', '2020-21'], self.fetch_season_shot_data)
+        self.assertEqual(seasons, ['2018-19', '2021-22'])
+        self.assertEqual(sorted(futures), [('season_shots', 1, '2018-19'), ('season_shots', 1, '2021-22')])
+        results = [self.loader.resolve(future, timeout=5) for future in futures.values()]
+        self.assertEqual(sorted(plyr_shots for plyr_shots, _ in results), ['shots 1 2018-19', 'shots 1 2021-22'])
+
+        # Selecting a prefetched season (in another session) is served from the cache; other players are fetched separately
+        other_futures = {}
+        self.loader.submit(other_futures, ('season_shots', 1, '2021-22'), self.fetch_season_shot_data, 1, '2021-22')
+        self.loader.submit(other_futures, ('season_shots', 2, '2021-22'), self.fetch_season_shot_data, 2, '2021-22')
+        self.assertEqual(self.loader.resolve(other_futures[('season_shots', 2, '2021-22')], timeout=5)[0], 'shots 2 2021-22')
+        self.loader.resolve(other_futures[('season_shots', 1, '2021-22')], timeout=5)
+        self.assertEqual(sorted((player_id, season) for player_id, season, _ in StubShotChartGenerator.requests),
+                         [(1, '2018-19'), (1, '2021-22'), (2, '2021-22')])
+
+        # Concurrent fetches still start at least one interval apart
+        request_times = sorted(request_time for _, _, request_time in StubShotChartGenerator.requests)
+        for earlier, later in zip(request_times, request_times[1:]):
+            self.assertGreaterEqual(later - earlier, self.interval * 0.9)
+
+if __name__ == '__main__':
+    unittest.main()
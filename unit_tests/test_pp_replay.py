@@ -0,0 +1,133 @@
+import os
+import sys
+import logging
+import tempfile
+import time
+import unittest
+from unittest import mock
+import requests
+
+sys.path.insert(0, '../profiler_webapp')
+from submodules.pp_cache import PolicyCache
+from submodules.pp_instrumentation import percentile
+from submodules.pp_load_test import ProfileSessionSimulator, run_load_test
+from submodules.pp_profile_loader import ProfileLoader
+from submodules.pp_replay import FixtureArchive, Recorder, ReplayServer, request_key
+sys.path.remove('../profiler_webapp')
+
+ENDPOINT_URL = 'https://stats.nba.com/stats/commonplayerinfo'
+BODY = b'{"resultSets": []}'
+
+def fake_request(session, method, url, params=None, **kwargs):
+    """Stands in for requests.Session.request (no network): answers every request with the same JSON body."""
+    response = requests.Response()
+    response.status_code, response._content = 200, BODY
+    response.headers['Content-Type'] = 'application/json'
+    response.url = requests.Request(method, url, params=params).prepare().url
+    return response
+
+class StubInfoFetcher:
+    def fetch_player_info(self, player_id):
+        return {} if player_id == 2 else {'player_id': player_id}  # Player 2's fetch fails (fetchers return {} on errors)
+
+    def fetch_player_awards(self, player_id):
+        return {'awards': []}
+
+class StubFetcher:
+    """Answers the bio, career stats, shot data & headshot fetches after a fixed per-player delay."""
+
+    def _fetch(self, player_id, *args):
+        time.sleep(0.001 * player_id)
+        return {'player_id': player_id}
+
+    fetch_player_bio = fetch_career_stats = fetch_season_shot_data = fetch_player_headshot = _fetch
+
+class TestReplay(unittest.TestCase):
+    """Carries out unittests for recording/replaying fixture archives & the load-test report."""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'fixtures', 'responses.zip')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_request_key(self):
+        """Checks keys ignore the scheme, method case & parameter order, but not the host, path or values."""
+        key = request_key('GET', f'{ENDPOINT_URL}?PlayerID=2544&LeagueID=00')
+        self.assertEqual(key, request_key('get', 'http://stats.nba.com/stats/commonplayerinfo?LeagueID=00&PlayerID=2544'))
+        self.assertNotEqual(key, request_key('GET', f'{ENDPOINT_URL}?PlayerID=201939&LeagueID=00'))
+        self.assertNotEqual(key, request_key('GET', 'https://www.nba.com/stats/commonplayerinfo?PlayerID=2544&LeagueID=00'))
+
+    def test_record_save_load_replay(self):
+        """Records a stubbed response, round-trips the archive through its zip file & replays it (with injected errors)."""
+
+        with mock.patch.object(requests.Session, 'request', fake_request):
+            with Recorder(FixtureArchive(self.path)) as archive:
+                response = requests.Session().get(ENDPOINT_URL, params={'PlayerID': 2544, 'LeagueID': '00', 'Season': None})
+                requests.Session().post(ENDPOINT_URL, data={'ignored': True})  # Only GET responses are recorded
+            self.assertIs(requests.Session.request, fake_request)  # Restored on exit
+        self.assertEqual(response.content, BODY)
+        self.assertEqual(len(archive), 1)
+        archive.save()
+
+        loaded = FixtureArchive.load(self.path)
+        metadata, body = loaded.get(request_key('GET', f'{ENDPOINT_URL}?LeagueID=00&PlayerID=2544'))
+        self.assertEqual(body, BODY)
+        self.assertEqual((metadata['method'], metadata['status'], metadata['content_type']), ('GET', 200, 'application/json'))
+
+        replay_path = '/stats.nba.com/stats/commonplayerinfo?PlayerID=2544&LeagueID=00'
+        server = ReplayServer(loaded, latency=0.05, seed=0).start()
+        try:
+            start = time.monotonic()
+            response = requests.get(server.base_url + replay_path, timeout=5)
+            self.assertGreaterEqual(time.monotonic() - start, 0.05)  # Injected latency (no jitter)
+            self.assertEqual((response.status_code, response.content), (200, BODY))
+            self.assertEqual(requests.get(server.base_url + '/stats.nba.com/stats/unknown', timeout=5).status_code, 404)
+        finally:
+            server.stop()
+        self.assertEqual(server.stats, {'served': 1, 'errors': 0, 'missing': 1})
+
+        server = ReplayServer(loaded, error_rate=1.0, error_status=503, seed=0).start()
+        try:
+            responses = [requests.get(server.base_url + replay_path, timeout=5) for _ in range(3)]
+        finally:
+            server.stop()
+        self.assertEqual([response.status_code for response in responses], [503] * 3)
+        self.assertEqual(server.stats, {'served': 0, 'errors': 3, 'missing': 0})
+
+    def test_run_load_test(self):
+        """Runs the load test over stub fetchers & checks its failure count and latency percentiles."""
+
+        simulator = ProfileSessionSimulator.__new__(ProfileSessionSimulator)  # Skips the live fetchers & nba_api routing
+        simulator.info_fetcher, simulator.bio_scraper = StubInfoFetcher(), StubFetcher()
+        simulator.stats_fetcher, simulator.shot_generator = StubFetcher(), StubFetcher()
+        simulator.loader, simulator.cache = ProfileLoader(max_workers=6), None
+
+        visits = []
+        run_session = simulator.run_session
+        def recording_run_session(player_id, season):
+            seconds, failed = run_session(player_id, season)
+            visits.append((player_id, seconds))
+            return seconds, failed
+        simulator.run_session = recording_run_session
+
+        report = run_load_test(simulator, [1, 2, 3], '2021-22', n_sessions=30, concurrency=5)
+        latencies = sorted(seconds for _, seconds in visits)
+        self.assertEqual((report['sessions'], report['concurrency']), (30, 5))
+        self.assertEqual(report['failed_sessions'], sum(player_id == 2 for player_id, _ in visits))
+        self.assertGreater(report['failed_sessions'], 0)
+        for key, q in [('p50_ms', 0.50), ('p95_ms', 0.95), ('p99_ms', 0.99)]:
+            self.assertEqual(report[key], round(percentile(latencies, q) * 1000, 1))
+        self.assertEqual(report['max_ms'], round(latencies[-1] * 1000, 1))
+        self.assertLessEqual(report['p50_ms'], report['p95_ms'])
+        self.assertEqual(report['spans']['session.profile']['count'], 30)
+
+        # With the app's cache policies, repeat visits of the successful players are served from the cache
+        simulator.cache = PolicyCache()
+        report = run_load_test(simulator, [1, 2, 3], '2021-22', n_sessions=30, concurrency=5)
+        self.assertEqual(report['failed_sessions'], sum(player_id == 2 for player_id, _ in visits[30:]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import logging
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '..')
+from rating_models import cached_folds, data_hash, export_rating_models, load_rating_models, train_rating_models
+sys.path.remove('..')
+
+class TestRatingModels(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        rng = np.random.RandomState(0)
+        counts = rng.randint(0, 3, size=(60, 4))
+        self.train_df = pd.DataFrame(counts, columns=['g_cls_1', 'g_cls_2', 'f_cls_1', 'b_cls_1'])
+        self.train_df.insert(0, 'Lineups', [f'lineup_{i}' for i in range(60)])
+        self.train_df['OffRtg'] = 100 + 5 * counts[:, 0] + rng.normal(0, 1, 60)
+        self.train_df['DefRtg'] = 110 - 3 * counts[:, 1] + rng.normal(0, 1, 60)
+        self.targets = {'off': 'OffRtg', 'def': 'DefRtg'}
+        self.grid = {'n_estimators': [5, 10], 'max_depth': [2, None]}
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp_dir.name, 'cache')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_folds(self):
+        """Checks the cached folds partition every row exactly once & are reused for the same data."""
+        folds = cached_folds('hash', 23, n_splits=5, cache_dir=self.cache_dir)
+        self.assertEqual(sorted(np.concatenate([test for _, test in folds]).tolist()), list(range(23)))
+        for train, test in folds:
+            self.assertEqual(len(np.intersect1d(train, test)), 0)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        cached = cached_folds('hash', 23, n_splits=5, cache_dir=self.cache_dir)
+        self.assertTrue(all((a[1] == b[1]).all() for a, b in zip(folds, cached)))
+
+    def test_search_cache_and_export(self):
+        """Checks searches are cached by data hash and exported models reload with identical predictions."""
+
+        models, reports = train_rating_models(self.train_df, self.targets, self.grid, n_splits=3, n_jobs=1,
+                                              cache_dir=self.cache_dir)
+        self.assertFalse(reports['off']['cached'])
+        self.assertEqual(reports['off']['candidates'], 4)
+        self.assertGreater(reports['off']['refit_seconds'], 0)
+
+        _, reports = train_rating_models(self.train_df, self.targets, self.grid, n_splits=3, n_jobs=1, cache_dir=self.cache_dir)
+        self.assertTrue(reports['off']['cached'])
+
+        model_dir = os.path.join(self.tmp_dir.name, 'models')
+        export_rating_models(models, reports, model_dir)
+        loaded = load_rating_models(model_dir, names=['off'])
+        X = self.train_df[['g_cls_1', 'g_cls_2', 'f_cls_1', 'b_cls_1']].to_numpy(dtype=float)
+        self.assertTrue(np.allclose(loaded['off'].predict(X), models['off'].predict(X)))
+        with self.assertRaises(FileNotFoundError):
+            load_rating_models(os.path.join(self.tmp_dir.name, 'missing'))
+
+    def test_data_hash(self):
+        X = np.ones((3, 2))
+        self.assertEqual(data_hash(X, np.arange(3)), data_hash(X.copy(), np.arange(3.0)))
+        self.assertNotEqual(data_hash(X, np.arange(3)), data_hash(X, np.arange(1, 4)))
+
+if __name__ == '__main__':
+    unittest.main()
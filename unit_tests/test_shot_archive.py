@@ -0,0 +1,114 @@
+import sys
+import logging
+import tempfile
+import threading
+import time
+import unittest
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '..')
+from rate_limiter import RateLimiter
+from shot_archive import ShotArchive, season_in_progress
+sys.path.remove('..')
+
+def team_shots(team_id, player_ids, n_shots=30, seed=0):
+    """Builds a ShotChartDetail-like frame of a team's shots, in the API's (game, event) order."""
+    rng = np.random.RandomState(seed)
+    return pd.DataFrame({
+        'GRID_TYPE': 'Shot Chart Detail',
+        'GAME_ID': [f'00221{game:05d}' for game in np.sort(rng.randint(1, 20, n_shots))],
+        'GAME_EVENT_ID': np.arange(n_shots),
+        'PLAYER_ID': rng.choice(player_ids, n_shots),
+        'TEAM_ID': team_id,
+        'SHOT_ZONE_BASIC': rng.choice(['Restricted Area', 'Mid-Range', 'Above the Break 3'], n_shots),
+        'LOC_X': rng.randint(-250, 250, n_shots),
+        'LOC_Y': rng.randint(-50, 400, n_shots),
+        'SHOT_MADE_FLAG': rng.randint(0, 2, n_shots),
+        'GAME_DATE': '20211019',
+    })
+
+LEAGUE_AVG = pd.DataFrame({'GRID_TYPE': 'League Averages', 'SHOT_ZONE_BASIC': ['Mid-Range'], 'FGA': [100], 'FGM': [40], 'FG_PCT': [0.4]})
+TEAMS = {1610612744: [201939, 203110], 1610612747: [2544, 1628398, 1629060]}
+
+class TestShotArchive(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.archive = ShotArchive(self.tmp_dir.name)
+        self.frames = {team_id: team_shots(team_id, player_ids, seed=i) for i, (team_id, player_ids) in enumerate(TEAMS.items())}
+        self.requests = []
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def fetch(self, team_id, season):
+        self.requests.append(team_id)
+        return self.frames[team_id].copy(), LEAGUE_AVG.copy()
+
+    def test_player_range_scan(self):
+        """Checks each player's archived shots match their shots across all staged team responses."""
+
+        self.assertEqual(self.archive.ingest('2021-22', list(TEAMS), self.fetch, request_interval=0), [])
+        all_shots = pd.concat(self.frames.values(), ignore_index=True)
+        for player_id in [2544, 201939, 1629060]:
+            shots, league_avg = self.archive.player_season(player_id, '2021-22')
+            expected = all_shots[all_shots.PLAYER_ID == player_id].sort_values(['GAME_ID', 'GAME_EVENT_ID'], ignore_index=True)
+            pd.testing.assert_frame_equal(shots.drop(columns='SEASON'), expected, check_dtype=False)
+            self.assertTrue((shots.SEASON == '2021-22').all())
+            self.assertEqual(league_avg.FGA.tolist(), [100])
+
+        shots, _ = self.archive.player_season(1, '2021-22')
+        self.assertEqual(len(shots), 0)
+        self.assertEqual(list(shots.columns), list(all_shots.columns) + ['SEASON'])
+        self.assertIsNone(self.archive.player_season(2544, '2020-21'))
+        self.assertEqual(self.archive.seasons(), ['2021-22'])
+
+    def test_resumable_ingest(self):
+        """Checks a partly failed ingest stages the fetched teams, writes no partition & resumes with only the missing ones."""
+
+        def flaky_fetch(team_id, season):
+            if team_id == 1610612747:
+                raise ConnectionError('timed out')
+            return self.fetch(team_id, season)
+
+        self.assertEqual(self.archive.ingest('2021-22', list(TEAMS), flaky_fetch, request_interval=0), [1610612747])
+        self.assertIsNone(self.archive.partition('2021-22'))
+        self.assertEqual(self.archive.ingest('2021-22', list(TEAMS), self.fetch, request_interval=0), [])
+        self.assertEqual(self.requests, [1610612744, 1610612747])
+        self.assertEqual(len(self.archive.partition('2021-22')), sum(len(frame) for frame in self.frames.values()))
+
+        # Archived seasons aren't re-fetched unless forced
+        self.archive.ingest('2021-22', list(TEAMS), self.fetch, request_interval=0)
+        self.assertEqual(len(self.requests), 2)
+
+    def test_request_spacing(self):
+        """Checks request starts stay request_interval apart however many workers run, including across ingests sharing a limiter."""
+
+        starts, lock = [], threading.Lock()
+        def timed_fetch(team_id, season):
+            with lock:
+                starts.append(time.monotonic())
+            time.sleep(0.02)
+            return team_shots(team_id, [team_id]), LEAGUE_AVG.copy()
+
+        team_ids = list(range(1, 7))
+        self.assertEqual(self.archive.ingest('2021-22', team_ids, timed_fetch, max_workers=6, request_interval=0.05), [])
+        rate_limiter = RateLimiter(min_interval=0.05)
+        for season in ['2019-20', '2020-21']:
+            self.archive.ingest(season, team_ids[:3], timed_fetch, max_workers=3, rate_limiter=rate_limiter)
+
+        self.assertEqual(len(starts), 12)
+        gaps = np.diff(sorted(starts))
+        self.assertGreaterEqual(min(gaps[:5]), 0.045)  # One ingest's 6 concurrent workers
+        self.assertGreaterEqual(min(gaps[6:]), 0.045)  # Both ingests sharing a limiter (no burst when the season changes)
+
+    def test_season_in_progress(self):
+        """Checks seasons count as in progress from their October start."""
+        self.assertTrue(season_in_progress('2023-24', today=pd.Timestamp('2023-10-24').date()))
+        self.assertFalse(season_in_progress('2022-23', today=pd.Timestamp('2023-10-24').date()))
+        self.assertFalse(season_in_progress('2023-24', today=pd.Timestamp('2024-10-01').date()))
+
+if __name__ == '__main__':
+    unittest.main()
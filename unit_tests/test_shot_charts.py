@@ -0,0 +1,115 @@
+import sys
+import os
+import logging
+import tempfile
+import time
+import types
+import unittest
+from unittest import mock
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from PIL import Image
+
+sys.path.insert(0, '..')
+sys.path.insert(0, '../profiler_webapp')
+from asset_cache import AssetCache
+from shot_archive import ShotArchive
+from submodules import pp_generate_shot_charts
+from submodules.pp_profile_loader import RateLimiter
+sys.path.remove('../profiler_webapp')
+sys.path.remove('..')
+
+class TestShotCharts(unittest.TestCase):
+    """Draws the profiler's court offline (temporary texture images & a pre-seeded headshot, no API requests)."""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.module_attrs = {name: getattr(pp_generate_shot_charts, name)
+                             for name in ['WOOD1_IMG_PATH', 'WOOD2_IMG_PATH', 'LOGO_IMG_PATH', 'asset_cache']}
+
+        rng = np.random.RandomState(0)
+        for name, shape in [('WOOD1_IMG_PATH', (120, 80, 4)), ('WOOD2_IMG_PATH', (90, 60, 4)), ('LOGO_IMG_PATH', (40, 100, 4))]:
+            path = os.path.join(self.tmp_dir.name, f'{name}.png')
+            Image.fromarray(rng.randint(0, 256, size=shape).astype(np.uint8)).save(path)
+            setattr(pp_generate_shot_charts, name, path)
+        sources = {'headshot': 'http://127.0.0.1:9/{key}.png'}  # Unreachable, so missing headshots fail fast without the CDN
+        asset_cache = AssetCache(os.path.join(self.tmp_dir.name, 'assets'), sources=sources)
+        asset_cache.add('headshot', 2544, np.full((190, 260, 4), 128, dtype=np.uint8))
+        asset_cache.save_index()
+        pp_generate_shot_charts.asset_cache = asset_cache
+        pp_generate_shot_charts.load_court_textures.cache_clear()
+
+    def tearDown(self):
+        for name, value in self.module_attrs.items():
+            setattr(pp_generate_shot_charts, name, value)
+        pp_generate_shot_charts.load_court_textures.cache_clear()
+        plt.close('all')
+        self.tmp_dir.cleanup()
+
+    def test_draw_court(self):
+        """Checks the court renders its textures, logo, team-color borders & headshot, and the textures are only decoded once."""
+
+        generator = pp_generate_shot_charts.ShotChartGenerator()
+        ax = generator._draw_court(2544, ['#552583', '#FDB927'], title='Test')
+        ax.figure.canvas.draw()
+        self.assertEqual(len(ax.images), 7)  # 4 textures & logo, 2 gradient borders, 1 headshot
+
+        wood_texture_one, _, wood_texture_masked, _ = pp_generate_shot_charts.load_court_textures()
+        self.assertEqual(wood_texture_masked.shape, (300, 300, 4))
+        self.assertFalse(wood_texture_masked[-1, 150].any())  # Under the basket (inside the arc) is masked out
+        self.assertTrue(wood_texture_masked[0, 0].any())  # Half-court corner (beyond the arc) keeps the texture
+
+        generator._draw_court(1, ['#552583', '#FDB927'])  # No stored headshot: drawn without it
+        self.assertEqual(pp_generate_shot_charts.load_court_textures.cache_info().misses, 1)
+
+    def test_throttle(self):
+        """Checks the generator paces requests through the shared RateLimiter when given one."""
+
+        rate_limiter = RateLimiter(min_interval=0.05)
+        generator = pp_generate_shot_charts.ShotChartGenerator(rate_limiter)
+        start = time.monotonic()
+        for _ in range(3):
+            generator._throttle()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)  # Third slot: two intervals after the first request
+        self.assertEqual(type(rate_limiter).__module__, 'rate_limiter')
+
+    def test_throttle_before_requests(self):
+        """Checks every shot chart request waits for its rate-limiter slot before reaching the API (season & filtered fetches)."""
+
+        calls = []
+
+        class RecordingLimiter:
+            def wait(self):
+                calls.append('wait')
+                return 0.0
+
+        class ShotChartDetail:  # Stand-in for nba_api's endpoint (records each request)
+            def __init__(self, **params):
+                calls.append(('request', params['season_nullable']))
+
+            def get_data_frames(self):
+                league_df = pd.DataFrame({'SHOT_ZONE_BASIC': ['Mid-Range'], 'SHOT_ZONE_AREA': ['Center(C)'],
+                                          'SHOT_ZONE_RANGE': ['16-24 ft.'], 'FGA': [10], 'FGM': [4], 'FG_PCT': [0.4]})
+                return [pd.DataFrame({'LOC_X': [0], 'LOC_Y': [100], 'SHOT_MADE_FLAG': [1]}), league_df]
+
+        endpoints = types.ModuleType('nba_api.stats.endpoints')
+        endpoints.shotchartdetail = types.SimpleNamespace(ShotChartDetail=ShotChartDetail)
+        api_modules = {'nba_api': types.ModuleType('nba_api'), 'nba_api.stats': types.ModuleType('nba_api.stats'),
+                       'nba_api.stats.endpoints': endpoints}
+        generator = pp_generate_shot_charts.ShotChartGenerator(RecordingLimiter())
+
+        with mock.patch.dict(sys.modules, api_modules), \
+                mock.patch.object(pp_generate_shot_charts, 'shot_archive', ShotArchive(self.tmp_dir.name)):  # Nothing archived
+            generator.fetch_season_shot_data(2544, '2021-22')
+            self.assertEqual(calls, ['wait', ('request', '2021-22')])
+
+            calls.clear()
+            generator.fetch_filtered_shot_data(2544, ['2020-21', '2021-22'], {})
+            self.assertEqual(calls, ['wait', ('request', '2020-21'), 'wait', ('request', '2021-22')])
+
+if __name__ == '__main__':
+    unittest.main()
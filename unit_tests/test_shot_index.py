@@ -0,0 +1,69 @@
+import sys
+import unittest
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '..')
+from shot_index import ShotIndex, X_EDGES, Y_EDGES
+sys.path.remove('..')
+
+class TestShotIndex(unittest.TestCase):
+
+    def test_lineup_histogram(self):
+        """Builds an index from a small shot frame & checks lineup sums against a direct histogram of the same shots."""
+
+        shots_df = pd.DataFrame({
+            'PLAYER_ID': [7, 7, 3, 3, 3, 9],
+            'PLAYER_NAME': ['A B', 'A B', 'C D', 'C D', 'C D', 'E F'],
+            'LOC_X': [0, 0, -240, 100, 500, 30],  # 500 falls outside of the court grid
+            'LOC_Y': [0, 5, 200, 300, 0, -50],
+            'SHOT_MADE_FLAG': [1, 0, 1, 1, 0, 0],
+        })
+
+        index = ShotIndex.build(shots_df)
+        lineup = index.lineup_histogram(['A B', 3, 'Unknown Player'])
+
+        # Check the summed histogram equals binning the same players' in-grid shots directly
+        subset = shots_df[shots_df.PLAYER_ID.isin([7, 3])]
+        expected, _, _ = np.histogram2d(subset.LOC_X, subset.LOC_Y, bins=[X_EDGES, Y_EDGES])
+        self.assertTrue(np.array_equal(lineup, expected))
+        self.assertEqual(lineup.sum(), 4)
+        self.assertEqual(index.lineup_histogram([7, 3], made_only=True).sum(), 3)
+
+    def test_grid_edges(self):
+        """Checks shots exactly on the grid's outer edges are counted, in the outermost cells (like np.histogram2d)."""
+
+        shots_df = pd.DataFrame({
+            'PLAYER_ID': [7] * 5,
+            'PLAYER_NAME': ['A B'] * 5,
+            'LOC_X': [X_EDGES[-1], X_EDGES[0], X_EDGES[-1], 0, X_EDGES[-1] + 1],  # The last shot is just off the grid
+            'LOC_Y': [Y_EDGES[-1], Y_EDGES[0], 0, Y_EDGES[-1], 0],
+            'SHOT_MADE_FLAG': [1, 1, 0, 0, 1],
+        })
+
+        lineup = ShotIndex.build(shots_df).lineup_histogram([7])
+        expected, _, _ = np.histogram2d(shots_df.LOC_X, shots_df.LOC_Y, bins=[X_EDGES, Y_EDGES])
+        self.assertTrue(np.array_equal(lineup, expected))
+        self.assertEqual(lineup.sum(), 4)
+        self.assertEqual((lineup[-1, -1], lineup[0, 0]), (1, 1))
+
+    def test_missing_player_ids(self):
+        """Checks shots without a player id are dropped instead of breaking (or shifting) the per-player histograms."""
+
+        shots_df = pd.DataFrame({
+            'PLAYER_ID': [7, np.nan, 3, np.nan],
+            'PLAYER_NAME': ['A B', None, 'C D', 'Unknown'],
+            'LOC_X': [0, 10, 100, 20],
+            'LOC_Y': [0, 10, 300, 20],
+            'SHOT_MADE_FLAG': [1, 1, 0, 1],
+        })
+
+        index = ShotIndex.build(shots_df)
+        self.assertEqual(index.player_ids.tolist(), [3, 7])
+        self.assertEqual(index.player_names.tolist(), ['C D', 'A B'])
+        self.assertEqual(index.attempts.sum(), 2)
+        self.assertEqual(index.lineup_histogram(['A B']).sum(), 1)
+        self.assertEqual(index.lineup_histogram([3], made_only=True).sum(), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import json
+import logging
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+import pandas as pd
+
+sys.path.insert(0, '..')
+import stats_compiler
+from stats_compiler import StatsCompiler, FixtureClient, TableSpec, fixture_name, merge_tables, normalize_table
+sys.path.remove('..')
+
+class TestStatsCompiler(unittest.TestCase):
+    """Carries out unittests for the fixture-backed fetch, checkpoint/resume & normalization steps."""
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def test_fetch_and_resume(self):
+        """Fetches a table from recorded fixtures, then checks a re-run resumes from the checkpoint without refetching."""
+
+        spec = TableSpec('LeagueDashPlayerStats', {'measure_type_detailed_defense': 'Base'}, {'GP': 'GP', 'FG_PCT': 'FG%'})
+        payload = {'resultSets': [{'headers': ['PLAYER_ID', 'PLAYER_NAME', 'GP', 'FG_PCT'],
+                                   'rowSet': [[1, 'A B', 70, 0.443], [2, 'C D', 12, 0.5]]}]}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            params = {'season': '2021-22', 'season_type_all_star': 'Regular Season', **spec.params}
+            with open(os.path.join(tmp_dir, fixture_name(spec.endpoint, params) + '.json'), 'w') as f:
+                json.dump(payload, f)
+
+            compiler = StatsCompiler(FixtureClient(tmp_dir), checkpoint_dir=tmp_dir, specs={'trad_stats': spec},
+                                     requests_per_second=None)
+            self.assertEqual(compiler.fetch_all(), [])
+
+            # Check the checkpointed table follows the project's naming & percentage conventions
+            table = compiler.load_table('trad_stats')
+            self.assertEqual(table.columns.tolist(), ['PLAYER_ID', 'PLAYER', 'GP', 'FG%'])
+            self.assertEqual(table['FG%'].tolist(), [44.3, 50.0])
+
+            # Check a re-run doesn't touch the (now unavailable) endpoint again
+            compiler.client = None
+            self.assertEqual(compiler.fetch_all(), [])
+
+            # Check the compiler refuses settings that would never attempt a request
+            with self.assertRaises(ValueError):
+                StatsCompiler(FixtureClient(tmp_dir), checkpoint_dir=tmp_dir, specs={'trad_stats': spec}, max_retries=0)
+
+    def test_normalize_zone_headers(self):
+        """Checks grouped shot-zone headers are flattened into the zone-prefixed column names."""
+
+        spec = TableSpec('LeagueDashPlayerShotLocations', {}, {'RA_FGA': 'opp_RA_FGA', 'MR_FGM': 'opp_MR_FGM'})
+        payload = {'resultSets': {'headers': [
+            {'name': 'SHOT_CATEGORY', 'columnSpan': 2, 'columnsToSkip': 2, 'columnNames': ['Restricted Area', 'Mid-Range']},
+            {'name': 'columns', 'columnNames': ['PLAYER_ID', 'PLAYER_NAME', 'FGM', 'FGA', 'FGM', 'FGA']},
+        ], 'rowSet': [[1, 'A B', 3, 5, 2, 9]]}}
+
+        table = normalize_table(spec, payload)
+        self.assertEqual(table.columns.tolist(), ['PLAYER_ID', 'PLAYER', 'opp_RA_FGA', 'opp_MR_FGM'])
+        self.assertEqual(table.iloc[0].tolist(), [1, 'A B', 5, 2])
+
+    def test_merge_tables(self):
+        """Merges tables keyed by ids (and by names only) & checks duplicates and conflicting columns are reported."""
+
+        tables = {
+            'trad_stats': pd.DataFrame({'PLAYER_ID': [1, 2, 2], 'PLAYER': ['A B', 'C D', 'C D'], 'GP': [70, 12, 99]}),
+            'adv_stats': pd.DataFrame({'PLAYER_ID': [3, 1], 'PLAYER': ['E F', 'A B'], 'POSS': [900, 4000], 'GP': [5, 71]}),
+            'name_only': pd.DataFrame({'PLAYER': ['C D', 'X Y'], 'DEFWS': [0.1, 0.2]}),
+        }
+
+        merged_df, report = merge_tables(tables)
+
+        self.assertEqual(merged_df.PLAYER_ID.tolist(), [1, 2, 3])
+        self.assertEqual(merged_df.PLAYER.tolist(), ['A B', 'C D', 'E F'])
+        self.assertEqual(merged_df.columns.tolist(), ['PLAYER_ID', 'PLAYER', 'GP', 'POSS', 'DEFWS'])
+        self.assertEqual(merged_df.GP.tolist(), [70, 12, 5])
+        self.assertEqual(merged_df.DEFWS.fillna(-1).tolist(), [-1, 0.1, -1])
+
+        # Check the duplicate, unresolved name & conflicting column were reported
+        self.assertEqual(report['duplicates'], {'trad_stats': [2]})
+        self.assertEqual(report['unresolved'], {'name_only': 1})
+        self.assertEqual(report['conflicts'], {'GP': {'tables': ['trad_stats', 'adv_stats'], 'mismatches': 1}})
+
+    def test_fixture_runs_skip_nba_api(self):
+        """Checks a --fixtures run builds its resolver from the alias table, without importing nba_api."""
+
+        resolver_cls = stats_compiler.PlayerIdentityResolver
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                mock.patch.dict(sys.modules, {'nba_api': None}), \
+                mock.patch.object(resolver_cls, 'from_nba_api', side_effect=AssertionError('nba_api used')), \
+                mock.patch.object(resolver_cls, 'from_aliases', wraps=resolver_cls.from_aliases) as from_aliases, \
+                mock.patch.object(stats_compiler, 'StatsCompiler') as compiler_cls, \
+                mock.patch.object(sys, 'argv', ['stats_compiler.py', '--fixtures', tmp_dir]):
+            compiler_cls.return_value.fetch_all.return_value = ['trad_stats']  # Stops main() before compiling
+            with self.assertRaises(SystemExit):
+                stats_compiler.main()
+
+        from_aliases.assert_called_once_with()
+        self.assertIsInstance(compiler_cls.call_args.args[0], FixtureClient)
+        self.assertIsInstance(compiler_cls.call_args.kwargs['resolver'], resolver_cls)
+
+if __name__ == '__main__':
+    unittest.main()
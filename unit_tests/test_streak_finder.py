@@ -64,5 +64,32 @@ class TestStreakFinder(unittest.TestCase):
         ret_dates = test_finder.dates
         self.assertEqual(ret_dates, [8, 10])
 
+    def test_best_stretch(self):
+        """Tests the streak index queries over a game log spanning two seasons (whole career & date ranges)."""
+
+        test_df = pd.DataFrame({
+            'player_id': [2, 2, 2, 2, 2, 2, 2, 2, 3],
+            'player_name': ['A B', 'A B', 'A B', 'A B', 'A B', 'A B', 'A B', 'A B', 'C D'],
+            'fixture_id': [18200001, 18200002, 18200003, 18200004, 19200001, 19200002, 19200003, 19200004, 19200005],
+            'played_on': [1, 2, 3, 4, 5, 6, 7, 8, 9],
+            'points': [10, 10, 20, 20, 30, 0, 10, 0, 50],  # Deviations from season averages: [-5, -5, 5, 5, 20, -10, 0, -10]
+        })
+
+        test_finder = StreakFinder()
+        test_finder.comprehensive_stats_df = test_df
+        test_finder.player = 2
+
+        # Check the career stretch spans both seasons & that date ranges only consider the games played within them
+        streak = test_finder.best_stretch('points')
+        self.assertEqual((streak.total, streak.start, streak.end), (30.0, 2, 4))
+        self.assertEqual(test_finder.streak_index('points').stretch_dates(streak), [3, 5])
+        self.assertEqual(tuple(test_finder.best_stretch('points', start_date=1, end_date=4)), (10.0, 2, 3))
+        self.assertEqual(tuple(test_finder.best_stretch('points', start_date=5)), (20.0, 4, 4))
+        self.assertIsNone(test_finder.best_stretch('points', start_date=10))
+
+        # Check the index is only built once per player & category
+        self.assertIs(test_finder.streak_index('points'), test_finder.streak_index('points'))
+        self.assertEqual(list(test_finder.streak_indexes), [(2, 'points')])
+
 if __name__ == '__main__':
     unittest.main()
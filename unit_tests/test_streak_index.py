@@ -0,0 +1,62 @@
+import sys
+import logging
+import unittest
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '..')
+from streak_index import StreakIndex
+sys.path.remove('..')
+
+def brute_force_best(values):
+    """Returns the maximum sum of any non-empty run of consecutive values."""
+    return max(sum(values[i:j + 1]) for i in range(len(values)) for j in range(i, len(values)))
+
+class TestStreakIndex(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def test_range_queries(self):
+        """Checks the best stretch of random game ranges (incl. single games & all-negative runs) against brute force."""
+
+        rng = np.random.RandomState(0)
+        for n in [1, 2, 7, 64, 100]:
+            values = rng.randint(-10, 8, n).astype(float)
+            index = StreakIndex(values)
+            for _ in range(30):
+                start, end = sorted(rng.randint(0, n, 2))
+                streak = index.query(start, end)
+                self.assertAlmostEqual(streak.total, brute_force_best(values[start:end + 1].tolist()))
+                self.assertTrue(start <= streak.start <= streak.end <= end)
+                self.assertAlmostEqual(streak.total, values[streak.start:streak.end + 1].sum())
+
+        self.assertEqual(tuple(StreakIndex([3, -1, 4, -10, 2]).query()), (6.0, 0, 2))
+        self.assertIsNone(StreakIndex([1, 2]).query(2, 5))
+        self.assertIsNone(StreakIndex([]).query())
+
+    def test_game_log_queries(self):
+        """Checks date, single-season & cross-season queries on a game log scored against each season's average."""
+
+        stats_df = pd.DataFrame({
+            'fixture_id': [18200001, 18200002, 18200003, 18200004, 19200001, 19200002, 19200003, 19200004],
+            'played_on': ['2018-10-17', '2018-10-19', '2018-10-21', '2018-10-23', '2019-10-23', '2019-10-25', '2019-10-27', '2019-10-29'],
+            'points': [10, 21, '', 29, 25, 12, 35, 8],
+        })
+        index = StreakIndex.from_game_log(stats_df, 'points')
+        # Season averages: 20 (2018-19, the empty game is skipped) & 20 (2019-20)
+        np.testing.assert_allclose(index.total[index.size:index.size + index.n], [-10, 1, 9, 5, -8, 15, -12])
+
+        self.assertEqual(tuple(index.query_seasons(18)), (10.0, 1, 2))
+        self.assertEqual(tuple(index.query_seasons(19)), (15.0, 5, 5))
+        self.assertEqual(index.stretch_dates(index.query_seasons(18, 19)), ['2018-10-19', '2019-10-27'])
+        self.assertEqual(tuple(index.query_dates('2019-01-01', '2019-10-25')), (5.0, 3, 3))
+        self.assertEqual(tuple(index.query_dates(end_date='2018-10-21')), (1.0, 1, 1))
+
+        career_index = StreakIndex.from_game_log(stats_df, 'points', baseline='career')
+        self.assertEqual(tuple(career_index.query()), (22.0, 1, 5))  # Career average is also 20
+        with self.assertRaises(ValueError):
+            StreakIndex.from_game_log(stats_df, 'points', baseline='month')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+import sys
+import logging
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, '..')
+from shot_archive import ShotArchive
+from zone_summaries import ZoneSummaries, SHOT_ZONE_BASIC_ZONES, ZONES
+sys.path.remove('..')
+
+SHOT_ZONE_BASIC = ['Restricted Area', 'In The Paint (Non-RA)', 'Mid-Range', 'Left Corner 3', 'Right Corner 3', 'Above the Break 3', 'Backcourt']
+TEAMS = {1610612744: [201939, 203110], 1610612747: [2544, 1628398]}
+
+def season_shots(season, n_shots=400):
+    """Builds ShotChartDetail-like frames of each team's shots for a season."""
+    rng = np.random.RandomState(int(season[:4]))
+    return {team_id: pd.DataFrame({
+        'GAME_ID': [f'00221{game:05d}' for game in np.sort(rng.randint(1, 30, n_shots))],
+        'GAME_EVENT_ID': np.arange(n_shots),
+        'PLAYER_ID': rng.choice(player_ids, n_shots),
+        'PLAYER_NAME': 'Player',
+        'SHOT_ZONE_BASIC': rng.choice(SHOT_ZONE_BASIC, n_shots, p=[0.3, 0.15, 0.15, 0.08, 0.07, 0.24, 0.01]),
+        'SHOT_MADE_FLAG': rng.randint(0, 2, n_shots),
+    }) for team_id, player_ids in TEAMS.items()}
+
+class TestZoneSummaries(unittest.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.archive = ShotArchive(os.path.join(self.tmp_dir.name, 'archive'))
+        self.shots = {season: season_shots(season) for season in ['2020-21', '2021-22']}
+        for season in self.shots:
+            self.ingest(season)
+        self.summaries = ZoneSummaries(self.archive, os.path.join(self.tmp_dir.name, 'summaries'))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def ingest(self, season, force=False):
+        fetch = lambda team_id, season: (self.shots[season][team_id], pd.DataFrame({'FGA': [1]}))
+        self.archive.ingest(season, list(TEAMS), fetch, request_interval=0, force=force)
+
+    def expected_zones(self, player_ids, seasons):
+        """Recomputes zone attempts, makes, FG% & frequency directly from the raw shots."""
+        shots_df = pd.concat([frame for season in seasons for frame in self.shots[season].values()], ignore_index=True)
+        shots_df = shots_df[shots_df.PLAYER_ID.isin(player_ids)]
+        zones = shots_df.SHOT_ZONE_BASIC.map(SHOT_ZONE_BASIC_ZONES)
+        expected_df = shots_df.groupby(zones)['SHOT_MADE_FLAG'].agg(['count', 'sum']).reindex(ZONES)
+        expected_df['FREQ'] = expected_df['count'] / len(shots_df)
+        return expected_df
+
+    def test_zone_table(self):
+        """Checks player, lineup & league zone splits over several seasons against a direct groupby of the shots."""
+
+        self.assertEqual(self.summaries.refresh(), ['2020-21', '2021-22'])
+        seasons = ['2020-21', '2021-22']
+        league_ids = [player_id for player_ids in TEAMS.values() for player_id in player_ids]
+        league_df = self.expected_zones(league_ids, seasons)
+
+        for player_ids in [[2544], [2544, 201939]]:
+            zones_df = self.summaries.zone_table(player_ids, seasons).set_index('ZONE')
+            expected_df = self.expected_zones(player_ids, seasons)
+            self.assertEqual(zones_df.FGA.tolist(), expected_df['count'].tolist())
+            self.assertEqual(zones_df.FGM.tolist(), expected_df['sum'].tolist())
+            np.testing.assert_allclose(zones_df.FREQ, expected_df.FREQ.round(3))
+            np.testing.assert_allclose(zones_df.LG_FG_PCT, (league_df['sum'] / league_df['count']).round(3))
+            np.testing.assert_allclose(zones_df.FG_PCT_DELTA, (zones_df.FG_PCT - zones_df.LG_FG_PCT).round(3))
+
+        self.assertIsNone(self.summaries.player_zones(2544, ['2019-20']))
+
+    def test_incremental_refresh(self):
+        """Checks only seasons whose archive partition was rebuilt are summarized again, and reopened tables match."""
+
+        self.summaries.refresh()
+        self.assertEqual(self.summaries.refresh(), [])
+        self.shots['2021-22'] = season_shots('2022-23')
+        self.ingest('2021-22', force=True)
+        self.assertEqual(self.summaries.refresh(), ['2021-22'])
+
+        reopened = ZoneSummaries(self.archive, self.summaries.root)
+        pd.testing.assert_frame_equal(reopened.player_zones(2544, ['2021-22']), self.summaries.player_zones(2544, ['2021-22']))
+        self.assertEqual(reopened.player_zones(2544, ['2021-22']).FGA.tolist(), self.expected_zones([2544], ['2021-22'])['count'].tolist())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+import argparse
+import json
+import logging
+import os
+import threading
+import numpy as np
+import pandas as pd
+from shot_archive import ShotArchive, ARCHIVE_DIR
+
+# Defining the location of the materialized zone tables (one CSV per archived season) & their refresh index
+SUMMARY_DIR = './data/zone_summaries'
+INDEX_NAME = 'index.json'
+
+# Shot zones, named like the processor's %<zone>_FGA columns (backcourt heaves only count toward a player's total FGA)
+ZONES = ['RA', 'PT_nonRA', 'MR', 'Corner3', 'ATB3']
+SHOT_ZONE_BASIC_ZONES = {
+    'Restricted Area': 'RA',
+    'In The Paint (Non-RA)': 'PT_nonRA',
+    'Mid-Range': 'MR',
+    'Left Corner 3': 'Corner3',
+    'Right Corner 3': 'Corner3',
+    'Above the Break 3': 'ATB3',
+}
+
+# League-wide rows are stored alongside the players' under this id
+LEAGUE_ID = 0
+COUNT_COLS = ['FGA', 'FGM', 'PLAYER_FGA']
+
+def build_season_table(partition):
+    """Counts every player's (and the league's) attempts & makes per zone in one bincount pass over an archived season.
+
+    The partition is sorted by player, so each shot's player row comes from the offsets index and its zone from the
+    dictionary codes of SHOT_ZONE_BASIC; nothing is decoded or grouped shot by shot.
+    """
+
+    n_players, n_zones = len(partition.player_ids), len(ZONES) + 1  # Last zone: shots outside the charted zones
+    categories = partition.meta['columns']['SHOT_ZONE_BASIC']['categories']
+    zone_of_code = np.array([ZONES.index(SHOT_ZONE_BASIC_ZONES[zone]) if zone in SHOT_ZONE_BASIC_ZONES else len(ZONES)
+                             for zone in categories], dtype=np.int64)
+    player_rows = np.repeat(np.arange(n_players), np.diff(partition.offsets))
+    cell_ids = player_rows * n_zones + zone_of_code[partition.column('SHOT_ZONE_BASIC')]
+    fga = np.bincount(cell_ids, minlength=n_players * n_zones).reshape(n_players, n_zones)
+    fgm = np.bincount(cell_ids, weights=partition.column('SHOT_MADE_FLAG'), minlength=n_players * n_zones).reshape(n_players, n_zones)
+
+    # Prepend the league totals, then lay the (player x zone) counts out as one row per player & zone
+    fga = np.vstack([fga.sum(axis=0), fga])
+    fgm = np.vstack([fgm.sum(axis=0), fgm])
+    player_ids = np.concatenate([[LEAGUE_ID], partition.player_ids])
+    if 'PLAYER_NAME' in partition.meta['columns']:
+        name_codes = partition.column('PLAYER_NAME')[partition.offsets[:-1]]
+        names = np.asarray(partition.meta['columns']['PLAYER_NAME']['categories'], dtype=object)[name_codes]
+    else:
+        names = np.full(n_players, None, dtype=object)
+    names = np.concatenate([['League Average'], names])
+
+    return pd.DataFrame({
+        'SEASON': partition.season,
+        'PLAYER_ID': np.repeat(player_ids, len(ZONES)),
+        'PLAYER_NAME': np.repeat(names, len(ZONES)),
+        'ZONE': np.tile(ZONES, len(player_ids)),
+        'FGA': fga[:, :len(ZONES)].ravel(),
+        'FGM': fgm[:, :len(ZONES)].ravel().astype(np.int64),
+        'PLAYER_FGA': np.repeat(fga.sum(axis=1), len(ZONES)),
+    })
+
+def add_rates(counts_df, league_df):
+    """Adds zone FG% & attempt frequency (share of all FGA) to zone counts, with the league's and the deltas to them."""
+
+    zones_df = counts_df.copy()
+    zones_df['FG_PCT'] = (zones_df['FGM'] / zones_df['FGA'].where(zones_df['FGA'] > 0)).round(3)
+    zones_df['FREQ'] = (zones_df['FGA'] / zones_df['PLAYER_FGA'].where(zones_df['PLAYER_FGA'] > 0)).round(3)
+    league_rates = pd.DataFrame({
+        'LG_FG_PCT': (league_df['FGM'] / league_df['FGA'].where(league_df['FGA'] > 0)).round(3).values,
+        'LG_FREQ': (league_df['FGA'] / league_df['PLAYER_FGA'].where(league_df['PLAYER_FGA'] > 0)).round(3).values,
+    }, index=league_df['ZONE'].values)
+    zones_df = zones_df.join(league_rates, on='ZONE')
+    zones_df['FG_PCT_DELTA'] = (zones_df['FG_PCT'] - zones_df['LG_FG_PCT']).round(3)
+    zones_df['FREQ_DELTA'] = (zones_df['FREQ'] - zones_df['LG_FREQ']).round(3)
+    return zones_df
+
+class ZoneSummaries:
+    """Materialized per-player, per-season zone tables built from the shot archive, refreshed one season at a time."""
+
+    def __init__(self, archive=None, root=SUMMARY_DIR):
+        self.archive = archive if archive is not None else ShotArchive(ARCHIVE_DIR)
+        self.root = root
+        self._tables = {}  # {season: zone table} of the seasons read in this process
+        self._lock = threading.Lock()
+        self.index = self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.root, INDEX_NAME), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _path(self, season):
+        return os.path.join(self.root, f'season={season}.csv')
+
+    def seasons(self):
+        return sorted(self.index)
+
+    def refresh(self, seasons=None):
+        """Rebuilds the tables of the (given or all) archived seasons whose partition changed since they were built; returns those seasons."""
+
+        refreshed = []
+        for season in seasons or self.archive.seasons():
+            partition = self.archive.partition(season)
+            if partition is None or self.index.get(season) == partition.meta['built_at']:
+                continue
+            counts_df = build_season_table(partition)
+            table_df = add_rates(counts_df, counts_df[counts_df['PLAYER_ID'] == LEAGUE_ID])
+            os.makedirs(self.root, exist_ok=True)
+            table_df.to_csv(self._path(season) + '.tmp', index=False)
+            os.replace(self._path(season) + '.tmp', self._path(season))
+            with self._lock:
+                self._tables[season] = table_df
+                self.index[season] = partition.meta['built_at']
+            refreshed.append(season)
+
+        if refreshed:
+            with open(os.path.join(self.root, INDEX_NAME), 'w') as f:
+                json.dump(self.index, f, indent=1, sort_keys=True)
+            logging.info(f'LOG: Refreshed zone summaries of {refreshed}.')
+        return refreshed
+
+    def season_table(self, season):
+        """Returns a season's zone table (one row per player & zone, league rows under PLAYER_ID 0), or None if it wasn't built."""
+        table_df = self._tables.get(season)
+        if table_df is None:
+            if season not in self.index:
+                return None
+            table_df = pd.read_csv(self._path(season))
+            with self._lock:
+                self._tables[season] = table_df
+        return table_df
+
+    def zone_table(self, player_ids, seasons):
+        """Returns the combined zones of one or more players (i.e. a lineup) over the given seasons, compared with the league.
+
+        Seasons that haven't been summarized are skipped; returns None if none of them has been.
+        """
+
+        tables = [table_df for table_df in (self.season_table(season) for season in seasons) if table_df is not None]
+        if not tables:
+            return None
+        seasons_df = pd.concat(tables, ignore_index=True)
+        player_ids = [int(player_id) for player_id in player_ids]
+
+        def zone_counts(rows_df):
+            return rows_df.groupby('ZONE')[COUNT_COLS].sum().reindex(ZONES, fill_value=0).rename_axis('ZONE').reset_index()
+
+        zones_df = add_rates(zone_counts(seasons_df[seasons_df['PLAYER_ID'].isin(player_ids)]),
+                             zone_counts(seasons_df[seasons_df['PLAYER_ID'] == LEAGUE_ID]))
+        return zones_df[['ZONE'] + COUNT_COLS + ['FG_PCT', 'FREQ', 'LG_FG_PCT', 'LG_FREQ', 'FG_PCT_DELTA', 'FREQ_DELTA']]
+
+    def player_zones(self, player_id, seasons):
+        return self.zone_table([player_id], seasons)
+
+def main():
+    """Refreshes the zone tables of every archived season that changed since the last run."""
+
+    parser = argparse.ArgumentParser(description='Materializes per-player, per-season shot-zone tables from the shot archive.')
+    parser.add_argument('--archive', default=ARCHIVE_DIR, help='shot archive directory')
+    parser.add_argument('--summaries', default=SUMMARY_DIR, help='zone summary directory')
+    parser.add_argument('--seasons', nargs='+', help='seasons to refresh (default: every archived season)')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    summaries = ZoneSummaries(ShotArchive(args.archive), args.summaries)
+    refreshed = summaries.refresh(args.seasons)
+    logging.info(f'LOG: {len(refreshed)} seasons refreshed; {len(summaries.seasons())} summarized in {args.summaries}.')
+
+if __name__ == '__main__':
+    main()